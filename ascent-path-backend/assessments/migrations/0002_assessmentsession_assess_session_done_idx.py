@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assessmentsession',
+            index=models.Index(condition=models.Q(('status', 'completed')), fields=['user', '-started_at'], name='assess_session_done_idx'),
+        ),
+    ]
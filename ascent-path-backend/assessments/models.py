@@ -39,6 +39,9 @@ class AssessmentSession(models.Model):
 
     class Meta:
         ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['user', '-started_at'], condition=models.Q(status='completed'), name='assess_session_done_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} — {self.skill} ({self.score}%)"
@@ -1,3 +1,36 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from profile_app.models import UserSkill
+from .models import AssessmentQuestion, AssessmentSession
+
+User = get_user_model()
+
+
+class SubmitAssessmentTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='ada', email='ada@example.com', password='pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_verification_changes_profile_etag(self):
+        UserSkill.objects.create(user=self.user, skill_name='Python')
+        before = self.client.get('/api/profile/snapshot/')
+        etag = before['ETag']
+
+        question = AssessmentQuestion.objects.create(
+            skill='Python', level='beginner', question_text='?', options=['a', 'b', 'c', 'd'], correct_answer_index=1,
+        )
+        session = AssessmentSession.objects.create(user=self.user, skill='Python', level='beginner', total_questions=1)
+        session.questions.add(question)
+        res = self.client.post('/api/assessment/submit/', {
+            'session_id': session.id, 'answers': [{'question_id': question.id, 'selected_option': 1}],
+        }, format='json')
+        self.assertEqual(res.status_code, 200)
+
+        after = self.client.get('/api/profile/snapshot/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after['ETag'], etag)
+        self.assertTrue(after.data['skills'][0]['is_verified'])
+        self.assertEqual(after.data['skills'][0]['verified_score'], 100.0)
@@ -1,5 +1,6 @@
 import json
 import random
+from django.db.models.functions import Lower
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
@@ -13,10 +14,15 @@ from .serializers import (
     SubmitAssessmentSerializer,
 )
 from profile_app.models import UserSkill
+from taxonomy import index as skill_index
+from core import admission, instrumentation
 
 # ── Groq client (lazy init) ───────────────────────────────────────────────────
 
 def get_groq_client():
+    from core import fake_llm
+    if fake_llm.ENABLED:
+        return fake_llm.Groq()
     from groq import Groq
     return Groq(api_key=config('GROQ_API_KEY'))
 
@@ -51,12 +57,13 @@ Rules:
 - All code snippets must be valid {skill} code
 - correct_index is 0-3 matching the options array"""
 
-    response = client.chat.completions.create(
-        model='llama-3.3-70b-versatile',
-        messages=[{'role': 'user', 'content': prompt}],
-        temperature=0.7,
-        max_tokens=2000,
-    )
+    with admission.slot('groq'), instrumentation.track('groq'):
+        response = client.chat.completions.create(
+            model='llama-3.3-70b-versatile',
+            messages=[{'role': 'user', 'content': prompt}],
+            temperature=0.7,
+            max_tokens=2000,
+        )
 
     raw = response.choices[0].message.content.strip()
     # Strip markdown code fences if present
@@ -98,7 +105,11 @@ FALLBACK_QUESTIONS = {
 def get_or_create_questions(skill: str, level: str, count: int = 10) -> list:
     """Get questions from DB cache. Generate via Groq if not enough."""
     skill_key = skill.lower().strip()
-    existing = list(AssessmentQuestion.objects.filter(skill__iexact=skill, level=level))
+    # Questions stored under any alias of the same skill ("React.js" / "react") are shared
+    existing = list(
+        AssessmentQuestion.objects.annotate(skill_lower=Lower('skill'))
+        .filter(skill_lower__in=skill_index.variants(skill) + [skill_key], level=level)
+    )
 
     if len(existing) >= count:
         return random.sample(existing, count)
@@ -145,6 +156,7 @@ def get_or_create_questions(skill: str, level: str, count: int = 10) -> list:
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@admission.admit('assessment')
 def generate_assessment(request):
     """
     Generate an assessment session for a skill.
@@ -261,6 +273,7 @@ def submit_assessment(request):
         verified_score=score,
         is_verified=True,
         self_reported_level=verified_level,
+        updated_at=timezone.now(),  # .update() skips auto_now; the profile ETag depends on it
     )
     # If UserSkill didn't exist yet, create it
     if not updated:
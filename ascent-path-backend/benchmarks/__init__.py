@@ -0,0 +1,19 @@
+"""
+API benchmark suite.
+
+    python manage.py bench_seed --scale medium                    # synthetic data, bench_* / bench-*
+    python manage.py fake_remoteok --latency 0.3 &                 # job feed
+    python manage.py fake_github --latency 0.2 --limit 100000 &    # repo API
+    LLM_PROVIDER=fake LLM_FAKE_LATENCY=0.8 \
+    REMOTEOK_URL=http://127.0.0.1:8765/api GITHUB_API_URL=http://127.0.0.1:8766 \
+        python manage.py runserver --noreload &
+    python manage.py bench_api --concurrency 16 --duration 60 --output bench-$(git rev-parse --short HEAD).json
+    python manage.py bench_api ... --compare bench-<older commit>.json
+
+Scenarios live in benchmarks.scenarios, the load loop and report maths in benchmarks.runner,
+and the data generator in benchmarks.seed. `bench_indexes` reuses the same data for
+query-plan comparisons; `profile_imports [setup|wsgi|urls]` reports startup import time;
+`bench_gunicorn` boots each server configuration (core.gunicorn_conf) and runs the
+scenarios against it; `stress_db_writes --compare` runs concurrent writers against SQLite
+with and without the core.db tuning.
+"""
@@ -0,0 +1,85 @@
+import json
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks import runner
+from benchmarks.scenarios import SCENARIOS, load_users
+
+
+class Command(BaseCommand):
+    help = (
+        'Drive benchmark scenarios over HTTP against a running server and report '
+        'p50/p95/p99 and throughput. Seed first with bench_seed; run the server with '
+        'LLM_PROVIDER=fake and REMOTEOK_URL / GITHUB_API_URL pointed at fake_remoteok / fake_github.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('scenarios', nargs='*', help=f"Any of: {', '.join(SCENARIOS)} (default: all)")
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--duration', type=float, default=30.0, help='Seconds per scenario')
+        parser.add_argument('--iterations', type=int, help='Fixed iterations per scenario instead of --duration')
+        parser.add_argument('--warmup', type=int, default=5, help='Unrecorded iterations before measuring')
+        parser.add_argument('--users', type=int, default=200, help='Bench users to rotate through')
+        parser.add_argument('--output', help='Write the report as JSON')
+        parser.add_argument('--compare', help='Baseline JSON report to diff against')
+
+    def handle(self, *args, **options):
+        names = options['scenarios'] or list(SCENARIOS)
+        unknown = set(names) - set(SCENARIOS)
+        if unknown:
+            raise CommandError(f"Unknown scenario(s): {', '.join(sorted(unknown))}")
+        users = load_users(options['users'])
+        if not users:
+            raise CommandError('No bench users with enrollments — run `manage.py bench_seed` first.')
+
+        results = {}
+        for name in names:
+            self.stdout.write(self.style.MIGRATE_HEADING(f'\n== {name} =='))
+            report = runner.run(
+                SCENARIOS[name], users, options['base_url'], concurrency=options['concurrency'],
+                duration=options['duration'], iterations=options['iterations'], warmup=options['warmup'],
+            )
+            results[name] = report
+            self.print_report(report)
+
+        document = {
+            'commit': runner.current_commit(),
+            'created': datetime.now(timezone.utc).isoformat(),
+            'base_url': options['base_url'],
+            'concurrency': options['concurrency'],
+            'scenarios': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(document, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"\nReport written to {options['output']}"))
+        if options['compare']:
+            with open(options['compare']) as f:
+                baseline = json.load(f)
+            self.print_comparison(baseline, document)
+
+    def print_report(self, report):
+        self.stdout.write(
+            f"{report['iterations']} iterations ({report['failed_iterations']} failed) in {report['wall_s']}s — "
+            f"{report['rps']} req/s, {report['iterations_per_s']} iterations/s at concurrency {report['concurrency']}"
+        )
+        self.stdout.write(f"{'endpoint':<22} {'count':>7} {'errors':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'req/s':>8}")
+        for label, s in report['endpoints'].items():
+            self.stdout.write(
+                f"{label:<22} {s['count']:>7} {s['errors']:>6} {s['p50_ms']:>9.1f} {s['p95_ms']:>9.1f} "
+                f"{s['p99_ms']:>9.1f} {s['rps']:>8.1f}"
+            )
+
+    def print_comparison(self, baseline, document):
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"\n== {baseline.get('commit') or 'baseline'} → {document['commit'] or 'current'} =="
+        ))
+        self.stdout.write(f"{'scenario':<16} {'endpoint':<22} {'metric':<7} {'before':>9} {'after':>9} {'change':>8}")
+        for name, label, metric, old, new, change in runner.compare(baseline['scenarios'], document['scenarios']):
+            # Latency going up and throughput going down are both regressions
+            worse = change is not None and (change < 0 if metric == 'rps' else change > 0)
+            line = f"{name:<16} {label:<22} {metric:<7} {old:>9.1f} {new:>9.1f} " + (
+                f'{change:>+7.1f}%' if change is not None else f"{'n/a':>8}")
+            self.stdout.write(self.style.WARNING(line) if worse and abs(change) >= 10 else line)
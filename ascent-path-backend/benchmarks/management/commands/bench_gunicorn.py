@@ -0,0 +1,189 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks import runner
+from benchmarks.scenarios import SCENARIOS, load_users
+
+# name → (gunicorn arguments, environment overrides)
+VARIANTS = {
+    # What the Procfile used to run: one sync worker, no config
+    'bare': (['core.wsgi:application'], {}),
+    'sync': (['-c', 'python:core.gunicorn_conf', 'core.wsgi:application'],
+             {'GUNICORN_WORKER_CLASS': 'sync', 'GUNICORN_PRELOAD': 'false'}),
+    'gthread': (['-c', 'python:core.gunicorn_conf', 'core.wsgi:application'],
+                {'GUNICORN_WORKER_CLASS': 'gthread', 'GUNICORN_PRELOAD': 'false'}),
+    'gthread-preload': (['-c', 'python:core.gunicorn_conf', 'core.wsgi:application'],
+                        {'GUNICORN_WORKER_CLASS': 'gthread', 'GUNICORN_PRELOAD': 'true'}),
+}
+READY_PATH = '/api/roles/roadmaps/'
+FAKE_REMOTEOK_PORT = 8765
+FAKE_GITHUB_PORT = 8766
+
+
+def _children(pid):
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children') as f:
+            return [int(c) for c in f.read().split()]
+    except OSError:
+        return []
+
+
+def _pss_mb(pid):
+    """Proportional set size of a process — shared (copy-on-write) pages are split between sharers."""
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+def tree_memory_mb(pid):
+    """PSS of the gunicorn master plus its workers, or None where /proc isn't available."""
+    values = [_pss_mb(p) for p in [pid] + _children(pid)]
+    return round(sum(values), 1) if values and None not in values else None
+
+
+class Command(BaseCommand):
+    help = (
+        'Start gunicorn under each configuration in turn, with fake LLM/job/GitHub providers, and '
+        'compare boot time, memory and bench_api throughput/latency. Seed with bench_seed first.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('variants', nargs='*', help=f"Any of: {', '.join(VARIANTS)} (default: all)")
+        parser.add_argument('--scenarios', default='dashboard,roadmap_detail,interview',
+                            help='Comma-separated scenarios to run against each variant')
+        parser.add_argument('--port', type=int, default=8100)
+        parser.add_argument('--workers', type=int, help='Fix WEB_CONCURRENCY instead of deriving it')
+        parser.add_argument('--concurrency', type=int, default=32)
+        parser.add_argument('--duration', type=float, default=30.0)
+        parser.add_argument('--warmup', type=int, default=5)
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--llm-latency', type=float, default=0.8, help='Seconds per fake LLM call')
+        parser.add_argument('--llm-concurrency', type=int, default=64,
+                            help='Global LLM slots (core.admission) — high, so the server config is the bottleneck')
+        parser.add_argument('--feed-latency', type=float, default=0.3, help='Seconds per fake RemoteOK/GitHub call')
+        parser.add_argument('--no-fakes', action='store_true', help="Don't start fake_remoteok/fake_github")
+        parser.add_argument('--output', help='Write the results as JSON')
+
+    def handle(self, *args, **options):
+        names = options['variants'] or list(VARIANTS)
+        scenarios = [s.strip() for s in options['scenarios'].split(',') if s.strip()]
+        unknown = (set(names) - set(VARIANTS)) | (set(scenarios) - set(SCENARIOS))
+        if unknown:
+            raise CommandError(f"Unknown variant/scenario: {', '.join(sorted(unknown))}")
+        users = load_users(options['users'])
+        if not users:
+            raise CommandError('No bench users with enrollments — run `manage.py bench_seed` first.')
+
+        fakes = [] if options['no_fakes'] else self.start_fakes(options['feed_latency'])
+        results = {}
+        try:
+            for name in names:
+                self.stdout.write(self.style.MIGRATE_HEADING(f'\n== {name} =='))
+                results[name] = self.bench_variant(name, scenarios, users, options)
+        finally:
+            for proc in fakes:
+                proc.terminate()
+
+        self.print_summary(results, scenarios)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump({
+                    'commit': runner.current_commit(),
+                    'created': datetime.now(timezone.utc).isoformat(),
+                    'concurrency': options['concurrency'],
+                    'llm_latency': options['llm_latency'],
+                    'variants': results,
+                }, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"\nResults written to {options['output']}"))
+
+    def start_fakes(self, latency):
+        manage = [sys.executable, str(settings.BASE_DIR / 'manage.py')]
+        return [
+            subprocess.Popen(manage + ['fake_remoteok', '--port', str(FAKE_REMOTEOK_PORT), '--latency', str(latency)],
+                             stdout=subprocess.DEVNULL),
+            subprocess.Popen(manage + ['fake_github', '--port', str(FAKE_GITHUB_PORT), '--latency', str(latency),
+                                       '--limit', '1000000'], stdout=subprocess.DEVNULL),
+        ]
+
+    def bench_variant(self, name, scenarios, users, options):
+        args, overrides = VARIANTS[name]
+        env = {
+            **os.environ,
+            'PORT': str(options['port']),
+            'LLM_PROVIDER': 'fake',
+            'LLM_FAKE_LATENCY': str(options['llm_latency']),
+            'GEMINI_MAX_CONCURRENCY': str(options['llm_concurrency']),
+            'GROQ_MAX_CONCURRENCY': str(options['llm_concurrency']),
+            **overrides,
+        }
+        if not options['no_fakes']:
+            env['REMOTEOK_URL'] = f'http://127.0.0.1:{FAKE_REMOTEOK_PORT}/api'
+            env['GITHUB_API_URL'] = f'http://127.0.0.1:{FAKE_GITHUB_PORT}'
+        if options['workers']:
+            env['WEB_CONCURRENCY'] = str(options['workers'])
+        if name == 'bare':
+            args = args + ['--bind', f"127.0.0.1:{options['port']}"]
+
+        base_url = f"http://127.0.0.1:{options['port']}"
+        started = time.perf_counter()
+        server = subprocess.Popen([sys.executable, '-m', 'gunicorn'] + args, cwd=settings.BASE_DIR, env=env,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            boot_s = self.wait_ready(server, base_url, started)
+            result = {'boot_s': round(boot_s, 2), 'memory_mb': tree_memory_mb(server.pid), 'scenarios': {}}
+            for scenario in scenarios:
+                report = runner.run(SCENARIOS[scenario], users, base_url, concurrency=options['concurrency'],
+                                    duration=options['duration'], warmup=options['warmup'])
+                result['scenarios'][scenario] = report
+                self.stdout.write(
+                    f"{scenario:<16} {report['rps']:>8.1f} req/s  {report['failed_iterations']}/{report['iterations']} failed"
+                )
+            result['memory_after_mb'] = tree_memory_mb(server.pid)
+            return result
+        finally:
+            server.send_signal(signal.SIGTERM)
+            try:
+                server.wait(timeout=60)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+    def wait_ready(self, server, base_url, started, timeout=120):
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise CommandError(f'gunicorn exited with {server.returncode} — run it by hand to see why')
+            try:
+                if requests.get(base_url + READY_PATH, timeout=2).status_code == 200:
+                    return time.perf_counter() - started
+            except requests.RequestException:
+                pass
+            time.sleep(0.2)
+        raise CommandError(f'gunicorn not ready after {timeout}s')
+
+    def print_summary(self, results, scenarios):
+        self.stdout.write(self.style.MIGRATE_HEADING('\n== Summary =='))
+        header = f"{'variant':<18} {'boot s':>7} {'PSS MB':>8}"
+        for scenario in scenarios:
+            header += f" {scenario[:14] + ' rps':>19} {'p95':>8} {'p99':>8}"
+        self.stdout.write(header)
+        for name, result in results.items():
+            memory = result['memory_after_mb']
+            line = f"{name:<18} {result['boot_s']:>7.2f} {memory if memory is not None else 'n/a':>8}"
+            for scenario in scenarios:
+                report = result['scenarios'][scenario]
+                slowest = max(report['endpoints'].values(), key=lambda e: e['p95_ms'], default=None)
+                line += f" {report['rps']:>19.1f} {slowest['p95_ms'] if slowest else 0:>8.0f} {slowest['p99_ms'] if slowest else 0:>8.0f}"
+            self.stdout.write(line)
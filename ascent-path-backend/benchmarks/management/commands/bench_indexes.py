@@ -0,0 +1,123 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from assessments.models import AssessmentSession
+from benchmarks import seed
+from interviews.models import InterviewSession
+from profile_app.models import UserSkill
+from roles.models import Roadmap, UserNodeProgress
+
+# The indexes added for the hot queries below, as (model, index name)
+BENCH_INDEXES = [
+    (UserNodeProgress, 'roles_progress_activity_idx'),
+    (AssessmentSession, 'assess_session_done_idx'),
+    (InterviewSession, 'interview_active_idx'),
+    (UserSkill, 'profile_skill_verified_idx'),
+]
+
+
+def hot_queries(user_id, roadmap_id):
+    """The per-request query shapes of role_detail, dashboard_stats, assessments and interviews."""
+    return {
+        'progress (user, roadmap, done)': UserNodeProgress.objects.filter(
+            user_id=user_id, node__roadmap_id=roadmap_id, is_completed=True).values_list('node_id', flat=True),
+        'activity (user, done, date)': UserNodeProgress.objects.filter(
+            user_id=user_id, is_completed=True).exclude(completed_at=None).values_list('completed_at', flat=True),
+        'assessments (user, completed)': AssessmentSession.objects.filter(user_id=user_id, status='completed')[:20],
+        'interview (user, active)': InterviewSession.objects.filter(
+            user_id=user_id, status='active').order_by('-created_at')[:1],
+        'skills (user, verified)': UserSkill.objects.filter(
+            user_id=user_id, is_verified=True).order_by('-verified_score')[:6],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed realistic volumes (bench_* users) and compare hot-query plans and latency '
+        'with the composite/partial indexes dropped vs. present.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100_000)
+        parser.add_argument('--roadmaps', type=int, default=20)
+        parser.add_argument('--nodes', type=int, default=15, help='Nodes per roadmap')
+        parser.add_argument('--progress', type=int, default=30, help='Progress rows per user')
+        parser.add_argument('--skills', type=int, default=8, help='Skills per user')
+        parser.add_argument('--sessions', type=int, default=4, help='Assessment and interview sessions per user')
+        parser.add_argument('--samples', type=int, default=200, help='Users sampled per query')
+        parser.add_argument('--batch', type=int, default=5000)
+        parser.add_argument('--skip-seed', action='store_true', help='Reuse previously seeded bench data')
+        parser.add_argument('--cleanup', action='store_true', help='Delete bench data and exit')
+
+    def handle(self, *args, **options):
+        if options['cleanup']:
+            deleted = seed.cleanup()
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} bench rows'))
+            return
+        if not options['skip_seed']:
+            seed.seed({
+                'users': options['users'], 'roadmaps': options['roadmaps'], 'nodes': options['nodes'],
+                'progress': options['progress'], 'skills': options['skills'], 'sessions': options['sessions'],
+                'interview_questions': False,
+            }, batch=options['batch'], log=self.stdout.write)
+
+        user_ids = seed.user_ids()
+        roadmap_ids = list(Roadmap.objects.filter(slug__startswith=seed.ROADMAP_PREFIX).values_list('id', flat=True))
+        if not user_ids or not roadmap_ids:
+            self.stderr.write('No bench data — run without --skip-seed first.')
+            return
+        rng = random.Random(1)
+        sample = [(rng.choice(user_ids), rng.choice(roadmap_ids)) for _ in range(options['samples'])]
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'\n== Without indexes ({connection.vendor}) =='))
+        self.set_indexes(present=False)
+        before = self.measure(sample)
+        self.stdout.write(self.style.MIGRATE_HEADING('\n== With indexes =='))
+        self.set_indexes(present=True)
+        after = self.measure(sample)
+
+        self.stdout.write(self.style.MIGRATE_HEADING('\n== Summary (ms) =='))
+        self.stdout.write(f"{'query':<32} {'p50 before':>11} {'p50 after':>10} {'p95 before':>11} {'p95 after':>10}")
+        for name in before:
+            b, a = before[name], after[name]
+            self.stdout.write(f'{name:<32} {b[0]:>11.3f} {a[0]:>10.3f} {b[1]:>11.3f} {a[1]:>10.3f}')
+
+    # ── Measuring ────────────────────────────────────────────────────────────
+
+    def set_indexes(self, present):
+        existing = {
+            name
+            for model in {m for m, _ in BENCH_INDEXES}
+            for name, info in connection.introspection.get_constraints(connection.cursor(), model._meta.db_table).items()
+            if info['index']
+        }
+        with connection.schema_editor() as editor:
+            for model, name in BENCH_INDEXES:
+                index = next(i for i in model._meta.indexes if i.name == name)
+                if present and name not in existing:
+                    editor.add_index(model, index)
+                elif not present and name in existing:
+                    editor.remove_index(model, index)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')  # refresh planner statistics for both backends
+
+    def measure(self, sample):
+        results = {}
+        user_id, roadmap_id = sample[0]
+        for name, qs in hot_queries(user_id, roadmap_id).items():
+            self.stdout.write(f'\n-- {name}\n{qs.explain()}')
+
+        for name in hot_queries(*sample[0]):
+            timings = []
+            for uid, rid in sample:
+                qs = hot_queries(uid, rid)[name]
+                started = time.perf_counter()
+                list(qs)
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            results[name] = (statistics.median(timings), timings[int(len(timings) * 0.95) - 1])
+        return results
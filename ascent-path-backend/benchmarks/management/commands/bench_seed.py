@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from benchmarks import seed
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed synthetic users, roadmaps, progress, question bank and sessions for bench_api. '
+        'Start from a --scale preset and override individual counts.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=sorted(seed.SCALES), default='small')
+        for name, default in seed.DEFAULTS.items():
+            if isinstance(default, int) and not isinstance(default, bool):
+                parser.add_argument(f"--{name.replace('_', '-')}", type=int, dest=name,
+                                    help=f'default {default} unless the scale preset sets it')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed — same seed, same data')
+        parser.add_argument('--batch', type=int, default=5000)
+        parser.add_argument('--reset', action='store_true', help='Delete existing bench data first')
+        parser.add_argument('--cleanup', action='store_true', help='Delete bench data and exit')
+
+    def handle(self, *args, **options):
+        if options['cleanup'] or options['reset']:
+            deleted = seed.cleanup()
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} bench rows'))
+            if options['cleanup']:
+                return
+        elif seed.user_ids():
+            self.stderr.write('Bench data already exists — pass --reset to replace it.')
+            return
+
+        counts = dict(seed.SCALES[options['scale']])
+        counts.update({name: options[name] for name in seed.DEFAULTS if options.get(name) is not None})
+        seed.seed(counts, batch=options['batch'], seed_value=options['seed'], log=self.stdout.write)
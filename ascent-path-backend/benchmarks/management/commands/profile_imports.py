@@ -0,0 +1,77 @@
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# What each kind of startup imports, run in a fresh interpreter
+TARGETS = {
+    'setup': 'django.setup()',  # every manage.py command
+    'wsgi': 'from core.wsgi import application',  # gunicorn worker boot
+    'urls': 'django.setup()\nfrom django.urls import get_resolver\nget_resolver().url_patterns',  # first request: every view
+}
+CHILD = "import os\nimport django\nos.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')\n{code}\n"
+LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def parse_importtime(stderr: str) -> list:
+    """(module, self_us, cumulative_us, depth) per `-X importtime` line."""
+    rows = []
+    for line in stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure interpreter startup for a target (setup, wsgi, urls) in a fresh process and '
+        'report import time per module and per top-level package.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('target', nargs='?', choices=sorted(TARGETS), default='urls')
+        parser.add_argument('--runs', type=int, default=3, help='Timed runs (median wall time is reported)')
+        parser.add_argument('--top', type=int, default=25, help='Modules/packages to list')
+
+    def _run(self, code, importtime=False):
+        args = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', CHILD.format(code=code)]
+        started = time.perf_counter()
+        proc = subprocess.run(args, cwd=settings.BASE_DIR, env=os.environ.copy(), capture_output=True, text=True)
+        elapsed = time.perf_counter() - started
+        if proc.returncode != 0:
+            raise CommandError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'child failed')
+        return elapsed, proc.stderr
+
+    def handle(self, *args, **options):
+        code = TARGETS[options['target']]
+        walls = [self._run(code)[0] for _ in range(max(1, options['runs']))]
+        _, stderr = self._run(code, importtime=True)
+        rows = parse_importtime(stderr)
+
+        total_us = sum(cum for _, _, cum, depth in rows if depth == 0)
+        by_package = defaultdict(int)
+        for module, self_us, _, _ in rows:
+            by_package[module.split('.')[0]] += self_us
+
+        top = options['top']
+        self.stdout.write(self.style.MIGRATE_HEADING(f"== {options['target']} startup =="))
+        self.stdout.write(
+            f'wall time (median of {len(walls)}): {statistics.median(walls) * 1000:.0f} ms — '
+            f'imports: {total_us / 1000:.0f} ms across {len(rows)} modules'
+        )
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'\n-- top {top} packages (self time, ms)'))
+        for package, us in sorted(by_package.items(), key=lambda kv: -kv[1])[:top]:
+            self.stdout.write(f'{us / 1000:>9.1f}  {us / total_us * 100 if total_us else 0:>5.1f}%  {package}')
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'\n-- top {top} modules (cumulative, ms)'))
+        for module, self_us, cumulative_us, depth in sorted(rows, key=lambda r: -r[2])[:top]:
+            self.stdout.write(f'{cumulative_us / 1000:>9.1f}  {self_us / 1000:>7.1f} self  {module}')
@@ -0,0 +1,220 @@
+import json
+import os
+import random
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections
+from django.utils import timezone
+
+from benchmarks import runner, seed
+
+STRESS_SKILL = 'bench-stress'
+
+
+def _targets(limit):
+    """(user_id, [node ids]) for up to `limit` bench enrollments."""
+    from roles.models import Enrollment, SkillNode
+
+    nodes = {}
+    for roadmap_id, node_id in SkillNode.objects.filter(
+        roadmap__slug__startswith=seed.ROADMAP_PREFIX,
+    ).values_list('roadmap_id', 'id'):
+        nodes.setdefault(roadmap_id, []).append(node_id)
+    enrollments = Enrollment.objects.filter(user_id__in=seed.user_ids()).values_list('user_id', 'roadmap_id')[:limit]
+    return [(user_id, nodes[roadmap_id]) for user_id, roadmap_id in enrollments if nodes.get(roadmap_id)]
+
+
+def write_once(rng, targets):
+    """One write from the app's hot paths: a node completion, a re-opened node, or a new assessment session."""
+    from assessments.models import AssessmentSession
+    from roles import counters
+    from roles.models import UserNodeProgress
+
+    user_id, node_ids = rng.choice(targets)
+    roll = rng.random()
+    if roll < 0.6:
+        # Read-then-write transaction — the shape that hits lock upgrades under DEFERRED
+        counters.complete_nodes(user_id, {rng.choice(node_ids): timezone.now()})
+    elif roll < 0.8:
+        UserNodeProgress.objects.filter(user_id=user_id, node_id=rng.choice(node_ids)).update(
+            is_completed=False, completed_at=None,
+        )
+    else:
+        AssessmentSession.objects.create(user_id=user_id, skill=STRESS_SKILL, level='beginner', total_questions=0)
+
+
+class Command(BaseCommand):
+    help = (
+        'Hammer the database with concurrent writers (several processes × threads, like gunicorn '
+        'workers) and report throughput, latency and "database is locked" errors. With --compare on '
+        'SQLite, runs once with the old settings (SQLITE_TUNING=false, rollback journal) and once '
+        'with core.db tuning. Seed with bench_seed first.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=4)
+        parser.add_argument('--threads', type=int, default=4, help='Writer threads per process')
+        parser.add_argument('--duration', type=float, default=15.0, help='Seconds per run')
+        parser.add_argument('--targets', type=int, default=500, help='Bench enrollments to write against')
+        parser.add_argument('--untuned', action='store_true', help='Only run with the old SQLite settings')
+        parser.add_argument('--compare', action='store_true', help='Run untuned, then tuned (SQLite only)')
+        parser.add_argument('--output', help='Write the results as JSON')
+        # Internal: one writer process, started by the parent
+        parser.add_argument('--worker', action='store_true', help='(internal)')
+        parser.add_argument('--start-at', type=float, help='(internal)')
+        parser.add_argument('--seed', type=int, default=0, help='(internal)')
+
+    def handle(self, *args, **options):
+        if options['worker']:
+            return self.worker(options)
+
+        is_sqlite = connection.vendor == 'sqlite'
+        if (options['compare'] or options['untuned']) and not is_sqlite:
+            raise CommandError('--compare/--untuned only apply to SQLite (DEBUG=True).')
+        if not _targets(1):
+            raise CommandError('No bench enrollments — run `manage.py bench_seed` first.')
+
+        modes = ['untuned', 'tuned'] if options['compare'] else ['untuned' if options['untuned'] else 'tuned']
+        results = {}
+        try:
+            for mode in modes:
+                self.stdout.write(self.style.MIGRATE_HEADING(f'\n== {mode} =='))
+                if is_sqlite:
+                    self.set_journal_mode('WAL' if mode == 'tuned' else 'DELETE')
+                results[mode] = self.run_writers(mode, options)
+                self.print_result(results[mode])
+        finally:
+            self.repair()
+
+        if len(results) > 1:
+            self.print_comparison(results)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump({
+                    'commit': runner.current_commit(),
+                    'created': datetime.now(dt_timezone.utc).isoformat(),
+                    'vendor': connection.vendor,
+                    'processes': options['processes'],
+                    'threads': options['threads'],
+                    'runs': results,
+                }, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"\nResults written to {options['output']}"))
+
+    def set_journal_mode(self, mode):
+        # journal_mode is stored in the file, so the untuned run must switch WAL off again
+        connections.close_all()
+        raw = sqlite3.connect(settings.DATABASES['default']['NAME'], timeout=30)
+        try:
+            raw.execute(f'PRAGMA journal_mode={mode}')
+        finally:
+            raw.close()
+
+    def run_writers(self, mode, options):
+        env = {**os.environ, 'SQLITE_TUNING': 'false' if mode == 'untuned' else 'true'}
+        start_at = time.time() + 3  # every process connects and loads targets before the clock starts
+        command = [
+            sys.executable, str(settings.BASE_DIR / 'manage.py'), 'stress_db_writes', '--worker',
+            '--threads', str(options['threads']), '--duration', str(options['duration']),
+            '--targets', str(options['targets']), '--start-at', str(start_at),
+        ]
+        procs = [
+            subprocess.Popen(command + ['--seed', str(i)], cwd=settings.BASE_DIR, env=env,
+                             stdout=subprocess.PIPE, text=True)
+            for i in range(options['processes'])
+        ]
+        latencies, locked, errors, failed = [], 0, 0, 0
+        for proc in procs:
+            out, _ = proc.communicate()
+            if proc.returncode != 0:
+                failed += 1
+                continue
+            report = json.loads(out.strip().splitlines()[-1])
+            latencies.extend(report['latencies_ms'])
+            locked += report['locked']
+            errors += report['errors']
+        if failed == len(procs):
+            raise CommandError('Every writer process failed — run one with --worker to see why')
+
+        latencies.sort()
+        attempts = len(latencies) + locked + errors
+        return {
+            'writes': len(latencies),
+            'writes_per_s': round(len(latencies) / options['duration'], 1),
+            'locked': locked,
+            'locked_pct': round(100 * locked / attempts, 2) if attempts else 0.0,
+            'other_errors': errors,
+            'failed_processes': failed,
+            'p50_ms': round(runner.percentile(latencies, 50), 1),
+            'p95_ms': round(runner.percentile(latencies, 95), 1),
+            'p99_ms': round(runner.percentile(latencies, 99), 1),
+            'max_ms': round(latencies[-1], 1) if latencies else 0.0,
+        }
+
+    def worker(self, options):
+        targets = _targets(options['targets'])
+        lock = threading.Lock()
+        result = {'latencies_ms': [], 'locked': 0, 'errors': 0}
+        start_at, duration = options['start_at'] or time.time(), options['duration']
+
+        def writer(index):
+            rng = random.Random(options['seed'] * 1000 + index)
+            latencies, locked, errors = [], 0, 0
+            time.sleep(max(0.0, start_at - time.time()))
+            try:
+                while time.time() < start_at + duration:
+                    started = time.perf_counter()
+                    try:
+                        write_once(rng, targets)
+                    except OperationalError as e:
+                        if 'locked' in str(e):
+                            locked += 1
+                        else:
+                            errors += 1
+                        continue
+                    except Exception:
+                        errors += 1
+                        continue
+                    latencies.append(round((time.perf_counter() - started) * 1000, 2))
+            finally:
+                connections.close_all()  # this thread's connections (back to the pool on Postgres)
+            with lock:
+                result['latencies_ms'].extend(latencies)
+                result['locked'] += locked
+                result['errors'] += errors
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(options['threads'])]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.stdout.write(json.dumps(result))
+
+    def repair(self):
+        """Drop the stress sessions and recount progress, so the bench data stays consistent."""
+        from assessments.models import AssessmentSession
+        from roles import counters
+
+        AssessmentSession.objects.filter(skill=STRESS_SKILL).delete()
+        counters.refresh_all()
+
+    def print_result(self, r):
+        self.stdout.write(
+            f"{r['writes']} writes ({r['writes_per_s']}/s), {r['locked']} locked ({r['locked_pct']}%), "
+            f"{r['other_errors']} other errors — p50 {r['p50_ms']}ms, p95 {r['p95_ms']}ms, "
+            f"p99 {r['p99_ms']}ms, max {r['max_ms']}ms"
+        )
+        if r['failed_processes']:
+            self.stdout.write(self.style.WARNING(f"{r['failed_processes']} writer process(es) failed"))
+
+    def print_comparison(self, results):
+        self.stdout.write(self.style.MIGRATE_HEADING('\n== untuned → tuned =='))
+        self.stdout.write(f"{'metric':<12} {'untuned':>10} {'tuned':>10}")
+        for metric in ('writes_per_s', 'locked', 'locked_pct', 'p50_ms', 'p95_ms', 'p99_ms'):
+            self.stdout.write(f"{metric:<12} {results['untuned'][metric]:>10} {results['tuned'][metric]:>10}")
@@ -0,0 +1,143 @@
+"""
+Closed-loop load runner and reporting.
+
+Each worker thread plays one bench user at a time and repeats a scenario until the
+duration or iteration count runs out. Latencies are kept per request label; the report
+gives p50/p95/p99 per label and throughput (requests and scenario iterations per second)
+for the run. Reports are plain dicts so they can be written as JSON and compared later.
+"""
+import itertools
+import math
+import subprocess
+import threading
+import time
+
+from .scenarios import Client, ScenarioError
+
+
+def percentile(ordered, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, min(len(ordered), math.ceil(p / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}  # label → [ms, ...]
+        self.errors = {}  # label → count
+        self.enabled = True
+
+    def __call__(self, label, ms, ok):
+        if not self.enabled:
+            return
+        with self._lock:
+            if ok:
+                self.samples.setdefault(label, []).append(ms)
+            else:
+                self.errors[label] = self.errors.get(label, 0) + 1
+
+
+def run(scenario, users, base_url, concurrency=8, duration=30.0, iterations=None, warmup=0):
+    """Run `scenario` with `concurrency` workers; returns the report dict."""
+    recorder = Recorder()
+    user_cycle = itertools.cycle(users)
+    cycle_lock = threading.Lock()
+    counts = {'iterations': 0, 'failed': 0}
+    counts_lock = threading.Lock()
+
+    def next_user():
+        with cycle_lock:
+            return next(user_cycle)
+
+    def play():
+        user = next_user()
+        try:
+            scenario(Client(base_url, user, recorder), user)
+            return True
+        except ScenarioError:
+            return False
+
+    recorder.enabled = False
+    for _ in range(warmup):
+        play()
+    recorder.enabled = True
+
+    deadline = time.perf_counter() + duration if iterations is None else None
+    remaining = itertools.count() if iterations is None else iter(range(iterations))
+    remaining_lock = threading.Lock()
+
+    def worker():
+        while True:
+            with remaining_lock:
+                if next(remaining, None) is None:
+                    return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            ok = play()
+            with counts_lock:
+                counts['iterations'] += 1
+                counts['failed'] += not ok
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+
+    endpoints = {}
+    for label in sorted(set(recorder.samples) | set(recorder.errors)):
+        ordered = sorted(recorder.samples.get(label, []))
+        endpoints[label] = {
+            'count': len(ordered),
+            'errors': recorder.errors.get(label, 0),
+            'mean_ms': round(sum(ordered) / len(ordered), 2) if ordered else 0.0,
+            'p50_ms': round(percentile(ordered, 50), 2),
+            'p95_ms': round(percentile(ordered, 95), 2),
+            'p99_ms': round(percentile(ordered, 99), 2),
+            'max_ms': round(ordered[-1], 2) if ordered else 0.0,
+            'rps': round(len(ordered) / wall, 2) if wall else 0.0,
+        }
+    requests_done = sum(e['count'] + e['errors'] for e in endpoints.values())
+    return {
+        'concurrency': concurrency,
+        'wall_s': round(wall, 2),
+        'iterations': counts['iterations'],
+        'failed_iterations': counts['failed'],
+        'iterations_per_s': round(counts['iterations'] / wall, 2) if wall else 0.0,
+        'requests': requests_done,
+        'rps': round(requests_done / wall, 2) if wall else 0.0,
+        'endpoints': endpoints,
+    }
+
+
+def current_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5)
+        return out.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def compare(baseline, current):
+    """Rows of (scenario, label, metric, before, after, change %) for labels present in both."""
+    rows = []
+    for name, report in current.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        rows.append((name, '*', 'rps', before['rps'], report['rps']))
+        for label, stats in report['endpoints'].items():
+            old = before['endpoints'].get(label)
+            if not old:
+                continue
+            for metric in ('p50_ms', 'p95_ms', 'p99_ms'):
+                rows.append((name, label, metric, old[metric], stats[metric]))
+    return [
+        (name, label, metric, old, new, round((new - old) / old * 100, 1) if old else None)
+        for name, label, metric, old, new in rows
+    ]
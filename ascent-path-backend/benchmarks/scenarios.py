@@ -0,0 +1,120 @@
+"""
+Benchmark scenarios — one user journey each, driven over HTTP against a running server.
+
+A scenario is a function (client, user) → None that makes its requests through
+client.request(label, ...); every request is timed under its label. `user` is a
+BenchUser: the seeded account plus what the journeys need to know about it.
+"""
+import random
+import time
+from dataclasses import dataclass, field
+
+import requests
+
+from . import seed
+from .seed import LEVELS, SKILL_POOL
+
+REQUEST_TIMEOUT = 60
+
+
+class ScenarioError(Exception):
+    """A request failed; the rest of this iteration is skipped (the failure is already recorded)."""
+
+
+@dataclass
+class BenchUser:
+    id: int
+    token: str
+    roadmaps: list = field(default_factory=list)  # enrolled roadmap slugs
+
+
+class Client:
+    def __init__(self, base_url, user, record):
+        self.base_url = base_url.rstrip('/')
+        self.record = record
+        self.rng = random.Random(user.id)
+        self.session = requests.Session()
+        self.session.headers['Authorization'] = f'Bearer {user.token}'
+
+    def request(self, label, method, path, **kwargs):
+        started = time.perf_counter()
+        try:
+            res = self.session.request(method, self.base_url + path, timeout=REQUEST_TIMEOUT, **kwargs)
+        except requests.RequestException as e:
+            self.record(label, (time.perf_counter() - started) * 1000, False)
+            raise ScenarioError(f'{label}: {e}') from e
+        self.record(label, (time.perf_counter() - started) * 1000, res.status_code < 400)
+        if res.status_code >= 400:
+            raise ScenarioError(f'{label}: HTTP {res.status_code}')
+        return res.json() if res.content else None
+
+
+def load_users(limit) -> list:
+    """Up to `limit` seeded users with enrollments, each with a fresh access token."""
+    from django.contrib.auth import get_user_model
+    from rest_framework_simplejwt.tokens import AccessToken
+    from roles.models import Enrollment
+
+    ids = seed.user_ids()[:limit]
+    roadmaps = {}
+    for user_id, slug in Enrollment.objects.filter(user_id__in=ids).values_list('user_id', 'roadmap__slug'):
+        roadmaps.setdefault(user_id, []).append(slug)
+    return [
+        BenchUser(id=user.id, token=str(AccessToken.for_user(user)), roadmaps=roadmaps[user.id])
+        for user in get_user_model().objects.filter(id__in=list(roadmaps))
+    ]
+
+
+# ── Scenarios ─────────────────────────────────────────────────────────────────
+
+def dashboard(client, user):
+    client.request('dashboard-stats', 'GET', '/api/roles/dashboard-stats/')
+
+
+def roadmap_detail(client, user):
+    slug = client.rng.choice(user.roadmaps)
+    client.request('roadmap-detail', 'GET', f'/api/roles/roadmaps/{slug}/')
+    client.request('role-detail', 'GET', f'/api/roles/{slug}/')
+
+
+def trending(client, user):
+    client.request('trending', 'GET', '/api/roles/trending/')
+
+
+def assessment(client, user):
+    body = {'skill': client.rng.choice(SKILL_POOL), 'level': client.rng.choice(LEVELS)}
+    generated = client.request('assessment-generate', 'POST', '/api/assessment/generate/', json=body)
+    client.request('assessment-submit', 'POST', '/api/assessment/submit/', json={
+        'session_id': generated['session_id'],
+        'answers': [
+            {'question_id': q['id'], 'selected_option': client.rng.randint(0, 3)} for q in generated['questions']
+        ],
+        'tab_switches': 0,
+    })
+
+
+def interview(client, user):
+    started = client.request('interview-start', 'POST', '/api/interview/start/', json={
+        'skill': client.rng.choice(SKILL_POOL),
+        'github_url': f'https://github.com/bench-user-{user.id % 50}',  # a bounded set, like repeat visitors
+    })
+    for turn in range(started['total_questions']):
+        client.request('interview-answer', 'POST', '/api/interview/answer/', json={
+            'session_id': started['session_id'],
+            'answer': f'Answer {turn + 1}: I would start from the requirements and measure before optimizing.',
+        })
+
+
+def resume(client, user):
+    slug = client.rng.choice(user.roadmaps)
+    client.request('generate-resume', 'POST', '/api/roles/generate-resume/', json={'slug': slug, 'preview': True})
+
+
+SCENARIOS = {
+    'dashboard': dashboard,
+    'roadmap_detail': roadmap_detail,
+    'trending': trending,
+    'assessment': assessment,
+    'interview': interview,
+    'resume': resume,
+}
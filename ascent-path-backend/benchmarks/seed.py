@@ -0,0 +1,187 @@
+"""
+Synthetic data at a configurable scale. Everything is prefixed (bench_* users, bench-*
+roadmaps, source='bench' questions) so it can live next to real data and be removed with
+cleanup(). Rows go in with bulk_create, then the denormalized counters are recomputed once.
+"""
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from assessments.models import AssessmentQuestion, AssessmentSession
+from interviews.models import InterviewQuestion, InterviewSession
+from profile_app.models import UserSkill
+from roles import counters
+from roles.management.commands.fake_remoteok import TAG_POOL
+from roles.models import Enrollment, Roadmap, RoleAnalysis, RoleJobCount, SkillNode, UserNodeProgress
+from core import cache as shared_cache
+
+User = get_user_model()
+
+BENCH_PREFIX = 'bench_'
+ROADMAP_PREFIX = 'bench-'
+SKILL_POOL = [
+    'Python', 'Django', 'React', 'JavaScript', 'TypeScript', 'SQL', 'Docker', 'AWS', 'Go', 'Java',
+    'Kubernetes', 'Node.js', 'CSS', 'HTML', 'Git', 'Redis', 'PostgreSQL', 'GraphQL', 'Vue', 'Rust',
+]
+LEVELS = ['beginner', 'intermediate', 'advanced']
+
+DEFAULTS = {
+    'users': 1000,
+    'roadmaps': 20,
+    'nodes': 15,          # per roadmap
+    'enrollments': 3,     # roadmaps per user; progress rows are drawn from these
+    'progress': 30,       # node progress rows per user
+    'skills': 8,          # per user
+    'sessions': 4,        # assessment and interview sessions per user
+    'questions': 30,      # question bank per (skill, level)
+    'history_days': 30,   # daily job counts per roadmap
+    'interview_questions': True,
+}
+SCALES = {
+    'small': {'users': 200},
+    'medium': {'users': 5_000},
+    'large': {'users': 50_000, 'roadmaps': 50},
+}
+
+
+def _bulk(model, rows, batch):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= batch:
+            model.objects.bulk_create(chunk, batch_size=batch)
+            chunk = []
+    if chunk:
+        model.objects.bulk_create(chunk, batch_size=batch)
+
+
+def user_ids():
+    return list(User.objects.filter(username__startswith=BENCH_PREFIX).values_list('id', flat=True))
+
+
+def roadmap_slugs():
+    return list(Roadmap.objects.filter(slug__startswith=ROADMAP_PREFIX).values_list('slug', flat=True))
+
+
+def seed(counts=None, batch=5000, seed_value=0, log=print):
+    """Create bench data; `counts` overrides DEFAULTS key by key. Same seed → same data."""
+    counts = {**DEFAULTS, **(counts or {})}
+    rng = random.Random(seed_value)
+    now = timezone.now()
+    started = time.perf_counter()
+
+    log(f"Seeding {counts['users']} users...")
+    _bulk(User, (
+        User(username=f'{BENCH_PREFIX}{i}', email=f'{BENCH_PREFIX}{i}@bench.local', password='!')
+        for i in range(counts['users'])
+    ), batch)
+    uids = user_ids()
+
+    log(f"Seeding {counts['roadmaps']} roadmaps...")
+    Roadmap.objects.bulk_create([
+        Roadmap(slug=f'{ROADMAP_PREFIX}{r}', title=f'Bench Role {r}', description='',
+                job_tags=rng.sample(TAG_POOL, 3), is_custom=True)
+        for r in range(counts['roadmaps'])
+    ])
+    roadmaps = list(Roadmap.objects.filter(slug__startswith=ROADMAP_PREFIX))
+    _bulk(SkillNode, (
+        SkillNode(roadmap=rm, title=f'{rm.title} node {n}', order=n, difficulty=LEVELS[n * len(LEVELS) // counts['nodes']])
+        for rm in roadmaps for n in range(counts['nodes'])
+    ), batch)
+    RoleAnalysis.objects.bulk_create([
+        RoleAnalysis(role_slug=rm.slug, role_title=rm.title, roadmap=rm, demand_level='medium',
+                     must_have_skills=rng.sample(SKILL_POOL, 5), nice_to_have_skills=rng.sample(SKILL_POOL, 3),
+                     interview_topics=['fundamentals', 'system design'], industry_description='Bench role.')
+        for rm in roadmaps
+    ])
+    RoleJobCount.objects.bulk_create([
+        RoleJobCount(role_slug=rm.slug, date=now.date() - timedelta(days=d), job_count=rng.randint(0, 200))
+        for rm in roadmaps for d in range(counts['history_days'])
+    ], ignore_conflicts=True)
+
+    nodes_by_roadmap = {}
+    for node_id, roadmap_id in SkillNode.objects.filter(roadmap__in=roadmaps).values_list('id', 'roadmap_id'):
+        nodes_by_roadmap.setdefault(roadmap_id, []).append(node_id)
+    roadmap_ids = list(nodes_by_roadmap)
+    enrolled = {uid: rng.sample(roadmap_ids, min(counts['enrollments'], len(roadmap_ids))) for uid in uids}
+
+    log('Seeding enrollments and node progress...')
+    _bulk(Enrollment, (
+        Enrollment(user_id=uid, roadmap_id=rid) for uid, rids in enrolled.items() for rid in rids
+    ), batch)
+
+    def progress_rows():
+        for uid, rids in enrolled.items():
+            pool = [n for rid in rids for n in nodes_by_roadmap[rid]]
+            for node_id in rng.sample(pool, min(counts['progress'], len(pool))):
+                done = rng.random() < 0.7
+                yield UserNodeProgress(
+                    user_id=uid, node_id=node_id, is_completed=done,
+                    completed_at=now - timedelta(days=rng.randint(0, 365)) if done else None,
+                )
+
+    _bulk(UserNodeProgress, progress_rows(), batch)
+
+    log('Seeding skills...')
+    _bulk(UserSkill, (
+        UserSkill(
+            user_id=uid, skill_name=name, is_verified=(verified := rng.random() < 0.4),
+            verified_score=rng.uniform(40, 100) if verified else None,
+        )
+        for uid in uids for name in rng.sample(SKILL_POOL, min(counts['skills'], len(SKILL_POOL)))
+    ), batch)
+
+    log('Seeding question bank...')
+    _bulk(AssessmentQuestion, (
+        AssessmentQuestion(
+            skill=skill, level=level, question_text=f'{skill} {level} question {i}',
+            options=['A', 'B', 'C', 'D'], correct_answer_index=rng.randint(0, 3), source='bench',
+        )
+        for skill in SKILL_POOL for level in LEVELS for i in range(counts['questions'])
+    ), batch)
+
+    log('Seeding assessment and interview sessions...')
+    _bulk(AssessmentSession, (
+        AssessmentSession(
+            user_id=uid, skill=rng.choice(SKILL_POOL), level=rng.choice(LEVELS),
+            status=rng.choice(['completed', 'completed', 'in_progress', 'abandoned']),
+        )
+        for uid in uids for _ in range(counts['sessions'])
+    ), batch)
+    _bulk(InterviewSession, (
+        InterviewSession(
+            user_id=uid, skill=rng.choice(SKILL_POOL), plan_status='ready',
+            status=rng.choice(['completed', 'completed', 'completed', 'active']),
+        )
+        for uid in uids for _ in range(counts['sessions'])
+    ), batch)
+    if counts['interview_questions']:
+        session_ids = list(InterviewSession.objects.filter(
+            user__username__startswith=BENCH_PREFIX).values_list('id', flat=True))
+        _bulk(InterviewQuestion, (
+            InterviewQuestion(session_id=sid, number=n, question=f'Question {n}', expected_topics=[],
+                              max_score=10, score=round(rng.uniform(3, 10), 1))
+            for sid in session_ids for n in range(1, 8)
+        ), batch)
+
+    log('Recomputing progress counters...')
+    counters.refresh_all()  # bulk_create skips the signals that keep them current
+    for namespace in (shared_cache.roadmaps, shared_cache.analysis, shared_cache.trends):
+        namespace.invalidate()
+    log(f'Seeded in {time.perf_counter() - started:.1f}s')
+
+
+def cleanup():
+    """Delete all bench data; returns the number of rows removed."""
+    slugs = roadmap_slugs()
+    RoleJobCount.objects.filter(role_slug__in=slugs).delete()
+    RoleAnalysis.objects.filter(role_slug__in=slugs).delete()
+    deleted = Roadmap.objects.filter(slug__in=slugs).delete()[0]
+    deleted += AssessmentQuestion.objects.filter(source='bench').delete()[0]
+    deleted += User.objects.filter(username__startswith=BENCH_PREFIX).delete()[0]
+    for namespace in (shared_cache.roadmaps, shared_cache.analysis, shared_cache.trends):
+        namespace.invalidate()
+    return deleted
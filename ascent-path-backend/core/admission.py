@@ -0,0 +1,241 @@
+"""
+Admission control for LLM-backed work, shared by every worker through the cache.
+
+Two gates, both with a bounded wait before giving up with 429 + Retry-After:
+
+    @api_view(['POST'])
+    @permission_classes([IsAuthenticated])
+    @admission.admit('mentor')             # per-user (per-IP when anonymous) token bucket
+    def mentor_chat(request): ...
+
+    with admission.slot('gemini'):         # global concurrency per provider
+        model.generate_content(prompt)      # (done for you by TimedModel and the Groq helper)
+
+Buckets (settings.LLM_RATE_LIMITS) live in one cache entry per (scope, caller), updated under a
+short lock. Provider slots (settings.LLM_CONCURRENCY) are N cache keys taken with
+cache.add and a lease timeout, so a worker that dies mid-call frees its slot when the lease
+expires. Slots are re-entrant within one request/job. Requests queue for at most
+LLM_ADMISSION_WAIT seconds; background jobs (core.background) wait LLM_BACKGROUND_WAIT.
+
+On Redis or memcached, cache.add is atomic and the locks are cache entries. Every other backend
+(the default FileBasedCache) does add() as check-then-set, so bucket updates, slot grabs and
+slot releases are serialized with flock on lock files in ADMISSION_LOCK_DIR instead. That holds
+across every worker sharing the cache directory, and the kernel drops a dead worker's lock.
+"""
+import functools
+import logging
+import math
+import os
+import threading
+import random
+import time
+import uuid
+import zlib
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.exceptions import Throttled
+
+try:
+    import fcntl
+except ImportError:  # Windows; see _file_lock
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+PREFIX = 'admission'
+LOCK_SECONDS = 2  # cache lock entries expire on their own if a holder dies
+LOCK_WAIT = 0.25  # give up on a cache lock after this and proceed unlocked (fail open)
+POLL_SECONDS = 0.05
+LOCK_STRIPES = 64  # lock files in ADMISSION_LOCK_DIR; keys hash onto them
+ATOMIC_BACKENDS = (
+    'django.core.cache.backends.redis.RedisCache',
+    'django_redis.cache.RedisCache',
+    'django.core.cache.backends.memcached.PyMemcacheCache',
+    'django.core.cache.backends.memcached.PyLibMCCache',
+)
+
+_local_lock = threading.Lock()
+_warned = False
+
+_held = ContextVar('admission_held_slots', default=frozenset())
+_max_wait = ContextVar('admission_max_wait', default=None)
+
+
+class Saturated(Throttled):
+    """Raised when a gate cannot admit within the wait bound; DRF turns it into 429 + Retry-After."""
+    default_detail = 'The AI service is busy. Please retry shortly.'
+
+
+def max_wait() -> float:
+    value = _max_wait.get()
+    return settings.LLM_ADMISSION_WAIT if value is None else value
+
+
+@contextmanager
+def waiting(seconds: float):
+    """Use a different queueing bound in the enclosed block (background jobs can wait longer)."""
+    token = _max_wait.set(seconds)
+    try:
+        yield
+    finally:
+        _max_wait.reset(token)
+
+
+def atomic_cache() -> bool:
+    """Whether cache.add is atomic across workers, so cache entries can serve as locks."""
+    return settings.CACHES['default']['BACKEND'] in ATOMIC_BACKENDS
+
+
+def _open_lock_file(name):
+    path = os.path.join(settings.ADMISSION_LOCK_DIR, f'{zlib.crc32(name.encode()) % LOCK_STRIPES}.lock')
+    try:
+        return os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    except FileNotFoundError:
+        os.makedirs(settings.ADMISSION_LOCK_DIR, exist_ok=True)
+        return os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+
+@contextmanager
+def _file_lock(name):
+    """
+    Exclusive flock shared by every process (and thread: each opens its own descriptor) on the
+    box. Held only around a cache read-modify-write, and released by the kernel if the holder dies.
+    """
+    global _warned
+    if fcntl is None:
+        if not _warned:
+            _warned = True
+            logger.warning('No fcntl on this platform: LLM rate limits and slots hold per worker only')
+        with _local_lock:
+            yield
+        return
+    fd = _open_lock_file(name)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # releases the lock
+
+
+def _serialized(name):
+    """Cross-worker mutual exclusion where cache.add can't provide it; a no-op on atomic backends."""
+    return nullcontext() if atomic_cache() else _file_lock(name)
+
+
+@contextmanager
+def _locked(key):
+    if not atomic_cache():
+        with _file_lock(key):
+            yield
+        return
+    lock_key = f'{key}:lock'
+    deadline = time.monotonic() + LOCK_WAIT
+    acquired = cache.add(lock_key, 1, LOCK_SECONDS)
+    while not acquired and time.monotonic() < deadline:
+        time.sleep(0.005)
+        acquired = cache.add(lock_key, 1, LOCK_SECONDS)
+    try:
+        yield
+    finally:
+        if acquired:
+            cache.delete(lock_key)
+
+
+# ── Per-caller token buckets ─────────────────────────────────────────────────
+
+def _take_token(key, per_minute, burst) -> float:
+    """Take one token; 0 when granted, otherwise seconds until the next one is due."""
+    rate = per_minute / 60.0
+    with _locked(key):
+        now = time.time()
+        tokens, stamp = cache.get(key) or (float(burst), now)
+        tokens = min(float(burst), tokens + (now - stamp) * rate)
+        granted = tokens >= 1
+        cache.set(key, (tokens - 1 if granted else tokens, now), int(burst / rate) + 60)
+    return 0.0 if granted else (1 - tokens) / rate
+
+
+def client_ip(request) -> str:
+    """
+    The address our own proxies saw. Each proxy appends the peer it received from to
+    X-Forwarded-For, so with N trusted proxies the client is the Nth entry from the right;
+    anything further left was sent by the client and can be forged.
+    """
+    trusted = settings.TRUSTED_PROXY_COUNT
+    hops = [h.strip() for h in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if h.strip()]
+    if trusted and len(hops) >= trusted:
+        return hops[-trusted]
+    return request.META.get('REMOTE_ADDR') or 'unknown'
+
+
+def caller_id(request) -> str:
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'user:{user.pk}'
+    return 'ip:' + client_ip(request)
+
+
+def acquire_token(scope: str, caller: str):
+    """Wait (within the bound) for a token in the caller's bucket for this scope, or raise Saturated."""
+    per_minute, burst = settings.LLM_RATE_LIMITS[scope]
+    key = f'{PREFIX}:bucket:{scope}:{caller}'
+    deadline = time.monotonic() + max_wait()
+    while True:
+        wait = _take_token(key, per_minute, burst)
+        if not wait:
+            return
+        if time.monotonic() + wait > deadline:
+            raise Saturated(wait=math.ceil(wait), detail='Too many AI requests. Please slow down.')
+        time.sleep(wait)
+
+
+def admit(scope: str):
+    """View decorator (innermost, under @permission_classes): one token per request from the caller's bucket."""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            acquire_token(scope, caller_id(request))
+            return view(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ── Per-provider concurrency ──────────────────────────────────────────────────
+
+def _try_slot(provider, limit, token):
+    with _serialized(f'{PREFIX}:slot:{provider}'):
+        for i in random.sample(range(limit), limit):
+            key = f'{PREFIX}:slot:{provider}:{i}'
+            if cache.add(key, token, settings.LLM_SLOT_LEASE):
+                return key
+    return None
+
+
+@contextmanager
+def slot(provider: str):
+    """Hold one of the provider's global slots for the enclosed call, queueing within the bound."""
+    limit = settings.LLM_CONCURRENCY.get(provider)
+    if not limit or provider in _held.get():
+        yield
+        return
+
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + max_wait()
+    key = _try_slot(provider, limit, token)
+    while key is None:
+        if time.monotonic() >= deadline:
+            raise Saturated(wait=settings.LLM_RETRY_AFTER)
+        time.sleep(POLL_SECONDS * (1 + random.random()))  # jitter so waiters don't poll in lockstep
+        key = _try_slot(provider, limit, token)
+
+    held = _held.set(_held.get() | {provider})
+    try:
+        yield
+    finally:
+        _held.reset(held)
+        with _serialized(f'{PREFIX}:slot:{provider}'):
+            if cache.get(key) == token:  # the lease may have expired and been taken by someone else
+                cache.delete(key)
@@ -1,13 +1,36 @@
 import random
-import google.generativeai as genai
 from decouple import config
 
+from core import admission, fake_llm, instrumentation
+
+
+class TimedModel:
+    """GenerativeModel proxy: generate_content holds a global Gemini slot (core.admission) and is timed."""
+
+    def __init__(self, model):
+        self._model = model
+
+    def generate_content(self, *args, **kwargs):
+        with admission.slot('gemini'), instrumentation.track('gemini'):
+            return self._model.generate_content(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
+
+
 def get_gemini_model(model_name='gemini-flash-latest'):
     """
     Returns a configured Gemini model instance using a rotated API key.
     Expects GEMINI_API_KEYS in .env as a comma-separated string.
     Falls back to GEMINI_API_KEY if the multi-key string is missing.
+    With LLM_PROVIDER=fake, returns the local stand-in from core.fake_llm instead.
     """
+    if fake_llm.ENABLED:
+        return TimedModel(fake_llm.GenerativeModel(model_name))
+
+    # Deferred: the SDK pulls in gRPC and protobuf, which every worker would otherwise pay for at boot
+    import google.generativeai as genai
+
     keys_str = config('GEMINI_API_KEYS', default='')
     if not keys_str:
         # Fallback to single key
@@ -21,4 +44,4 @@ def get_gemini_model(model_name='gemini-flash-latest'):
             active_key = random.choice(keys)
 
     genai.configure(api_key=active_key)
-    return genai.GenerativeModel(model_name)
+    return TimedModel(genai.GenerativeModel(model_name))
@@ -0,0 +1,37 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from decouple import config
+from django.conf import settings
+from django.db import close_old_connections
+
+from core import admission
+
+logger = logging.getLogger(__name__)
+
+# One small pool per worker process. Jobs are slow network calls (Gemini, GitHub),
+# so threads are enough and no external broker/worker process is needed.
+_executor = ThreadPoolExecutor(
+    max_workers=config('BACKGROUND_WORKERS', default=4, cast=int),
+    thread_name_prefix='ascent-bg',
+)
+
+
+def _run(fn, *args, **kwargs):
+    close_old_connections()
+    try:
+        with admission.waiting(settings.LLM_BACKGROUND_WAIT):  # nobody is waiting on the response
+            return fn(*args, **kwargs)
+    except Exception:
+        logger.exception('Background job %s failed', getattr(fn, '__name__', fn))
+        raise
+    finally:
+        close_old_connections()
+
+
+def submit(fn, *args, **kwargs):
+    """
+    Run fn(*args, **kwargs) on the background pool and return its Future.
+    DB connections are opened/closed per job so threads never leak them.
+    """
+    return _executor.submit(_run, fn, *args, **kwargs)
@@ -0,0 +1,72 @@
+"""
+Namespaced, versioned keys on top of Django's cache.
+
+Each namespace has its own TTL (settings.CACHE_NAMESPACES) and a generation stored in
+the cache itself, so invalidate() drops every key in the namespace for all workers at
+once without scanning:  jobs:<gen>:latest, roadmaps:<gen>:all, ...
+
+Generations are never reused. They are timestamps, not a counter, so a generation key
+lost to expiry or culling (FileBasedCache evicts at MAX_ENTRIES) comes back as a new
+generation — an extra invalidation — and never as an old one whose entries are still cached.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+DEFAULT_TTL = 300
+
+
+class Namespace:
+    def __init__(self, name: str):
+        self.name = name
+
+    @property
+    def ttl(self):
+        return getattr(settings, 'CACHE_NAMESPACES', {}).get(self.name, DEFAULT_TTL)
+
+    @property
+    def gen_key(self):
+        return f'ns:{self.name}:gen'
+
+    def generation(self) -> int:
+        gen = cache.get(self.gen_key)
+        if gen is None:
+            fresh = time.time_ns()
+            cache.add(self.gen_key, fresh, None)  # first worker to get here wins
+            gen = cache.get(self.gen_key) or fresh
+        return gen
+
+    def key(self, key: str) -> str:
+        return f'{self.name}:{self.generation()}:{key}'
+
+    def get(self, key, default=None):
+        return cache.get(self.key(key), default)
+
+    def set(self, key, value, ttl=None):
+        cache.set(self.key(key), value, self.ttl if ttl is None else ttl)
+
+    def delete(self, key):
+        cache.delete(self.key(key))
+
+    def get_or_set(self, key, fn, ttl=None):
+        """Return the cached value, computing and storing fn() on a miss (None is never cached)."""
+        full_key = self.key(key)
+        value = cache.get(full_key)
+        if value is None:
+            value = fn()
+            if value is not None:
+                cache.set(full_key, value, self.ttl if ttl is None else ttl)
+        return value
+
+    def invalidate(self):
+        """Start a new generation — every existing key in the namespace becomes unreachable."""
+        # set() with no timeout: incr() would rewrite the key with the default TIMEOUT
+        cache.set(self.gen_key, max(time.time_ns(), self.generation() + 1), None)
+
+
+jobs = Namespace('jobs')
+roadmaps = Namespace('roadmaps')
+analysis = Namespace('analysis')
+trends = Namespace('trends')
+github = Namespace('github')
@@ -0,0 +1,63 @@
+"""
+DATABASES entries for the two environments.
+
+SQLite (local / DEBUG): WAL so readers never block the writer, synchronous=NORMAL (safe
+under WAL, one fsync per checkpoint instead of per commit), busy_timeout so a writer waits
+for the lock instead of failing, and IMMEDIATE transactions so a transaction takes the
+write lock at BEGIN. With the default DEFERRED mode a read-then-write transaction that
+loses the upgrade race gets "database is locked" at once, whatever the timeout.
+SQLITE_TUNING=false gives the old behaviour, for `manage.py stress_db_writes --compare`.
+
+Postgres (production): Django's native psycopg 3 pool, sized for one gunicorn worker's
+threads plus its background pool. Connections are health-checked on checkout and recycled
+after DB_POOL_MAX_LIFETIME. Without psycopg_pool it falls back to persistent connections
+with health checks.
+"""
+from decouple import config
+
+SQLITE_BUSY_TIMEOUT = 20  # seconds
+
+
+def sqlite_database(path, tuned=None) -> dict:
+    tuned = config('SQLITE_TUNING', default=True, cast=bool) if tuned is None else tuned
+    options = {'timeout': SQLITE_BUSY_TIMEOUT}
+    if tuned:
+        options.update({
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': (
+                'PRAGMA journal_mode=WAL;'
+                'PRAGMA synchronous=NORMAL;'
+                f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT * 1000};'
+            ),
+        })
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': path,
+        'OPTIONS': options,
+        'CONN_MAX_AGE': 600 if tuned else 0,
+        'CONN_HEALTH_CHECKS': True,
+    }
+
+
+def postgres_database(url) -> dict:
+    import dj_database_url
+    db = dj_database_url.parse(url, ssl_require=True)
+    db['CONN_HEALTH_CHECKS'] = True  # pooled: checked on checkout; persistent: checked before reuse
+    # Transaction-mode poolers (e.g. Supabase on :6543) can't keep server-side cursors open
+    db['DISABLE_SERVER_SIDE_CURSORS'] = config('DB_DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool)
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError:
+        db['CONN_MAX_AGE'] = 600
+        return db
+
+    db['CONN_MAX_AGE'] = 0  # the pool owns connection lifetime
+    default_size = config('GUNICORN_THREADS', default=8, cast=int) + config('BACKGROUND_WORKERS', default=4, cast=int)
+    db.setdefault('OPTIONS', {})['pool'] = {
+        'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+        'max_size': config('DB_POOL_MAX_SIZE', default=default_size, cast=int),
+        'timeout': config('DB_POOL_TIMEOUT', default=10, cast=float),  # wait for a free connection
+        'max_idle': config('DB_POOL_MAX_IDLE', default=300, cast=float),
+        'max_lifetime': config('DB_POOL_MAX_LIFETIME', default=1800, cast=float),
+    }
+    return db
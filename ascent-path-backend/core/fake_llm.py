@@ -0,0 +1,161 @@
+"""
+In-process stand-ins for Gemini and Groq, for benchmarks and offline development.
+
+    LLM_PROVIDER=fake LLM_FAKE_LATENCY=0.8 python manage.py runserver
+
+get_gemini_model() and assessments.get_groq_client() return these instead of the SDK clients.
+Each call sleeps for the configured latency (± LLM_FAKE_JITTER as a fraction) so the worker
+thread is held the way a real call holds it, then answers with JSON in the shape the calling
+prompt asks for. Answers are derived from a hash of the prompt, so a run is reproducible.
+"""
+import hashlib
+import json
+import random
+import re
+import time
+from types import SimpleNamespace
+
+from decouple import config
+
+ENABLED = config('LLM_PROVIDER', default='live') == 'fake'
+LATENCY = config('LLM_FAKE_LATENCY', default=0.8, cast=float)  # seconds per call
+JITTER = config('LLM_FAKE_JITTER', default=0.25, cast=float)  # ± fraction of LATENCY
+
+TIERS = ['beginner', 'intermediate', 'advanced']
+
+
+def _rng(prompt: str) -> random.Random:
+    return random.Random(int(hashlib.sha1(prompt.encode()).hexdigest()[:12], 16))
+
+
+def _sleep(rng):
+    if LATENCY > 0:
+        time.sleep(max(0.0, LATENCY * (1 + rng.uniform(-JITTER, JITTER))))
+
+
+def _field(prompt: str, pattern: str, default: str) -> str:
+    match = re.search(pattern, prompt)
+    return match.group(1).strip() if match else default
+
+
+# ── Gemini ────────────────────────────────────────────────────────────────────
+
+def _interview_plan(prompt, rng):
+    skill = _field(prompt, r'senior (.+?) engineer conducting', 'the skill')
+    return [
+        {'question': f'{skill} interview question {i + 1}', 'expected_topics': [f'topic {i + 1}a', f'topic {i + 1}b'],
+         'max_score': 10}
+        for i in range(7)
+    ]
+
+
+def _answer_score(prompt, rng):
+    return {'score': round(rng.uniform(4, 10), 1), 'feedback': 'Covers the main points.', 'follow_up': ''}
+
+
+def _roadmap(prompt, rng):
+    role = _field(prompt, r'for the role: (.+?)\.\n', 'Role')
+    return {'nodes': [
+        {
+            'title': f'{role} topic {i + 1}',
+            'description': f'Deep dive into {role} topic {i + 1}.',
+            'difficulty': TIERS[i * len(TIERS) // 12],
+            'estimated_days': rng.randint(2, 7),
+            'resource_url': 'https://developer.mozilla.org/',
+            'video_url': 'https://www.youtube.com/results?search_query=' + role.replace(' ', '+'),
+            'paid_course_url': 'https://www.udemy.com/',
+            'project_description': f'Build a small project exercising {role} topic {i + 1}.',
+            'assessment_type': 'coding',
+            'assessment_data': {'instructions': 'Implement the project.', 'starter_code': '', 'solution_hints': []},
+        }
+        for i in range(12)
+    ]}
+
+
+def _role_analysis(prompt, rng):
+    role = _field(prompt, r'Analyze the role: (.+)', 'Role')
+    return {
+        'must_have_skills': ['Python', 'SQL', 'Git', 'Docker', 'REST APIs'],
+        'nice_to_have_skills': ['AWS', 'Redis', 'GraphQL'],
+        'interview_topics': ['fundamentals', 'debugging', 'system design', 'testing'],
+        'salary_range': '$80k–$130k/yr',
+        'demand_level': rng.choice(['high', 'medium', 'low']),
+        'industry_description': f'A {role} builds and maintains software systems.',
+    }
+
+
+def _jd_extract(prompt, rng):
+    return {
+        'role_title': 'Software Engineer',
+        'must_have_skills': ['Python', 'SQL', 'Docker'],
+        'nice_to_have_skills': ['AWS'],
+        'industry_description': 'Builds and runs backend services.',
+    }
+
+
+def _resume(prompt, rng):
+    return {
+        'skills': rng.sample(['Python', 'Django', 'React', 'SQL', 'Docker', 'AWS', 'Git', 'TypeScript'], 5),
+        'experience': [{'role': 'Developer', 'company': 'Example Co', 'duration': '2 years'}],
+        'summary': 'Developer with backend and frontend experience.',
+    }
+
+
+# First matching marker in the prompt decides the answer shape
+_GEMINI_ANSWERS = [
+    ('conducting a technical interview', _interview_plan),
+    ('scoring an interview answer', _answer_score),
+    ('learning roadmap', _roadmap),
+    ('Analyze the role', _role_analysis),
+    ('Extract the job role', _jd_extract),
+    ('Extract from this resume', _resume),
+]
+
+
+class GenerativeModel:
+    """Quacks like genai.GenerativeModel for generate_content(prompt) → response.text."""
+
+    def __init__(self, model_name='fake'):
+        self.model_name = model_name
+
+    def generate_content(self, prompt, *args, **kwargs):
+        prompt = prompt if isinstance(prompt, str) else str(prompt)
+        rng = _rng(prompt)
+        _sleep(rng)
+        for marker, answer in _GEMINI_ANSWERS:
+            if marker in prompt:
+                return SimpleNamespace(text=json.dumps(answer(prompt, rng)))
+        return SimpleNamespace(text='Think about the inputs and outputs first, then check each step.')
+
+
+# ── Groq ──────────────────────────────────────────────────────────────────────
+
+def _mcq(prompt, rng):
+    count = int(_field(prompt, r'Generate exactly (\d+)', '5'))
+    skill = _field(prompt, r'Skill/Topic\(s\): (.+)', 'the skill')
+    return [
+        {
+            'question': f'{skill} question {rng.randint(0, 10 ** 9)}',
+            'code': '',
+            'options': ['Option A', 'Option B', 'Option C', 'Option D'],
+            'correct_index': rng.randint(0, 3),
+            'explanation': 'Because it is the correct option.',
+        }
+        for _ in range(count)
+    ]
+
+
+class _Completions:
+    def create(self, model=None, messages=(), **kwargs):
+        prompt = messages[-1]['content'] if messages else ''
+        rng = _rng(prompt + str(time.time_ns()))  # fresh questions each call, like the real model
+        _sleep(rng)
+        message = SimpleNamespace(content=json.dumps(_mcq(prompt, rng)))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class Groq:
+    """Quacks like groq.Groq for client.chat.completions.create(...)."""
+
+    def __init__(self, *args, **kwargs):
+        self.chat = SimpleNamespace(completions=_Completions())
@@ -0,0 +1,114 @@
+"""
+Gunicorn settings:  gunicorn -c python:core.gunicorn_conf core.wsgi:application
+
+Worker count comes from the CPUs and memory actually available to the container (cgroup
+limits first, then the host), so the same file works on a small Render instance and a
+large VM. Views spend most of their time waiting on Gemini/Groq/GitHub, so the default
+class is gthread: a few processes, several threads each. Every value can be overridden
+from the environment (WEB_CONCURRENCY, GUNICORN_*).
+
+The app is preloaded in the master and the heavy SDKs that Django itself imports lazily
+are warmed there too, so workers share those pages copy-on-write instead of each loading
+their own. Workers are recycled after max_requests (± jitter, so they don't all restart
+at once) to cap slow leaks.
+"""
+import os
+
+from decouple import config
+
+MB = 1024 * 1024
+
+
+def _cgroup_value(*paths):
+    for path in paths:
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except OSError:
+            continue
+    return None
+
+
+def available_cpus() -> float:
+    quota = _cgroup_value('/sys/fs/cgroup/cpu.max')  # cgroup v2: "<quota> <period>" or "max <period>"
+    if quota and not quota.startswith('max'):
+        limit, period = quota.split()
+        return max(1.0, int(limit) / int(period))
+    v1_quota = _cgroup_value('/sys/fs/cgroup/cpu/cpu.cfs_quota_us')
+    v1_period = _cgroup_value('/sys/fs/cgroup/cpu/cpu.cfs_period_us')
+    if v1_quota and v1_period and int(v1_quota) > 0:
+        return max(1.0, int(v1_quota) / int(v1_period))
+    try:
+        return float(len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return float(os.cpu_count() or 1)
+
+
+def available_memory_mb() -> int:
+    limit = _cgroup_value('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes')
+    host = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // MB
+    if limit and limit != 'max' and int(limit) // MB < host:
+        return int(limit) // MB
+    return host
+
+
+def default_workers(cpus: float, memory_mb: int) -> int:
+    # 2 × CPU + 1 for CPU headroom, but never more than fit in 80% of memory
+    per_worker_mb = config('GUNICORN_WORKER_MEMORY_MB', default=250, cast=int)
+    by_cpu = int(2 * cpus) + 1
+    by_memory = int(memory_mb * 0.8 // per_worker_mb)
+    return max(1, min(by_cpu, by_memory))
+
+
+bind = f"0.0.0.0:{config('PORT', default='8000')}"
+worker_class = config('GUNICORN_WORKER_CLASS', default='gthread')
+workers = config('WEB_CONCURRENCY', default=default_workers(available_cpus(), available_memory_mb()), cast=int)
+# Threads only apply to gthread; each one can hold a request parked on an LLM call
+threads = config('GUNICORN_THREADS', default=8, cast=int) if worker_class == 'gthread' else 1
+preload_app = config('GUNICORN_PRELOAD', default=True, cast=bool)
+
+# Longest legitimate request: admission queueing (5s) + waiting for an interview plan (25s)
+# + one scoring call. Heartbeat timeout above that; graceful shutdown lets in-flight LLM
+# calls finish on deploys.
+timeout = config('GUNICORN_TIMEOUT', default=90, cast=int)
+graceful_timeout = config('GUNICORN_GRACEFUL_TIMEOUT', default=45, cast=int)
+keepalive = config('GUNICORN_KEEPALIVE', default=5, cast=int)  # behind the platform's proxy
+
+max_requests = config('GUNICORN_MAX_REQUESTS', default=1000, cast=int)
+max_requests_jitter = config('GUNICORN_MAX_REQUESTS_JITTER', default=100, cast=int)
+
+# Heartbeat files in RAM, so a slow disk can't make the master kill healthy workers
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+accesslog = '-'
+errorlog = '-'
+loglevel = config('GUNICORN_LOG_LEVEL', default='info')
+
+# Imported in the master under preload so workers inherit them; each is lazy for manage.py
+WARM_IMPORTS = (
+    'roles.trends', 'roles.matching', 'reportlab.platypus', 'google.generativeai',
+)
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    import importlib
+    from django.urls import get_resolver
+    get_resolver().url_patterns  # every view module
+    for module in WARM_IMPORTS:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            server.log.warning('Could not pre-import %s: %s', module, e)
+    server.log.info('Preloaded app: %d workers × %d threads (%s)', workers, threads, worker_class)
+
+
+def pre_fork(server, worker):
+    # Nothing opened in the master (settings checks, warm-up) may be shared with a worker —
+    # neither connections nor a connection pool and its threads
+    from django.db import connections
+    connections.close_all()
+    for conn in connections.all(initialized_only=True):
+        # `conn.pool` would create the pool; only close one the master actually opened
+        if conn.alias in getattr(conn, '_connection_pools', {}):
+            conn.close_pool()
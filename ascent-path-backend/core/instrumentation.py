@@ -0,0 +1,158 @@
+"""
+Per-request performance accounting.
+
+    with instrument() as m:          # or QueryInstrumentationMiddleware for every request
+        ...
+    m.db_count, m.db_ms, m.calls     # {'gemini': [count, ms], 'github': [...], ...}
+
+DB queries are counted through connection.execute_wrapper; outbound HTTP/LLM calls are
+counted where they are made, with `track('<provider>')`. The middleware writes one
+structured log line per request, adds a Server-Timing header when PERF_SERVER_TIMING is
+on (DEBUG only by default — it reveals backend internals), and enforces budgets
+declared on views with @budget — logged by default, raised when PERF_BUDGET_MODE=raise
+(use that in tests so a regression fails the build).
+"""
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+import structlog
+from decouple import config
+from django.conf import settings
+from django.db import connections
+
+logger = structlog.get_logger('ascent.perf')
+
+BUDGET_MODE = config('PERF_BUDGET_MODE', default='log')  # 'log' or 'raise'
+
+_current = ContextVar('ascent_perf_metrics', default=None)
+
+
+class BudgetExceeded(AssertionError):
+    pass
+
+
+class Metrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_count = 0
+        self.db_ms = 0.0
+        self.calls = {}  # provider → [count, ms]
+        self.total_ms = 0.0
+
+    def add_call(self, provider, ms):
+        entry = self.calls.setdefault(provider, [0, 0.0])
+        entry[0] += 1
+        entry[1] += ms
+
+    def as_dict(self):
+        data = {'db_queries': self.db_count, 'db_ms': round(self.db_ms, 1), 'total_ms': round(self.total_ms, 1)}
+        for provider, (count, ms) in self.calls.items():
+            data[f'{provider}_calls'] = count
+            data[f'{provider}_ms'] = round(ms, 1)
+        return data
+
+    def server_timing(self):
+        parts = [f'db;dur={self.db_ms:.1f};desc="{self.db_count} queries"']
+        for provider, (count, ms) in self.calls.items():
+            parts.append(f'{provider};dur={ms:.1f};desc="{count} calls"')
+        parts.append(f'total;dur={self.total_ms:.1f}')
+        return ', '.join(parts)
+
+
+def _db_wrapper(execute, sql, params, many, context):
+    metrics = _current.get()
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if metrics is not None:
+            metrics.db_count += 1
+            metrics.db_ms += (time.perf_counter() - started) * 1000
+
+
+@contextmanager
+def instrument():
+    """Collect Metrics for the enclosed block (this thread's DB connections only)."""
+    metrics = Metrics()
+    token = _current.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(_db_wrapper))
+            yield metrics
+    finally:
+        metrics.total_ms = (time.perf_counter() - metrics.started) * 1000
+        _current.reset(token)
+
+
+@contextmanager
+def track(provider: str):
+    """Time one outbound call (HTTP API or LLM) against the current request, if any."""
+    metrics = _current.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if metrics is not None:
+            metrics.add_call(provider, (time.perf_counter() - started) * 1000)
+
+
+def budget(queries=None, db_ms=None, total_ms=None, calls=None):
+    """
+    Declare a view's performance budget. Put it above @api_view:
+
+        @budget(queries=8, calls={'gemini': 1})
+        @api_view(['GET'])
+        def my_view(request): ...
+    """
+    def decorator(view):
+        view.perf_budget = {'queries': queries, 'db_ms': db_ms, 'total_ms': total_ms, 'calls': calls or {}}
+        return view
+    return decorator
+
+
+def check_budget(limits, metrics):
+    """List of human-readable violations (empty when within budget)."""
+    violations = []
+    if limits['queries'] is not None and metrics.db_count > limits['queries']:
+        violations.append(f"{metrics.db_count} queries > {limits['queries']}")
+    if limits['db_ms'] is not None and metrics.db_ms > limits['db_ms']:
+        violations.append(f"db {metrics.db_ms:.0f}ms > {limits['db_ms']}ms")
+    if limits['total_ms'] is not None and metrics.total_ms > limits['total_ms']:
+        violations.append(f"total {metrics.total_ms:.0f}ms > {limits['total_ms']}ms")
+    for provider, limit in limits['calls'].items():
+        count = metrics.calls.get(provider, [0, 0.0])[0]
+        if count > limit:
+            violations.append(f'{count} {provider} calls > {limit}')
+    return violations
+
+
+class QueryInstrumentationMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with instrument() as metrics:
+            response = self.get_response(request)
+
+        if settings.PERF_SERVER_TIMING:
+            response['Server-Timing'] = metrics.server_timing()
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else request.path
+        log = logger.bind(method=request.method, path=request.path, view=view_name,
+                          status=response.status_code, **metrics.as_dict())
+
+        limits = getattr(request, 'perf_budget', None)
+        violations = check_budget(limits, metrics) if limits else []
+        if violations:
+            log.warning('perf_budget_exceeded', violations=violations)
+            if BUDGET_MODE == 'raise':
+                raise BudgetExceeded(f"{view_name}: {'; '.join(violations)}")
+        else:
+            log.info('request')
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.perf_budget = getattr(view_func, 'perf_budget', None)
+        return None
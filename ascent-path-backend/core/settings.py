@@ -3,7 +3,8 @@ Django settings for Ascent Path backend.
 """
 from pathlib import Path
 from decouple import config
-import dj_database_url
+
+from core.db import postgres_database, sqlite_database
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -30,9 +31,12 @@ INSTALLED_APPS = [
     'assessments',
     'roles',
     'interviews',
+    'taxonomy',
+    'benchmarks',
 ]
 
 MIDDLEWARE = [
+    'core.instrumentation.QueryInstrumentationMiddleware',  # outermost: times everything below
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -44,6 +48,10 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Server-Timing exposes DB query counts and provider timings — local/debug only by default.
+# The per-request structured log line is always written.
+PERF_SERVER_TIMING = config('PERF_SERVER_TIMING', default=DEBUG, cast=bool)
+
 ROOT_URLCONF = 'core.urls'
 
 TEMPLATES = [
@@ -64,26 +72,73 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'core.wsgi.application'
 
-# ── Database — SQLite locally, Supabase PostgreSQL on Render ─────────────────
+# ── Database — SQLite locally, Supabase PostgreSQL on Render (see core.db) ───
 if DEBUG:
-    DATABASES = {
+    DATABASES = {'default': sqlite_database(BASE_DIR / 'db.sqlite3')}
+else:
+    DATABASES = {'default': postgres_database(config('DATABASE_URL'))}
+
+
+# ── Cache — shared by every worker on the box; Redis when REDIS_URL is set ────
+REDIS_URL = config('REDIS_URL', default='')
+CACHE_DIR = config('CACHE_DIR', default=str(BASE_DIR / 'var' / 'cache'))
+if REDIS_URL:
+    CACHES = {
         'default': {
-            'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': BASE_DIR / 'db.sqlite3',
-            'OPTIONS': {
-                'timeout': 20,
-            }
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'ascent',
+            'VERSION': config('CACHE_VERSION', default=1, cast=int),
+            'TIMEOUT': 3600,
         }
     }
 else:
-    DATABASES = {
-        'default': dj_database_url.config(
-            default=config('DATABASE_URL'),
-            conn_max_age=600,
-            ssl_require=True,
-        )
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': CACHE_DIR,
+            'KEY_PREFIX': 'ascent',
+            'VERSION': config('CACHE_VERSION', default=1, cast=int),
+            'TIMEOUT': 3600,
+            'OPTIONS': {'MAX_ENTRIES': 5000},
+        }
     }
 
+# Per-namespace TTLs (seconds) for core.cache.Namespace
+CACHE_NAMESPACES = {
+    'jobs': 3600,        # RemoteOK snapshot payloads + pointer
+    'roadmaps': 600,     # roadmap lists, node lists, trending
+    'analysis': 86400,   # derived role analysis data
+    'trends': 3600,      # job-count growth / demand summaries
+    'github': 86400,     # per-username repo summaries (ETag-revalidated)
+}
+
+# ── LLM admission control (core.admission) ──────────────────────────────────
+# Global in-flight calls per provider; Gemini scales with the number of rotated keys
+_GEMINI_KEY_COUNT = len([k for k in config('GEMINI_API_KEYS', default='').split(',') if k.strip()]) or 1
+LLM_CONCURRENCY = {
+    'gemini': config('GEMINI_MAX_CONCURRENCY', default=4 * _GEMINI_KEY_COUNT, cast=int),
+    'groq': config('GROQ_MAX_CONCURRENCY', default=4, cast=int),
+}
+# Per-caller token buckets: scope → (requests per minute, burst)
+LLM_RATE_LIMITS = {
+    'mentor': (10, 5),
+    'analyze_jd': (4, 2),       # AllowAny — keyed by client IP for anonymous callers
+    'role_search': (20, 10),
+    'enroll': (6, 3),
+    'assessment': (10, 4),
+    'interview': (20, 8),       # start + seven answers in a sitting
+    'resume_upload': (4, 2),
+}
+LLM_ADMISSION_WAIT = config('LLM_ADMISSION_WAIT', default=5.0, cast=float)  # max queueing inside a request
+LLM_BACKGROUND_WAIT = config('LLM_BACKGROUND_WAIT', default=60.0, cast=float)
+LLM_SLOT_LEASE = config('LLM_SLOT_LEASE', default=120, cast=int)  # seconds before a dead worker's slot frees
+LLM_RETRY_AFTER = 5  # Retry-After (seconds) when a provider stays saturated
+# flock files serializing bucket/slot updates when the cache has no atomic add (no Redis)
+ADMISSION_LOCK_DIR = config('ADMISSION_LOCK_DIR', default=str(Path(CACHE_DIR) / 'locks'))
+# Proxies in front of the app that append to X-Forwarded-For (Render's edge: 1; runserver: 0)
+TRUSTED_PROXY_COUNT = config('TRUSTED_PROXY_COUNT', default=0 if DEBUG else 1, cast=int)
+
 
 # ── Auth ──────────────────────────────────────────────────────────────────────
 AUTH_USER_MODEL = 'users.User'
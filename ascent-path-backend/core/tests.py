@@ -0,0 +1,193 @@
+import multiprocessing
+import os
+import tempfile
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from core import admission, instrumentation
+from core.cache import Namespace
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'TIMEOUT': 3600},
+}
+
+
+def later(seconds):
+    """Move the cache's clock forward (LocMemCache expires against time.time())."""
+    now = time.time()
+    return mock.patch('django.core.cache.backends.locmem.time.time', return_value=now + seconds)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CACHE_NAMESPACES={'analysis': 86400})
+class NamespaceTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.ns = Namespace('analysis')
+
+    def test_invalidated_entries_stay_unreachable_after_default_timeout(self):
+        self.ns.set('role', 'before')
+        self.ns.invalidate()
+        with later(2 * 3600):  # past the default TIMEOUT, inside the namespace TTL
+            self.assertIsNone(self.ns.get('role'))
+            self.ns.set('role', 'after')
+            self.assertEqual(self.ns.get('role'), 'after')
+
+    def test_lost_generation_key_never_resurrects_old_entries(self):
+        self.ns.set('role', 'before')
+        cache.delete(self.ns.gen_key)  # what expiry or culling does
+        self.assertIsNone(self.ns.get('role'))
+
+    def test_invalidate_after_lost_generation_key(self):
+        self.ns.set('role', 'before')
+        cache.delete(self.ns.gen_key)
+        self.ns.invalidate()
+        self.assertIsNone(self.ns.get('role'))
+
+    def test_generation_is_stable_between_invalidations(self):
+        gen = self.ns.generation()
+        self.assertEqual(self.ns.generation(), gen)
+        self.ns.invalidate()
+        self.assertGreater(self.ns.generation(), gen)
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+@admission.admit('test')
+def admitted_view(request):
+    return Response({'ok': True})
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    LLM_RATE_LIMITS={'test': (60, 2)},  # one token a second, bursts of two
+    LLM_CONCURRENCY={'test': 1},
+    LLM_SLOT_LEASE=30,
+    LLM_ADMISSION_WAIT=0,
+    TRUSTED_PROXY_COUNT=1,
+)
+class AdmissionTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+
+    def test_bucket_allows_burst_then_refills_at_rate(self):
+        key = f'{admission.PREFIX}:bucket:test:ip:1.2.3.4'
+        now = time.time()
+        with mock.patch.object(admission.time, 'time', return_value=now):
+            self.assertEqual(admission._take_token(key, 60, 2), 0)
+            self.assertEqual(admission._take_token(key, 60, 2), 0)
+            self.assertAlmostEqual(admission._take_token(key, 60, 2), 1.0)
+        with mock.patch.object(admission.time, 'time', return_value=now + 1):
+            self.assertEqual(admission._take_token(key, 60, 2), 0)
+            self.assertGreater(admission._take_token(key, 60, 2), 0)
+
+    def test_exhausted_bucket_answers_429_with_retry_after(self):
+        statuses = [
+            admitted_view(self.factory.post('/', REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR='9.9.9.9')).status_code
+            for _ in range(3)
+        ]
+        self.assertEqual(statuses, [200, 200, 429])
+        res = admitted_view(self.factory.post('/', REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR='9.9.9.9'))
+        self.assertEqual(res['Retry-After'], '1')
+
+    def test_forged_forwarded_for_entries_do_not_open_new_buckets(self):
+        for i in range(3):
+            # The client prepends its own value; the proxy appends the real peer last
+            res = admitted_view(self.factory.post('/', HTTP_X_FORWARDED_FOR=f'10.0.0.{i}, 9.9.9.9'))
+        self.assertEqual(res.status_code, 429)
+
+    def test_caller_ip_ignores_forwarded_for_without_trusted_proxies(self):
+        request = self.factory.post('/', REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR='1.1.1.1')
+        with self.settings(TRUSTED_PROXY_COUNT=0):
+            self.assertEqual(admission.client_ip(request), '10.0.0.1')
+        self.assertEqual(admission.client_ip(request), '1.1.1.1')
+
+    def test_slot_is_released_after_the_call(self):
+        with admission.slot('test'):
+            with admission.slot('test'):  # re-entrant within one request
+                pass
+        with admission.slot('test'):
+            pass
+
+    def test_full_provider_raises_saturated(self):
+        admission._try_slot('test', 1, 'other-worker')
+        with self.assertRaises(admission.Saturated) as raised:
+            with admission.slot('test'):
+                pass
+        self.assertEqual(raised.exception.wait, admission.settings.LLM_RETRY_AFTER)
+
+    def test_slot_of_a_dead_worker_frees_when_its_lease_expires(self):
+        admission._try_slot('test', 1, 'dead-worker')  # taken and never released
+        with later(31):
+            with admission.slot('test'):
+                pass
+
+
+def _take_tokens(key, count, results):
+    results.put(sum(admission._take_token(key, 1, 10) == 0 for _ in range(count)))
+
+
+def _hold_slot(token, results):
+    results.put(admission._try_slot('test', 2, token) is not None)
+    time.sleep(0.5)  # hold it while the other workers try
+
+
+class SharedAdmissionTests(SimpleTestCase):
+    """Gunicorn workers on the default FileBasedCache, where add() is check-then-set."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        overrides = self.settings(
+            CACHES={'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': tmp.name,
+            }},
+            ADMISSION_LOCK_DIR=os.path.join(tmp.name, 'locks'),
+            LLM_SLOT_LEASE=30,
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.fork = multiprocessing.get_context('fork')
+
+    def run_workers(self, target, args_for, n):
+        results = self.fork.Queue()
+        procs = [self.fork.Process(target=target, args=(*args_for(i), results)) for i in range(n)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(30)
+        return [results.get(timeout=5) for _ in procs]
+
+    def test_burst_is_shared_by_every_worker(self):
+        key = f'{admission.PREFIX}:bucket:test:user:1'
+        granted = self.run_workers(_take_tokens, lambda i: (key, 10), 6)
+        self.assertEqual(sum(granted), 10)  # one burst in total, not one per worker
+
+    def test_provider_slots_are_shared_by_every_worker(self):
+        taken = self.run_workers(_hold_slot, lambda i: (f'worker-{i}',), 6)
+        self.assertEqual(sum(taken), 2)
+
+
+class ServerTimingTests(SimpleTestCase):
+    def respond(self):
+        middleware = instrumentation.QueryInstrumentationMiddleware(lambda request: HttpResponse('ok'))
+        return middleware(RequestFactory().get('/'))
+
+    @override_settings(PERF_SERVER_TIMING=False)
+    def test_header_is_off_but_the_request_is_still_logged(self):
+        with mock.patch.object(instrumentation, 'logger') as logger:
+            self.assertNotIn('Server-Timing', self.respond())
+        logger.bind.return_value.info.assert_called_once_with('request')
+
+    @override_settings(PERF_SERVER_TIMING=True)
+    def test_header_reports_db_time_when_enabled(self):
+        with mock.patch.object(instrumentation, 'logger'):
+            self.assertIn('db;', self.respond()['Server-Timing'])
@@ -0,0 +1,129 @@
+"""
+GitHub repo context for interviews.
+
+Repo summaries are cached per username in the shared cache and revalidated with ETags
+(a 304 does not count against GitHub's rate limit). Requests go through one pooled
+session per process. While GitHub reports the limit as exhausted, no requests are made
+and the last cached summary is served. Point GITHUB_API_URL at `manage.py fake_github`
+to run against a local stub.
+"""
+import logging
+import re
+import threading
+import time
+
+import requests
+from decouple import config
+from requests.adapters import HTTPAdapter
+
+from core import cache as shared_cache
+from core import instrumentation
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = config('GITHUB_API_URL', default='https://api.github.com').rstrip('/')
+GITHUB_TOKEN = config('GITHUB_TOKEN', default='')  # optional — raises the limit from 60 to 5000/hour
+FRESH_SECONDS = config('GITHUB_FRESH_SECONDS', default=600, cast=int)  # serve without revalidating
+FETCH_TIMEOUT = 8
+REPO_FIELDS = ('name', 'description', 'language', 'stargazers_count')
+
+_USERNAME = re.compile(r'^[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})$')
+
+_session_lock = threading.Lock()
+_session = None
+
+
+def get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=10))
+                session.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=10))
+                session.headers.update({
+                    'Accept': 'application/vnd.github.v3+json',
+                    'User-Agent': 'AscentPath/1.0 (career learning platform)',
+                })
+                if GITHUB_TOKEN:
+                    session.headers['Authorization'] = f'Bearer {GITHUB_TOKEN}'
+                _session = session
+    return _session
+
+
+def username_from_url(github_url: str):
+    """'https://github.com/octocat/' → 'octocat'; None if it doesn't look like a username."""
+    candidate = (github_url or '').split('?')[0].rstrip('/').split('/')[-1].lstrip('@')
+    return candidate if _USERNAME.match(candidate) else None
+
+
+def _rate_limited() -> bool:
+    reset_at = shared_cache.github.get('rate_limited_until')
+    return bool(reset_at and reset_at > time.time())
+
+
+def _note_rate_limit(res):
+    if res.status_code in (403, 429) and res.headers.get('X-RateLimit-Remaining') == '0':
+        reset_at = float(res.headers.get('X-RateLimit-Reset') or time.time() + 60)
+        shared_cache.github.set('rate_limited_until', reset_at, max(1, int(reset_at - time.time())))
+        logger.warning('GitHub rate limit exhausted until %s', time.ctime(reset_at))
+        return True
+    return False
+
+
+def get_repos(username: str):
+    """Recently updated repos (trimmed to REPO_FIELDS), or None when nothing is known."""
+    key = f'repos:{username.lower()}'
+    cached = shared_cache.github.get(key)
+    if cached and time.time() - cached['checked'] < FRESH_SECONDS:
+        return cached['repos']
+    if _rate_limited():
+        return cached['repos'] if cached else None
+
+    headers = {'If-None-Match': cached['etag']} if cached and cached['etag'] else {}
+    try:
+        with instrumentation.track('github'):
+            res = get_session().get(
+                f'{GITHUB_API_URL}/users/{username}/repos',
+                params={'sort': 'updated', 'per_page': 10},
+                headers=headers,
+                timeout=FETCH_TIMEOUT,
+            )
+    except requests.RequestException as e:
+        logger.warning('GitHub fetch failed for %s: %s', username, e)
+        return cached['repos'] if cached else None
+
+    if res.status_code == 304 and cached:
+        cached['checked'] = time.time()
+        shared_cache.github.set(key, cached)
+        return cached['repos']
+    if not res.ok:
+        _note_rate_limit(res)
+        return cached['repos'] if cached else None
+
+    repos = [{f: r.get(f) for f in REPO_FIELDS} for r in res.json() if isinstance(r, dict)]
+    shared_cache.github.set(key, {'etag': res.headers.get('ETag', ''), 'checked': time.time(), 'repos': repos})
+    return repos
+
+
+def context_for(github_url: str, skill: str) -> str:
+    """Prompt-ready summary of the user's repos, favouring ones related to the skill."""
+    if not github_url:
+        return ''
+    username = username_from_url(github_url)
+    repos = get_repos(username) if username else None
+    if not repos:
+        return f'GitHub: {github_url}'
+
+    skill_lower = skill.lower()
+    relevant = [r for r in repos if
+                skill_lower in (r.get('description') or '').lower() or
+                skill_lower in (r.get('language') or '').lower() or
+                skill_lower in (r.get('name') or '').lower()]
+    if not relevant:
+        relevant = repos[:5]
+
+    context = f"GitHub: {github_url}\nRecent repos:\n"
+    for r in relevant[:5]:
+        context += f"- {r['name']}: {r.get('description') or 'No description'} [{r.get('language') or 'Unknown'}] ⭐{r.get('stargazers_count') or 0}\n"
+    return context
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+LANGUAGES = ['Python', 'JavaScript', 'TypeScript', 'Go', 'Java', None]
+
+
+def build_repos(username):
+    seed = int(hashlib.sha1(username.encode()).hexdigest(), 16)
+    return [
+        {
+            'name': f'{username}-project-{i}',
+            'description': f'Sample {LANGUAGES[(seed + i) % len(LANGUAGES)] or "misc"} project #{i}',
+            'language': LANGUAGES[(seed + i) % len(LANGUAGES)],
+            'stargazers_count': (seed >> i) % 50,
+        }
+        for i in range(10)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        'Serve a local stand-in for the GitHub repos API (ETag / 304 and rate-limit aware). '
+        'Point GITHUB_API_URL at it, e.g. GITHUB_API_URL=http://127.0.0.1:8766'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=8766)
+        parser.add_argument('--latency', type=float, default=0.0, help='Seconds to sleep per request')
+        parser.add_argument('--limit', type=int, default=60, help='Full (non-304) responses before answering 403')
+
+    def handle(self, *args, **options):
+        latency = options['latency']
+        state = {'remaining': options['limit'], 'reset': time.time() + 3600}
+        path_re = re.compile(r'^/users/([A-Za-z0-9-]+)/repos')
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if latency:
+                    time.sleep(latency)
+                match = path_re.match(self.path)
+                if not match:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = json.dumps(build_repos(match.group(1))).encode()
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+                if self.headers.get('If-None-Match') == etag:  # 304s are free, like on GitHub
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                if state['remaining'] <= 0:
+                    self.send_response(403)
+                    self.send_header('X-RateLimit-Remaining', '0')
+                    self.send_header('X-RateLimit-Reset', str(int(state['reset'])))
+                    self.end_headers()
+                    return
+                state['remaining'] -= 1
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('ETag', etag)
+                self.send_header('X-RateLimit-Remaining', str(state['remaining']))
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', options['port']), Handler)
+        self.stdout.write(self.style.SUCCESS(f"Fake GitHub API on http://127.0.0.1:{options['port']}"))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+def mark_existing_ready(apps, schema_editor):
+    # Sessions created before background planning already have their full plan
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    InterviewSession.objects.exclude(interview_plan='').update(plan_status='ready')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewsession',
+            name='plan_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('ready', 'Ready'), ('failed', 'Failed')], default='pending', max_length=10),
+        ),
+        migrations.RunPython(mark_existing_ready, migrations.RunPython.noop),
+    ]
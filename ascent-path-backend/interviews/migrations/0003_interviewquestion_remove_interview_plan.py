@@ -0,0 +1,73 @@
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def plans_to_rows(apps, schema_editor):
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    InterviewQuestion = apps.get_model('interviews', 'InterviewQuestion')
+    InterviewMessage = apps.get_model('interviews', 'InterviewMessage')
+    rows = []
+    for session in InterviewSession.objects.exclude(interview_plan='').iterator():
+        try:
+            plan = json.loads(session.interview_plan)
+        except ValueError:
+            continue
+        # Per-answer scores were only ever kept on the AI reply that followed the answer
+        scores = dict(
+            InterviewMessage.objects.filter(session=session, role='ai', score__isnull=False)
+            .values_list('question_number', 'score')
+        )
+        for number, q in enumerate(plan, start=1):
+            if not isinstance(q, dict):
+                continue
+            # The reply to answer N carries question_number N+1 (or none, for the closing message)
+            score = scores.get(number + 1)
+            if score is None and number == len(plan) and session.status == 'completed':
+                score = session.score
+            rows.append(InterviewQuestion(
+                session=session,
+                number=number,
+                question=q.get('question', ''),
+                expected_topics=q.get('expected_topics', []),
+                max_score=q.get('max_score', 10),
+                score=score,
+            ))
+        if len(rows) >= 1000:
+            InterviewQuestion.objects.bulk_create(rows)
+            rows = []
+    InterviewQuestion.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0002_interviewsession_plan_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InterviewQuestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveSmallIntegerField()),
+                ('question', models.TextField()),
+                ('expected_topics', models.JSONField(default=list)),
+                ('max_score', models.FloatField(default=10)),
+                ('score', models.FloatField(blank=True, null=True)),
+                ('feedback', models.TextField(blank=True)),
+                ('answered_at', models.DateTimeField(blank=True, null=True)),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='questions', to='interviews.interviewsession')),
+            ],
+            options={
+                'ordering': ['session', 'number'],
+                'unique_together': {('session', 'number')},
+            },
+        ),
+        migrations.RunPython(plans_to_rows, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='interviewsession',
+            name='interview_plan',
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0003_interviewquestion_remove_interview_plan'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interviewsession',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['user', '-created_at'], name='interview_active_idx'),
+        ),
+    ]
@@ -11,6 +11,11 @@ class InterviewSession(models.Model):
         ('completed', 'Completed'),
         ('failed', 'Failed'),
     ]
+    PLAN_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('ready', 'Ready'),
+        ('failed', 'Failed'),
+    ]
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='interview_sessions')
     skill = models.CharField(max_length=100)
@@ -26,18 +31,41 @@ class InterviewSession(models.Model):
 
     # Gemini gathers context about the user's actual code
     repo_context = models.TextField(blank=True)   # What Gemini found in their GitHub
-    interview_plan = models.TextField(blank=True)  # The 7 questions Gemini prepared
+    # The plan (InterviewQuestion rows) is generated in the background after the opener is sent
+    plan_status = models.CharField(max_length=10, choices=PLAN_STATUS_CHOICES, default='pending')
 
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at'], condition=models.Q(status='active'), name='interview_active_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} — {self.skill} interview ({self.status})"
 
 
+class InterviewQuestion(models.Model):
+    """One planned question; score/feedback are filled in once the answer is scored"""
+    session = models.ForeignKey(InterviewSession, on_delete=models.CASCADE, related_name='questions')
+    number = models.PositiveSmallIntegerField()  # 1-based, matches InterviewMessage.question_number
+    question = models.TextField()
+    expected_topics = models.JSONField(default=list)
+    max_score = models.FloatField(default=10)
+    score = models.FloatField(null=True, blank=True)
+    feedback = models.TextField(blank=True)
+    answered_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ('session', 'number')
+        ordering = ['session', 'number']
+
+    def __str__(self):
+        return f"Q{self.number}: {self.question[:50]}"
+
+
 class InterviewMessage(models.Model):
     ROLE_CHOICES = [('ai', 'AI'), ('user', 'User')]
 
@@ -1,5 +1,9 @@
 import json
-import requests
+import logging
+import time
+
+from django.db import transaction
+from django.db.models import Sum
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
@@ -7,9 +11,17 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from decouple import config
 
-from .models import InterviewSession, InterviewMessage
+from .models import InterviewSession, InterviewQuestion, InterviewMessage
+from . import github
 from profile_app.models import UserSkill
 from core.ai_utils import get_gemini_model
+from core import admission, background
+from core.instrumentation import budget
+
+logger = logging.getLogger(__name__)
+
+PLAN_WAIT_SECONDS = config('INTERVIEW_PLAN_WAIT_SECONDS', default=25, cast=int)
+PLAN_POLL_SECONDS = 0.25
 
 
 def _get_gemini_model(): # Renamed to avoid name conflict with import if any
@@ -17,35 +29,8 @@ def _get_gemini_model(): # Renamed to avoid name conflict with import if any
 
 
 def fetch_github_context(github_url: str, skill: str) -> str:
-    """Fetch basic info about user's GitHub repos related to the skill."""
-    if not github_url:
-        return ''
-    try:
-        # Extract username from URL
-        username = github_url.rstrip('/').split('/')[-1]
-        res = requests.get(
-            f'https://api.github.com/users/{username}/repos?sort=updated&per_page=10',
-            headers={'Accept': 'application/vnd.github.v3+json'},
-            timeout=8
-        )
-        if not res.ok:
-            return f'GitHub profile: {github_url}'
-        repos = res.json()
-        # Filter repos that might be related to skill
-        skill_lower = skill.lower()
-        relevant = [r for r in repos if
-                    skill_lower in (r.get('description') or '').lower() or
-                    skill_lower in (r.get('language') or '').lower() or
-                    skill_lower in r['name'].lower()]
-        if not relevant:
-            relevant = repos[:5]
-
-        context = f"GitHub: {github_url}\nRecent repos:\n"
-        for r in relevant[:5]:
-            context += f"- {r['name']}: {r.get('description') or 'No description'} [{r.get('language') or 'Unknown'}] ⭐{r.get('stargazers_count', 0)}\n"
-        return context
-    except Exception:
-        return f'GitHub: {github_url}'
+    """Fetch basic info about user's GitHub repos related to the skill (cached, ETag-revalidated)."""
+    return github.context_for(github_url, skill)
 
 
 def build_interview_questions(skill: str, github_context: str, resume_summary: str) -> list:
@@ -104,10 +89,92 @@ Return ONLY valid JSON:
     return json.loads(text.strip())
 
 
+def opening_question(skill: str) -> dict:
+    """Q1 is asked before the personalized plan exists, so it is the same for everyone."""
+    return {
+        'question': f"Tell me about a project where you used {skill} — what did you build, and what was your part in it?",
+        'expected_topics': ['project context', 'own contribution', f'practical {skill} usage'],
+        'max_score': 10,
+    }
+
+
+def generic_questions(skill: str) -> list:
+    """Fallback plan when Gemini can't produce one in time."""
+    prompts = [
+        f"What are the core concepts of {skill} you rely on most day to day?",
+        f"Walk me through how you would debug a tricky problem in a {skill} codebase.",
+        f"How do you structure a {skill} project so it stays maintainable as it grows?",
+        f"What performance pitfalls have you run into with {skill}, and how did you address them?",
+        f"How do you test {skill} code, and what do you make sure is covered?",
+        f"If you were designing a production system around {skill} from scratch, what trade-offs would you weigh?",
+    ]
+    return [opening_question(skill)] + [
+        {'question': q, 'expected_topics': [], 'max_score': 10} for q in prompts
+    ]
+
+
+def _question_rows(session_id: int, questions: list, first_number=1) -> list:
+    valid = [q for q in questions if isinstance(q, dict) and q.get('question')]
+    return [
+        InterviewQuestion(
+            session_id=session_id,
+            number=number,
+            question=q['question'],
+            expected_topics=q.get('expected_topics') or [],
+            max_score=q.get('max_score') or 10,
+        )
+        for number, q in enumerate(valid, start=first_number)
+    ]
+
+
+def _store_plan(session_id: int, questions: list, plan_status: str, **fields) -> bool:
+    """
+    Write questions 2..n for a still-pending session. Returns False if someone else
+    (the background job or a timed-out submit_answer) already stored a plan.
+    """
+    rows = _question_rows(session_id, questions[1:], first_number=2)  # Q1 is the opener
+    with transaction.atomic():
+        updated = InterviewSession.objects.filter(pk=session_id, plan_status='pending').update(
+            total_questions=len(rows) + 1, plan_status=plan_status, **fields,
+        )
+        if updated:
+            InterviewQuestion.objects.bulk_create(rows)
+    return bool(updated)
+
+
+def prepare_plan(session_id: int, skill: str, github_context: str, resume_summary: str):
+    """Background job: generate the personalized plan while the user answers the opener."""
+    try:
+        questions = build_interview_questions(skill, github_context, resume_summary)
+        if not isinstance(questions, list) or len(questions) < 2:
+            raise ValueError('plan has too few questions')
+        plan_status = 'ready'
+    except Exception:
+        logger.exception('Interview plan generation failed for session %s', session_id)
+        questions, plan_status = generic_questions(skill), 'failed'
+    _store_plan(session_id, questions, plan_status, repo_context=github_context)
+
+
+def wait_for_plan(session, timeout=PLAN_WAIT_SECONDS):
+    """
+    Block until the session's questions exist, polling the DB (the plan may be written by
+    another worker). Falls back to the generic plan after `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while session.plan_status == 'pending' and time.monotonic() < deadline:
+        time.sleep(PLAN_POLL_SECONDS)
+        session.refresh_from_db(fields=['plan_status', 'total_questions'])
+    if session.plan_status == 'pending':
+        _store_plan(session.pk, generic_questions(session.skill), 'failed')
+        session.refresh_from_db(fields=['plan_status', 'total_questions'])
+
+
 # ── API Views ──────────────────────────────────────────────────────────────────
 
+@budget(calls={'gemini': 0})  # the plan is generated off the request path
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@admission.admit('interview')
 def start_interview(request):
     """
     Start an AI interview session.
@@ -120,6 +187,9 @@ def start_interview(request):
     if not skill:
         return Response({'error': 'skill is required'}, status=status.HTTP_400_BAD_REQUEST)
 
+    # GitHub fetch runs on the background pool while the resume is looked up here
+    github_future = background.submit(fetch_github_context, github_url, skill)
+
     # Get user's resume summary (optional — interview works without it)
     try:
         from profile_app.models import UserResume
@@ -128,47 +198,48 @@ def start_interview(request):
     except Exception:
         resume_summary = ''
 
-    # Fetch GitHub context
-    github_context = fetch_github_context(github_url, skill)
-
-    # Generate 7 personalized questions
-    try:
-        questions = build_interview_questions(skill, github_context, resume_summary)
-    except Exception as e:
-        return Response({'error': f'Failed to prepare interview: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-    # Create session
+    # Create the session with a generic opener — the personalized plan follows in the background
+    first_q = opening_question(skill)
     session = InterviewSession.objects.create(
         user=request.user,
         skill=skill,
         github_url=github_url,
         resume_summary=resume_summary,
-        repo_context=github_context,
-        interview_plan=json.dumps(questions),
+        plan_status='pending',
         status='active',
     )
-
-    # First AI message
+    InterviewQuestion.objects.bulk_create(_question_rows(session.id, [first_q]))
     opener = (
         f"Hi! I'm Netrika, and I'll be assessing your {skill} skills today. "
-        + (f"I've had a look at your GitHub — nice work on your repos! " if github_context else "")
-        + "Let's start with something comfortable. " + questions[0]['question']
+        + "Let's start with something comfortable. " + first_q['question']
     )
     InterviewMessage.objects.create(
         session=session, role='ai', content=opener, question_number=1
     )
 
+    def plan_when_github_ready(future):
+        try:
+            github_context = future.result()
+        except Exception:
+            github_context = ''
+        background.submit(prepare_plan, session.id, skill, github_context, resume_summary)
+
+    # Chained rather than waited on, so no pool thread ever blocks on another job
+    transaction.on_commit(lambda: github_future.add_done_callback(plan_when_github_ready))
+
     return Response({
         'session_id': session.id,
         'question_number': 1,
-        'total_questions': 7,
+        'total_questions': session.total_questions,
         'message': opener,
-        'repo_context': github_context,
+        'repo_context': github_future.result() if github_future.done() else '',
     }, status=status.HTTP_201_CREATED)
 
 
+@budget(calls={'gemini': 1})
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@admission.admit('interview')
 def submit_answer(request):
     """
     Submit an answer, get AI's follow-up/next question.
@@ -185,56 +256,58 @@ def submit_answer(request):
     except InterviewSession.DoesNotExist:
         return Response({'error': 'Session not found'}, status=status.HTTP_404_NOT_FOUND)
 
-    questions = json.loads(session.interview_plan)
     current_q_idx = session.current_question  # 0-indexed
-    current_q = questions[current_q_idx]
+    if current_q_idx > 0:
+        wait_for_plan(session)  # the opener (Q1) exists without the plan
+    current_q = session.questions.get(number=current_q_idx + 1)
 
-    # Save user's answer
-    InterviewMessage.objects.create(
-        session=session, role='user', content=answer, question_number=current_q_idx + 1
-    )
-
-    # Score this answer
+    # Score first: if the AI queue is full (429) nothing has been saved and the client can resend
     try:
-        result = score_answer(current_q['question'], answer, current_q.get('expected_topics', []), session.skill)
+        result = score_answer(current_q.question, answer, current_q.expected_topics, session.skill)
         q_score = result.get('score', 5)
         feedback = result.get('feedback', '')
         follow_up = result.get('follow_up', '')
+    except admission.Saturated:
+        raise
     except Exception:
         q_score = 5
         feedback = 'Good answer.'
         follow_up = ''
 
+    # Save user's answer
+    InterviewMessage.objects.create(
+        session=session, role='user', content=answer, question_number=current_q_idx + 1
+    )
+    InterviewQuestion.objects.filter(pk=current_q.pk).update(
+        score=q_score, feedback=feedback, answered_at=timezone.now()
+    )
+
     # Move to next question
+    if current_q_idx == 0:
+        wait_for_plan(session)
     next_q_idx = current_q_idx + 1
     session.current_question = next_q_idx
-    is_last = next_q_idx >= len(questions)
+    is_last = next_q_idx >= session.total_questions
 
     if is_last:
-        # Calculate final score
-        all_ai_messages = session.messages.filter(role='ai')
-        # Average the scores stored... collect from messages
-        scored_messages = session.messages.filter(role='user')
-        # Simple: this answer completes it
-        avg_score = q_score  # Will refine below with all scores
-
-        # Get all user answers and their approximate q_score
-        # For now, use a simplified scoring
+        # Final score: points earned over points available, on the same 0-10 scale as each answer
+        totals = session.questions.filter(score__isnull=False).aggregate(earned=Sum('score'), possible=Sum('max_score'))
+        final_score = round(totals['earned'] / totals['possible'] * 10, 1) if totals['possible'] else q_score
         session.status = 'completed'
         session.completed_at = timezone.now()
-        session.score = q_score  # last question's score as proxy (ideally average all)
-        session.passed = q_score >= 7.0
-        session.save()
+        session.score = final_score
+        session.passed = final_score >= 7.0
+        session.save(update_fields=['current_question', 'status', 'completed_at', 'score', 'passed'])
 
         # Update UserSkill if passed
         if session.passed:
             updated = UserSkill.objects.filter(
                 user=request.user, skill_name__iexact=session.skill
-            ).update(is_verified=True, verified_score=q_score * 10)
+            ).update(is_verified=True, verified_score=final_score * 10, updated_at=timezone.now())
             if not updated:
                 UserSkill.objects.create(
                     user=request.user, skill_name=session.skill,
-                    is_verified=True, verified_score=q_score * 10
+                    is_verified=True, verified_score=final_score * 10
                 )
 
         closing = (
@@ -252,17 +325,17 @@ def submit_answer(request):
             'feedback': feedback,
             'is_complete': True,
             'passed': session.passed,
-            'final_score': q_score,
+            'final_score': final_score,
         })
     else:
         # Continue with next question
-        next_q = questions[next_q_idx]
-        ai_response = f"{feedback} {follow_up + ' ' if follow_up else ''}Next question: {next_q['question']}"
+        next_q = session.questions.get(number=next_q_idx + 1)
+        ai_response = f"{feedback} {follow_up + ' ' if follow_up else ''}Next question: {next_q.question}"
         InterviewMessage.objects.create(
             session=session, role='ai', content=ai_response,
             question_number=next_q_idx + 1, score=q_score
         )
-        session.save()
+        session.save(update_fields=['current_question'])
 
         return Response({
             'session_id': session.id,
@@ -19,4 +19,5 @@ class UserProjectAdmin(admin.ModelAdmin):
 
 @admin.register(UserResume)
 class UserResumeAdmin(admin.ModelAdmin):
-    list_display = ['user', 'original_filename', 'uploaded_at']
+    list_display = ['user', 'original_filename', 'parse_status', 'uploaded_at']
+    list_filter = ['parse_status']
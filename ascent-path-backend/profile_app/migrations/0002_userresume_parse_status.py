@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profile_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userresume',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='userresume',
+            name='parse_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('parsed', 'Parsed'), ('failed', 'Failed')], default='pending', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='userresume',
+            name='parse_error',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name='userresume',
+            name='parsed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
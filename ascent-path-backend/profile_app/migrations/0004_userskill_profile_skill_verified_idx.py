@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profile_app', '0003_usercertification_updated_at_userproject_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userskill',
+            index=models.Index(fields=['user', 'is_verified', '-verified_score'], name='profile_skill_verified_idx'),
+        ),
+    ]
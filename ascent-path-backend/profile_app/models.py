@@ -19,6 +19,9 @@ class UserSkill(models.Model):
     class Meta:
         unique_together = ('user', 'skill_name')
         ordering = ['-verified_score', 'skill_name']
+        indexes = [
+            models.Index(fields=['user', 'is_verified', '-verified_score'], name='profile_skill_verified_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} — {self.skill_name} ({self.self_reported_level})"
@@ -31,6 +34,7 @@ class UserCertification(models.Model):
     year = models.CharField(max_length=10, blank=True)
     credential_url = models.URLField(blank=True)
     added_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.name} — {self.issuer} ({self.user.username})"
@@ -44,12 +48,19 @@ class UserProject(models.Model):
     github_url = models.URLField(blank=True)
     live_url = models.URLField(blank=True)
     added_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.title} ({self.user.username})"
 
 
 class UserResume(models.Model):
+    PARSE_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('parsed', 'Parsed'),
+        ('failed', 'Failed'),
+    ]
+
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='resume')
     file_url = models.URLField(blank=True)          # Supabase Storage URL
     original_filename = models.CharField(max_length=255, blank=True)
@@ -57,6 +68,10 @@ class UserResume(models.Model):
     parsed_experience = models.JSONField(default=list)
     raw_text = models.TextField(blank=True)          # full extracted text for AI
     gemini_summary = models.TextField(blank=True)    # AI-generated summary
+    content_hash = models.CharField(max_length=64, blank=True)  # sha256 of the uploaded file
+    parse_status = models.CharField(max_length=20, choices=PARSE_STATUS_CHOICES, default='pending')
+    parse_error = models.TextField(blank=True)
+    parsed_at = models.DateTimeField(null=True, blank=True)
     uploaded_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
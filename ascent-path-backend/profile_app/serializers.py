@@ -26,8 +26,14 @@ class UserProjectSerializer(serializers.ModelSerializer):
 class UserResumeSerializer(serializers.ModelSerializer):
     class Meta:
         model = UserResume
-        fields = ['id', 'file_url', 'original_filename', 'parsed_skills', 'parsed_experience', 'gemini_summary', 'uploaded_at']
-        read_only_fields = ['parsed_skills', 'parsed_experience', 'gemini_summary', 'uploaded_at']
+        fields = [
+            'id', 'file_url', 'original_filename', 'parsed_skills', 'parsed_experience', 'gemini_summary',
+            'parse_status', 'parse_error', 'parsed_at', 'uploaded_at',
+        ]
+        read_only_fields = [
+            'parsed_skills', 'parsed_experience', 'gemini_summary',
+            'parse_status', 'parse_error', 'parsed_at', 'uploaded_at',
+        ]
 
 
 class OnboardingSerializer(serializers.Serializer):
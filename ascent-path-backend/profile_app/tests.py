@@ -1,3 +1,107 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from . import views
+from .models import UserResume, UserSkill
+
+User = get_user_model()
+
+# Admission buckets live in the cache; keep them per-test instead of in var/cache
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def _gemini(text):
+    model = mock.Mock()
+    model.generate_content.return_value = mock.Mock(text=text)
+    return model
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ResumeParseTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='ada', email='ada@example.com', password='pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_late_job_for_older_upload_does_not_overwrite_newer_one(self):
+        resume = UserResume.objects.create(user=self.user, raw_text='new', content_hash='new-hash')
+        parsed = '{"skills": ["Go"], "experience": [], "summary": "old"}'
+        with mock.patch.object(views, 'get_gemini_model', return_value=_gemini(parsed)):
+            views.parse_resume(resume.id, 'old text', 'old-hash')
+
+        resume.refresh_from_db()
+        self.assertEqual(resume.parse_status, 'pending')
+        self.assertEqual(resume.parsed_skills, [])
+
+    def test_job_for_current_upload_records_the_parse(self):
+        resume = UserResume.objects.create(user=self.user, raw_text='text', content_hash='h')
+        parsed = '{"skills": ["Go"], "experience": [], "summary": "s"}'
+        with mock.patch.object(views, 'get_gemini_model', return_value=_gemini(parsed)):
+            views.parse_resume(resume.id, 'text', 'h')
+
+        resume.refresh_from_db()
+        self.assertEqual(resume.parse_status, 'parsed')
+        self.assertEqual(resume.gemini_summary, 's')
+
+    def _upload(self):
+        with mock.patch.object(views.background, 'submit') as submit, self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post('/api/profile/resume/upload/', {
+                'resume': SimpleUploadedFile('cv.pdf', b'%PDF resume body', content_type='application/pdf'),
+            }, format='multipart')
+        return res, submit
+
+    def test_same_file_while_parse_in_flight_is_not_requeued(self):
+        self._upload()
+        res, submit = self._upload()
+        self.assertEqual(res.status_code, 200)
+        submit.assert_not_called()
+
+    def test_pending_parse_lost_past_cutoff_is_requeued(self):
+        self._upload()
+        UserResume.objects.filter(user=self.user).update(
+            uploaded_at=timezone.now() - views.RESUME_PARSE_STALE_AFTER - timedelta(minutes=1),
+        )
+        res, submit = self._upload()
+        self.assertEqual(res.status_code, 202)
+        submit.assert_called_once()
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class OnboardingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='ada', email='ada@example.com', password='pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _submit(self, level, skills):
+        return self.client.post('/api/profile/onboarding/', {
+            'level': level, 'skills': [{'name': name} for name in skills],
+        }, format='json')
+
+    def test_resubmit_upserts_existing_skills(self):
+        self.assertEqual(self._submit('beginner', ['Python', 'SQL']).status_code, 201)
+        res = self._submit('advanced', ['Python', 'Docker'])
+
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.data['skills_saved'], 2)
+        levels = dict(UserSkill.objects.filter(user=self.user).values_list('skill_name', 'self_reported_level'))
+        self.assertEqual(levels, {'Python': 'advanced', 'SQL': 'beginner', 'Docker': 'advanced'})
+
+    def test_skill_saved_elsewhere_in_between_does_not_conflict(self):
+        # What a concurrent submit looks like from this one: the row appears after our read
+        UserSkill.objects.create(user=self.user, skill_name='Python', verified_score=80, is_verified=True)
+        res = self._submit('intermediate', ['Python'])
+
+        self.assertEqual(res.status_code, 201)
+        skill = UserSkill.objects.get(user=self.user, skill_name='Python')
+        self.assertEqual(skill.self_reported_level, 'intermediate')
+        self.assertTrue(skill.is_verified)
@@ -5,5 +5,7 @@ urlpatterns = [
     path('onboarding/', views.save_onboarding, name='save-onboarding'),
     path('skills/', views.my_skills, name='my-skills'),
     path('me/', views.my_profile, name='my-profile'),
+    path('snapshot/', views.profile_snapshot, name='profile-snapshot'),
     path('resume/upload/', views.upload_resume, name='upload-resume'),
+    path('resume/status/', views.resume_status, name='resume-status'),
 ]
@@ -1,4 +1,13 @@
+import hashlib
+import json
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import Count, Max, OuterRef, Subquery
 from django.utils import timezone
+from django.views.decorators.http import condition
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes, parser_classes
 from rest_framework.parsers import MultiPartParser, FormParser
@@ -10,13 +19,23 @@ from .serializers import (
     UserSkillSerializer, UserCertificationSerializer,
     UserProjectSerializer, UserResumeSerializer, OnboardingSerializer,
 )
+from core import admission, background
 from core.ai_utils import get_gemini_model
+from taxonomy import index as skill_index
+
+User = get_user_model()
+
+# A parse still pending after this long was lost (worker restart/recycle) and is queued again
+RESUME_PARSE_STALE_AFTER = timedelta(minutes=10)
 
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def save_onboarding(request):
-    """Save the full onboarding wizard payload in one request."""
+    """
+    Save the full onboarding wizard payload in one request.
+    Runs in a single transaction with a fixed number of queries regardless of payload size.
+    """
     serializer = OnboardingSerializer(data=request.data)
     if not serializer.is_valid():
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -24,71 +43,82 @@ def save_onboarding(request):
     data = serializer.validated_data
     user = request.user
     level = data.get('level', 'beginner')
+    now = timezone.now()
+
+    with transaction.atomic():
+        # ── Profile & Socials ─────────────────────────────────────────────────
+        from roles.models import ResumeProfile
+        profile, _ = ResumeProfile.objects.get_or_create(user=user)
+
+        # Update User model if name provided
+        full_name = data.get('full_name', '').strip()
+        if full_name:
+            parts = full_name.split(' ')
+            user.first_name = parts[0]
+            user.last_name = " ".join(parts[1:]) if len(parts) > 1 else ""
+
+        # Sync User's github/bio too
+        if not user.github_url:
+            user.github_url = data.get('github_url', '')
+        if not user.bio:
+            user.bio = data.get('professional_summary', '')
+        user.save(update_fields=['first_name', 'last_name', 'github_url', 'bio'])
+
+        # Update ResumeProfile
+        profile.phone = data.get('phone', profile.phone)
+        profile.location = data.get('location', profile.location)
+        profile.github_url = data.get('github_url', profile.github_url)
+        profile.linkedin_url = data.get('linkedin_url', profile.linkedin_url)
+        profile.professional_summary = data.get('professional_summary', profile.professional_summary)
+        profile.save()
+
+        # ── Skills ────────────────────────────────────────────────────────────
+        skill_names = []
+        for skill_item in data.get('skills', []):
+            skill_name = skill_item.get('name', '').strip()
+            if skill_name and skill_name not in skill_names:
+                skill_names.append(skill_name)
 
-    # ── Profile & Socials ─────────────────────────────────────────────────────
-    from roles.models import ResumeProfile
-    profile, _ = ResumeProfile.objects.get_or_create(user=user)
-    
-    # Update User model if name provided
-    full_name = data.get('full_name', '').strip()
-    if full_name:
-        parts = full_name.split(' ')
-        user.first_name = parts[0]
-        user.last_name = " ".join(parts[1:]) if len(parts) > 1 else ""
-        user.save()
-
-    # Update ResumeProfile
-    profile.phone = data.get('phone', profile.phone)
-    profile.location = data.get('location', profile.location)
-    profile.github_url = data.get('github_url', profile.github_url)
-    profile.linkedin_url = data.get('linkedin_url', profile.linkedin_url)
-    profile.professional_summary = data.get('professional_summary', profile.professional_summary)
-    profile.save()
-
-    # Sync User's github/bio too
-    if not user.github_url:
-        user.github_url = data.get('github_url', '')
-    if not user.bio:
-        user.bio = data.get('professional_summary', '')
-    user.save()
-
-    # ── Skills ────────────────────────────────────────────────────────────────
-    created_skills = []
-    for skill_item in data.get('skills', []):
-        skill_name = skill_item.get('name', '').strip()
-        if not skill_name:
-            continue
-        obj, _ = UserSkill.objects.update_or_create(
-            user=request.user, skill_name=skill_name,
-            defaults={'self_reported_level': level},
+        # One upsert — concurrent submits resolve on the (user, skill_name) constraint, not in Python
+        UserSkill.objects.bulk_create(
+            [UserSkill(user=user, skill_name=name, self_reported_level=level, updated_at=now) for name in skill_names],
+            update_conflicts=True,
+            unique_fields=['user', 'skill_name'],
+            update_fields=['self_reported_level', 'updated_at'],
         )
-        created_skills.append(obj)
-
-    # ── Certifications ────────────────────────────────────────────────────────
-    for cert in data.get('certifications', []):
-        if cert.get('name', '').strip():
-            UserCertification.objects.get_or_create(
-                user=request.user,
-                name=cert['name'].strip(),
-                defaults={
-                    'issuer': cert.get('issuer', ''),
-                    'year': cert.get('year', ''),
-                    'credential_url': cert.get('credential_url', ''),
-                },
-            )
-
-    # ── Projects ──────────────────────────────────────────────────────────────
-    for proj in data.get('projects', []):
-        if proj.get('title', '').strip():
-            UserProject.objects.get_or_create(
-                user=request.user,
-                title=proj['title'].strip(),
-                defaults={
-                    'tech_stack': proj.get('tech', ''),
-                    'github_url': proj.get('url', ''),
-                    'description': proj.get('description', ''),
-                },
-            )
+        created_skills = list(UserSkill.objects.filter(user=user, skill_name__in=skill_names))
+
+        # ── Certifications ────────────────────────────────────────────────────
+        existing_certs = set(UserCertification.objects.filter(user=user).values_list('name', flat=True))
+        new_certs = []
+        for cert in data.get('certifications', []):
+            name = cert.get('name', '').strip()
+            if name and name not in existing_certs:
+                existing_certs.add(name)
+                new_certs.append(UserCertification(
+                    user=user,
+                    name=name,
+                    issuer=cert.get('issuer', ''),
+                    year=cert.get('year', ''),
+                    credential_url=cert.get('credential_url', ''),
+                ))
+        UserCertification.objects.bulk_create(new_certs)
+
+        # ── Projects ──────────────────────────────────────────────────────────
+        existing_projects = set(UserProject.objects.filter(user=user).values_list('title', flat=True))
+        new_projects = []
+        for proj in data.get('projects', []):
+            title = proj.get('title', '').strip()
+            if title and title not in existing_projects:
+                existing_projects.add(title)
+                new_projects.append(UserProject(
+                    user=user,
+                    title=title,
+                    tech_stack=proj.get('tech', ''),
+                    github_url=proj.get('url', ''),
+                    description=proj.get('description', ''),
+                ))
+        UserProject.objects.bulk_create(new_projects)
 
     return Response({
         'message': 'Onboarding data saved successfully.',
@@ -124,11 +154,129 @@ def my_profile(request):
     })
 
 
+def _related_rollup(model, ts_field='updated_at'):
+    """Row count and newest timestamp of a per-user table, as correlated subqueries on User."""
+    rows = model.objects.filter(user=OuterRef('pk')).order_by().values('user')
+    return (
+        Subquery(rows.annotate(v=Count('pk')).values('v')),
+        Subquery(rows.annotate(v=Max(ts_field)).values('v')),
+    )
+
+
+def profile_version(request):
+    """
+    ETag for the profile snapshot — derived in one query from the row counts and max
+    updated_at of everything the snapshot serializes (counts catch deletions).
+    """
+    if getattr(request, '_profile_version', None):
+        return request._profile_version
+    skills_n, skills_ts = _related_rollup(UserSkill)
+    certs_n, certs_ts = _related_rollup(UserCertification)
+    projects_n, projects_ts = _related_rollup(UserProject)
+    row = User.objects.filter(pk=request.user.pk).annotate(
+        skills_n=skills_n, skills_ts=skills_ts,
+        certs_n=certs_n, certs_ts=certs_ts,
+        projects_n=projects_n, projects_ts=projects_ts,
+    ).values(
+        'first_name', 'last_name',
+        'skills_n', 'skills_ts', 'certs_n', 'certs_ts', 'projects_n', 'projects_ts',
+        'resume__uploaded_at', 'resume__parsed_at', 'resume__parse_status',
+        'resume_profile__updated_at',
+    ).first()
+    request._profile_version = hashlib.sha1(repr(sorted(row.items())).encode()).hexdigest()
+    return request._profile_version
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@condition(etag_func=profile_version)
+def profile_snapshot(request):
+    """
+    Everything the profile/resume pages need in one response (4 queries).
+    Carries an ETag, so repeat loads with If-None-Match get a 304 without serialization.
+    """
+    user = (
+        User.objects.select_related('resume', 'resume_profile')
+        .prefetch_related('skills', 'certifications', 'projects')
+        .get(pk=request.user.pk)
+    )
+    try:
+        resume = UserResumeSerializer(user.resume).data
+    except UserResume.DoesNotExist:
+        resume = None
+    try:
+        from roles.serializers import ResumeProfileSerializer
+        resume_profile = ResumeProfileSerializer(user.resume_profile).data
+    except ObjectDoesNotExist:
+        resume_profile = None
+
+    return Response({
+        'version': profile_version(request),
+        'full_name': f"{user.first_name} {user.last_name}".strip() or user.username,
+        'skills': UserSkillSerializer(user.skills.all(), many=True).data,
+        'certifications': UserCertificationSerializer(user.certifications.all(), many=True).data,
+        'projects': UserProjectSerializer(user.projects.all(), many=True).data,
+        'resume': resume,
+        'resume_profile': resume_profile,
+    })
+
+
+def parse_resume(resume_id: int, parsed_text: str, content_hash: str):
+    """
+    Background job — parse resume text with Gemini and record the outcome on UserResume.
+    Writes are conditional on content_hash, so a job for an older upload that finishes late
+    can't overwrite the parse of a newer one.
+    """
+    current = UserResume.objects.filter(id=resume_id, content_hash=content_hash)
+    try:
+        model = get_gemini_model('gemini-flash-latest')
+        prompt = f"""Extract from this resume text and return ONLY valid JSON:
+{{
+  "skills": ["skill1", "skill2"],
+  "experience": [{{"role": "", "company": "", "duration": ""}}],
+  "summary": "2 sentence professional summary"
+}}
+
+Resume text:
+{parsed_text[:2000]}"""
+        response = model.generate_content(prompt)
+        text = response.text.strip()
+        if text.startswith('```'):
+            text = text.split('```')[1]
+            if text.startswith('json'):
+                text = text[4:]
+        parsed = json.loads(text.strip())
+    except Exception as e:
+        current.update(
+            parse_status='failed',
+            parse_error=str(e)[:1000],
+            parsed_at=timezone.now(),
+        )
+        return
+
+    # Canonical spellings, de-duplicated ("ReactJS" and "React.js" both become "React")
+    skills = list(dict.fromkeys(
+        skill_index.canonical_name(n) for n in parsed.get('skills', []) if isinstance(n, str) and n.strip()
+    ))
+    current.update(
+        parsed_skills=skills,
+        parsed_experience=parsed.get('experience', []),
+        gemini_summary=parsed.get('summary', ''),
+        parse_status='parsed',
+        parse_error='',
+        parsed_at=timezone.now(),
+    )
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 @parser_classes([MultiPartParser, FormParser])
+@admission.admit('resume_upload')
 def upload_resume(request):
-    """Upload resume PDF — stores URL and parses with Gemini."""
+    """
+    Upload resume PDF — stores it and queues Gemini parsing in the background.
+    Poll GET /api/profile/resume/status/ for parse progress.
+    """
     file = request.FILES.get('resume')
     if not file:
         return Response({'error': 'No file provided.'}, status=status.HTTP_400_BAD_REQUEST)
@@ -139,55 +287,62 @@ def upload_resume(request):
         return Response({'error': 'Only PDF and DOC files allowed.'}, status=status.HTTP_400_BAD_REQUEST)
 
     # For now store file content as text — Supabase Storage integration is Phase 3
-    # Read raw bytes and attempt basic text extraction
     raw_content = file.read()
-    
-    # Try to parse PDF text using basic approach
-    parsed_text = ''
-    try:
-        import io
-        # Basic extraction — full Gemini parsing in production
-        parsed_text = raw_content.decode('latin-1', errors='ignore')[:3000]
-    except Exception:
-        parsed_text = ''
+    content_hash = hashlib.sha256(raw_content).hexdigest()
+
+    # Same file already parsed (or still being parsed) — skip the Gemini call entirely
+    existing = UserResume.objects.filter(user=request.user).first()
+    in_flight = (
+        existing is not None and existing.parse_status == 'pending'
+        and existing.uploaded_at > timezone.now() - RESUME_PARSE_STALE_AFTER
+    )
+    if existing and existing.content_hash == content_hash and (existing.parse_status == 'parsed' or in_flight):
+        if existing.original_filename != file.name:
+            existing.original_filename = file.name
+            existing.save(update_fields=['original_filename', 'uploaded_at'])
+        return Response({
+            'message': 'Resume already uploaded.',
+            'resume': UserResumeSerializer(existing).data,
+        }, status=status.HTTP_200_OK)
+
+    # Basic extraction — full Gemini parsing happens in the background job
+    parsed_text = raw_content.decode('latin-1', errors='ignore')[:3000]
 
     resume_obj, _ = UserResume.objects.update_or_create(
         user=request.user,
         defaults={
             'original_filename': file.name,
             'raw_text': parsed_text,
+            'content_hash': content_hash,
+            'parse_status': 'pending' if parsed_text else 'failed',
+            'parse_error': '' if parsed_text else 'No text could be extracted from the file.',
+            'parsed_at': None if parsed_text else timezone.now(),
         }
     )
 
-    # Parse with Gemini if text available
     if parsed_text:
-        try:
-            model = get_gemini_model('gemini-flash-latest')
-            prompt = f"""Extract from this resume text and return ONLY valid JSON:
-{{
-  "skills": ["skill1", "skill2"],
-  "experience": [{{"role": "", "company": "", "duration": ""}}],
-  "summary": "2 sentence professional summary"
-}}
-
-Resume text:
-{parsed_text[:2000]}"""
-            response = model.generate_content(prompt)
-            import json
-            text = response.text.strip()
-            if text.startswith('```'):
-                text = text.split('```')[1]
-                if text.startswith('json'):
-                    text = text[4:]
-            parsed = json.loads(text.strip())
-            resume_obj.parsed_skills = parsed.get('skills', [])
-            resume_obj.parsed_experience = parsed.get('experience', [])
-            resume_obj.gemini_summary = parsed.get('summary', '')
-            resume_obj.save()
-        except Exception as e:
-            pass  # Continue even if Gemini fails
+        transaction.on_commit(lambda: background.submit(parse_resume, resume_obj.id, parsed_text, content_hash))
 
     return Response({
         'message': 'Resume uploaded successfully.',
         'resume': UserResumeSerializer(resume_obj).data,
-    }, status=status.HTTP_201_CREATED)
+    }, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def resume_status(request):
+    """Reports background parse progress for the user's resume."""
+    resume = UserResume.objects.filter(user=request.user).only(
+        'id', 'parse_status', 'parse_error', 'parsed_at', 'uploaded_at'
+    ).first()
+    if not resume:
+        return Response({'error': 'No resume uploaded.'}, status=status.HTTP_404_NOT_FOUND)
+
+    return Response({
+        'id': resume.id,
+        'parse_status': resume.parse_status,
+        'parse_error': resume.parse_error,
+        'parsed_at': resume.parsed_at,
+        'uploaded_at': resume.uploaded_at,
+    })
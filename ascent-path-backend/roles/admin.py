@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Roadmap, SkillNode, Enrollment, ResumeProfile
+from .models import Roadmap, SkillNode, Enrollment, ResumeProfile, JobFeed, JobFeedSnapshot, RoleJobCount
 
 @admin.register(Roadmap)
 class RoadmapAdmin(admin.ModelAdmin):
@@ -20,3 +20,18 @@ class EnrollmentAdmin(admin.ModelAdmin):
 class ResumeProfileAdmin(admin.ModelAdmin):
     list_display = ['user', 'phone', 'location', 'updated_at']
     search_fields = ['user__email', 'user__username']
+
+@admin.register(JobFeed)
+class JobFeedAdmin(admin.ModelAdmin):
+    list_display = ['source', 'checked_at', 'etag', 'last_error']
+
+@admin.register(JobFeedSnapshot)
+class JobFeedSnapshotAdmin(admin.ModelAdmin):
+    list_display = ['feed', 'fetched_at', 'job_count']
+    exclude = ['jobs']
+
+@admin.register(RoleJobCount)
+class RoleJobCountAdmin(admin.ModelAdmin):
+    list_display = ['role_slug', 'date', 'job_count']
+    list_filter = ['date']
+    search_fields = ['role_slug']
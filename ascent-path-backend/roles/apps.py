@@ -5,3 +5,6 @@ class RolesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'roles'
     verbose_name = 'Roles & Roadmaps'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,102 @@
+"""
+Role-title canonicalization.
+
+"senior-react-developer", "react-developer-senior" and "sr-react-dev" are the same role.
+Titles are reduced to a token key (abbreviations expanded, seniority dropped, order
+ignored) and matched against existing roadmaps/analyses before anything new is created,
+so one Gemini analysis and one generated roadmap serve all the spellings.
+"""
+import re
+import threading
+
+from django.utils.text import slugify
+
+from . import search as role_search
+
+ABBREVIATIONS = {
+    'sr': 'senior', 'jr': 'junior', 'dev': 'developer', 'devs': 'developer', 'eng': 'engineer',
+    'engg': 'engineer', 'swe': 'software engineer', 'sde': 'software engineer', 'fe': 'frontend',
+    'be': 'backend', 'ml': 'machine learning', 'ds': 'data scientist',
+    'front': 'frontend', 'back': 'backend', 'programmer': 'developer',
+    'js': 'javascript', 'reactjs': 'react', 'nodejs': 'node', 'k8s': 'kubernetes',
+}
+# Seniority / filler words that don't change which roadmap applies
+STOPWORDS = {
+    'senior', 'junior', 'lead', 'principal', 'staff', 'mid', 'level', 'entry', 'associate',
+    'head', 'chief', 'intern', 'trainee', 'i', 'ii', 'iii', 'iv', 'remote', 'the', 'a', 'an',
+    'of', 'and', 'for', 'with', 'end',
+}
+# 'front end' / 'back end' are spelled both ways
+_JOINS = [('front end', 'frontend'), ('back end', 'backend'), ('full stack', 'fullstack')]
+
+# Stricter than the search threshold: merging two roles is worse than a missed merge
+SIMILARITY_THRESHOLD = 0.6
+
+
+def words(text: str) -> list:
+    """Canonical words of any text, in order, repeats kept (abbreviations expanded, seniority dropped)."""
+    raw = [w.strip('.') for w in re.split(r'[^a-z0-9+#.]+', (text or '').lower())]
+    phrase = ' '.join(ABBREVIATIONS.get(w, w) for w in raw if w)
+    for spaced, joined in _JOINS:
+        phrase = phrase.replace(spaced, joined)
+    return [w for w in (ABBREVIATIONS.get(w, w) for w in phrase.split()) if w not in STOPWORDS]
+
+
+def tokens(text: str) -> list:
+    """Ordered, de-duplicated canonical tokens of a role title or slug."""
+    return list(dict.fromkeys(words(text)))
+
+
+def token_key(text: str) -> str:
+    return ' '.join(sorted(tokens(text)))
+
+
+def normalized_slug(text: str) -> str:
+    """Slug for a role we have never seen: 'Sr. React Dev' → 'react-developer'."""
+    return slugify(' '.join(tokens(text))) or slugify(text)
+
+
+_lock = threading.Lock()
+_keys = None  # (version, {token key: slug})
+
+
+def _key_map() -> dict:
+    global _keys
+    from .models import Roadmap, RoleAnalysis
+    version = role_search._version() + (RoleAnalysis.objects.count(),)
+    if _keys is not None and _keys[0] == version:
+        return _keys[1]
+    with _lock:
+        if _keys is None or _keys[0] != version:
+            mapping = {}
+            # Roadmaps win over bare analyses; curated roadmaps win over custom ones
+            for slug, title in RoleAnalysis.objects.filter(roadmap__isnull=True).values_list('role_slug', 'role_title'):
+                mapping[token_key(slug)] = slug
+                mapping[token_key(title)] = slug
+            for slug, title in Roadmap.objects.order_by('-is_custom', '-id').values_list('slug', 'title'):
+                mapping[token_key(slug)] = slug
+                mapping[token_key(title)] = slug
+            mapping.pop('', None)
+            _keys = (version, mapping)
+        return _keys[1]
+
+
+def canonical_slug(text: str) -> str:
+    """
+    Existing slug this role title/slug refers to, or a normalized new slug.
+    Exact slug → token key → TF-IDF similarity, cheapest first.
+    """
+    from .models import Roadmap, RoleAnalysis
+    slug = slugify(text)
+    if Roadmap.objects.filter(slug=slug).exists() or RoleAnalysis.objects.filter(role_slug=slug).exists():
+        return slug
+
+    existing = _key_map().get(token_key(text))
+    if existing:
+        return existing
+
+    hits = role_search.search(' '.join(tokens(text)) or text, 1)
+    if hits and hits[0][1] >= SIMILARITY_THRESHOLD:
+        return hits[0][0]
+
+    return normalized_slug(text)
@@ -0,0 +1,179 @@
+"""
+Denormalized progress counters.
+
+Roadmap.node_count and Enrollment.completed_count / progress_pct are what every progress
+display reads. They are kept in sync in the same transaction as the change that moves
+them: node create/delete (roles.signals) and complete_node. `manage.py
+reconcile_progress_counters` repairs any drift from bulk writes that skip those paths.
+
+complete_nodes() is the single write path for finishing nodes (one from complete-node, many
+from progress sync): an idempotent upsert plus counter bump and tier promotion, all in one
+transaction.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Case, Count, DateTimeField, Exists, F, IntegerField, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce, NullIf
+from django.utils import timezone
+
+from .models import Roadmap, SkillNode, Enrollment, UserNodeProgress
+
+
+def _node_count_sq():
+    return Subquery(
+        SkillNode.objects.filter(roadmap=OuterRef('pk')).order_by()
+        .values('roadmap').annotate(n=Count('id')).values('n'),
+        output_field=IntegerField(),
+    )
+
+
+def _completed_count_sq():
+    return Subquery(
+        UserNodeProgress.objects.filter(user=OuterRef('user'), node__roadmap=OuterRef('roadmap'), is_completed=True)
+        .order_by().values('user').annotate(n=Count('id')).values('n'),
+        output_field=IntegerField(),
+    )
+
+
+def _update_pct(enrollments):
+    """progress_pct = completed_count / roadmap.node_count, rounded, as one UPDATE."""
+    total = Subquery(Roadmap.objects.filter(pk=OuterRef('roadmap')).values('node_count'), output_field=IntegerField())
+    enrollments.update(progress_pct=Coalesce(
+        (F('completed_count') * 100 + NullIf(total, 0) / 2) / NullIf(total, 0), Value(0),
+    ))
+
+
+def refresh_roadmap(roadmap_id):
+    """Recount a roadmap's nodes and re-derive every enrollment on it (node added/removed)."""
+    Roadmap.objects.filter(pk=roadmap_id).update(node_count=Coalesce(_node_count_sq(), Value(0)))
+    refresh_enrollments(Enrollment.objects.filter(roadmap_id=roadmap_id))
+
+
+def refresh_enrollments(enrollments):
+    """Recount completed nodes for the given enrollments from UserNodeProgress."""
+    enrollments.update(completed_count=Coalesce(_completed_count_sq(), Value(0)))
+    _update_pct(enrollments)
+
+
+def refresh_all():
+    """Recount everything — three UPDATE statements regardless of table size."""
+    Roadmap.objects.update(node_count=Coalesce(_node_count_sq(), Value(0)))
+    refresh_enrollments(Enrollment.objects.all())
+
+
+def bump_completed(user_id, roadmap_id, delta=1):
+    """O(1) path for completions: shift the counter and re-derive the percentage."""
+    enrollment = Enrollment.objects.filter(user_id=user_id, roadmap_id=roadmap_id)
+    enrollment.update(completed_count=F('completed_count') + delta)
+    _update_pct(enrollment)
+
+
+TIERS = ['beginner', 'intermediate', 'advanced']
+
+
+def _promote(enrollment, user_id):
+    """
+    Advance current_tier past every tier whose nodes are all done. Only called when a node of
+    the current tier completes, and only looks at that tier's nodes — never a full recount.
+    """
+    if enrollment.current_tier not in TIERS:
+        return None
+    done = UserNodeProgress.objects.filter(node=OuterRef('pk'), user_id=user_id, is_completed=True)
+    tier, promoted = enrollment.current_tier, None
+    while tier != TIERS[-1]:
+        remaining = SkillNode.objects.filter(roadmap_id=enrollment.roadmap_id, difficulty=tier).filter(~Exists(done))
+        if remaining.exists():
+            break
+        tier = promoted = TIERS[TIERS.index(tier) + 1]
+    if promoted:
+        Enrollment.objects.filter(pk=enrollment.pk).update(current_tier=promoted)
+    return promoted
+
+
+def complete_nodes(user_id, completions: dict) -> dict:
+    """
+    Mark nodes done for the user — {node_id: completed_at}. Safe to repeat and to race:
+    missing rows are inserted, then the still-incomplete ones are locked and flipped in one
+    UPDATE, so each transition is seen by exactly one caller. Only transitions set
+    completed_at, bump counters and trigger the promotion check; everything for the
+    touched enrollments happens in the same transaction.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        nodes = {
+            n['id']: n for n in
+            SkillNode.objects.filter(id__in=list(completions)).values('id', 'roadmap_id', 'difficulty')
+        }
+        UserNodeProgress.objects.bulk_create(
+            [UserNodeProgress(user_id=user_id, node_id=node_id) for node_id in nodes], ignore_conflicts=True,
+        )
+        pending = dict(
+            UserNodeProgress.objects.select_for_update()
+            .filter(user_id=user_id, node_id__in=list(nodes), is_completed=False)
+            .values_list('pk', 'node_id')
+        )
+        if pending:
+            UserNodeProgress.objects.filter(pk__in=list(pending), is_completed=False).update(
+                is_completed=True,
+                completed_at=Case(
+                    *[When(pk=pk, then=Value(completions[node_id])) for pk, node_id in pending.items()],
+                    output_field=DateTimeField(),
+                ),
+            )
+
+        newly = defaultdict(list)  # roadmap_id → difficulties of the nodes just completed
+        for node_id in pending.values():
+            newly[nodes[node_id]['roadmap_id']].append(nodes[node_id]['difficulty'])
+
+        roadmap_ids = {n['roadmap_id'] for n in nodes.values()}
+        enrollments = list(
+            Enrollment.objects.select_for_update().filter(user_id=user_id, roadmap_id__in=roadmap_ids).order_by('pk')
+        )
+        promotions = {}
+        for enrollment in enrollments:
+            difficulties = newly.get(enrollment.roadmap_id)
+            if not difficulties:
+                continue
+            bump_completed(user_id, enrollment.roadmap_id, len(difficulties))
+            if enrollment.current_tier in difficulties:
+                promotions[enrollment.pk] = _promote(enrollment, user_id)
+            total = Subquery(Roadmap.objects.filter(pk=OuterRef('roadmap')).values('node_count'))
+            Enrollment.objects.filter(
+                pk=enrollment.pk, completed_at__isnull=True, completed_count__gte=total,
+            ).update(completed_at=now)
+
+        slugs = dict(Roadmap.objects.filter(id__in=roadmap_ids).values_list('id', 'slug'))
+        summaries = []
+        for enrollment in enrollments:
+            enrollment.refresh_from_db(fields=['completed_count', 'progress_pct', 'current_tier', 'completed_at'])
+            summaries.append({
+                'slug': slugs.get(enrollment.roadmap_id),
+                'completed_count': enrollment.completed_count,
+                'progress_pct': enrollment.progress_pct,
+                'current_tier': enrollment.current_tier,
+                'promoted_to': promotions.get(enrollment.pk),
+                'roadmap_completed': enrollment.completed_at is not None,
+            })
+
+    return {
+        'completed': sorted(pending.values()),
+        'unknown_nodes': sorted(set(completions) - set(nodes)),
+        'enrollments': summaries,
+    }
+
+
+def complete_node(user_id, node) -> dict:
+    """Single-node form of complete_nodes, for the complete-node endpoint."""
+    result = complete_nodes(user_id, {node.id: timezone.now()})
+    return {
+        'newly_completed': bool(result['completed']),
+        'enrollment': result['enrollments'][0] if result['enrollments'] else None,
+    }
+
+
+def drift():
+    """(roadmaps, enrollments) whose stored counters disagree with a recount."""
+    roadmaps = Roadmap.objects.annotate(actual=Coalesce(_node_count_sq(), Value(0))).exclude(node_count=F('actual'))
+    enrollments = Enrollment.objects.annotate(actual=Coalesce(_completed_count_sq(), Value(0))).exclude(completed_count=F('actual'))
+    return roadmaps, enrollments
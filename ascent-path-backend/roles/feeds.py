@@ -0,0 +1,185 @@
+"""
+RemoteOK job feed ingestion.
+
+The last good download is persisted as a JobFeedSnapshot, so requests never wait on
+RemoteOK and an outage serves stale data instead of zero jobs. Refreshes use
+ETag/If-Modified-Since, run in the background once the snapshot is older than
+REMOTEOK_TTL, and are serialized across processes by a lease on the JobFeed row. The
+latest-snapshot pointer and the payload go through the shared cache, so the workers on a
+box don't each pull the same multi-MB JSON out of the database.
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+
+import requests
+from decouple import config
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core import background
+from core import cache as shared_cache
+from core import instrumentation
+
+logger = logging.getLogger(__name__)
+
+SOURCE = 'remoteok'
+REMOTEOK_URL = config('REMOTEOK_URL', default='https://remoteok.com/api')
+REMOTEOK_HEADERS = {'User-Agent': 'AscentPath/1.0 (career learning platform)'}
+REMOTEOK_TTL = config('REMOTEOK_TTL', default=3600, cast=int)  # seconds before a refresh is due
+FETCH_TIMEOUT = 10
+LEASE_SECONDS = 60
+KEEP_PAYLOADS = 3          # newest snapshots that keep their full job list
+MEMO_CHECK_SECONDS = 30    # how often a worker looks for a newer snapshot
+
+_memo_lock = threading.Lock()
+_memo = {'snapshot_id': None, 'jobs': [], 'checked': 0.0}
+
+
+def _feed():
+    from .models import JobFeed
+    feed, _ = JobFeed.objects.get_or_create(source=SOURCE)
+    return feed
+
+
+def _acquire_lease(feed) -> bool:
+    """Atomic compare-and-set on lease_until — works the same on SQLite and Postgres."""
+    from .models import JobFeed
+    now = timezone.now()
+    return bool(
+        JobFeed.objects.filter(pk=feed.pk)
+        .filter(Q(lease_until__isnull=True) | Q(lease_until__lt=now))
+        .update(lease_until=now + timedelta(seconds=LEASE_SECONDS))
+    )
+
+
+def _release_lease(feed):
+    from .models import JobFeed
+    JobFeed.objects.filter(pk=feed.pk).update(lease_until=None)
+
+
+def tag_counts(jobs: list) -> dict:
+    counts = Counter()
+    for job in jobs:
+        counts.update({t.lower() for t in job.get('tags', []) if isinstance(t, str)})
+    return dict(counts)
+
+
+def refresh(force=False) -> str:
+    """
+    Conditionally re-download the feed. Returns 'updated', 'not_modified', 'fresh',
+    'locked' (another process is refreshing) or 'error'.
+    """
+    from .models import JobFeedSnapshot
+    feed = _feed()
+    if not force and feed.checked_at and timezone.now() - feed.checked_at < timedelta(seconds=REMOTEOK_TTL):
+        return 'fresh'
+    if not _acquire_lease(feed):
+        return 'locked'
+
+    try:
+        headers = dict(REMOTEOK_HEADERS)
+        if feed.etag:
+            headers['If-None-Match'] = feed.etag
+        if feed.last_modified:
+            headers['If-Modified-Since'] = feed.last_modified
+        try:
+            with instrumentation.track('remoteok'):
+                res = requests.get(REMOTEOK_URL, headers=headers, timeout=FETCH_TIMEOUT)
+            if res.status_code == 304:
+                feed.checked_at = timezone.now()
+                feed.last_error = ''
+                feed.save(update_fields=['checked_at', 'last_error'])
+                return 'not_modified'
+            res.raise_for_status()
+            jobs = [j for j in res.json() if isinstance(j, dict) and 'tags' in j]
+            if not jobs:
+                raise ValueError('feed returned no jobs')
+        except Exception as e:
+            logger.warning('RemoteOK refresh failed, serving last snapshot: %s', e)
+            feed.last_error = str(e)[:1000]
+            feed.save(update_fields=['last_error'])
+            return 'error'
+
+        with transaction.atomic():
+            JobFeedSnapshot.objects.create(feed=feed, job_count=len(jobs), tag_counts=tag_counts(jobs), jobs=jobs)
+            feed.etag = res.headers.get('ETag', '')
+            feed.last_modified = res.headers.get('Last-Modified', '')
+            feed.checked_at = timezone.now()
+            feed.last_error = ''
+            feed.save(update_fields=['etag', 'last_modified', 'checked_at', 'last_error'])
+            # History keeps tag counts; only the newest few keep the multi-MB payload
+            stale = feed.snapshots.order_by('-fetched_at').values_list('id', flat=True)[KEEP_PAYLOADS:]
+            JobFeedSnapshot.objects.filter(id__in=list(stale)).exclude(jobs=[]).update(jobs=[])
+        shared_cache.jobs.delete('latest')
+        from . import trends
+        background.submit(trends.record_daily_counts, jobs)
+        return 'updated'
+    finally:
+        _release_lease(feed)
+
+
+def _latest_snapshot():
+    """(snapshot id, feed checked_at) of the newest snapshot with a payload, shared across workers."""
+    from .models import JobFeedSnapshot
+    latest = shared_cache.jobs.get('latest')
+    if latest is None:
+        latest = (
+            JobFeedSnapshot.objects.filter(feed__source=SOURCE).exclude(jobs=[])
+            .order_by('-fetched_at').values_list('id', 'feed__checked_at').first()
+        )
+        if latest is not None:
+            shared_cache.jobs.set('latest', latest, MEMO_CHECK_SECONDS)
+    return latest
+
+
+def _load_payload(snapshot_id):
+    from .models import JobFeedSnapshot
+    return shared_cache.jobs.get_or_set(
+        f'snapshot:{snapshot_id}',
+        lambda: JobFeedSnapshot.objects.values_list('jobs', flat=True).get(id=snapshot_id),
+    )
+
+
+def get_jobs() -> list:
+    """
+    Jobs from the newest snapshot, memoized per worker. Never blocks on RemoteOK unless
+    there is no snapshot at all yet; a due refresh is kicked off in the background.
+    """
+    now = time.monotonic()
+    if _memo['snapshot_id'] is not None and now - _memo['checked'] < MEMO_CHECK_SECONDS:
+        return _memo['jobs']
+
+    latest = _latest_snapshot()
+    if latest is None:
+        refresh(force=True)  # cold start — nothing to serve yet
+        latest = _latest_snapshot()
+        if latest is None:
+            return []
+    elif latest[1] is None or timezone.now() - latest[1] > timedelta(seconds=REMOTEOK_TTL):
+        background.submit(refresh)  # stale-while-revalidate
+
+    with _memo_lock:
+        if _memo['snapshot_id'] != latest[0]:
+            _memo['jobs'] = _load_payload(latest[0])
+            _memo['snapshot_id'] = latest[0]
+        _memo['checked'] = now
+    return _memo['jobs']
+
+
+def current_snapshot_id():
+    """Id of the snapshot get_jobs() is serving — a cache key for anything derived from it."""
+    get_jobs()
+    return _memo['snapshot_id']
+
+
+def history(since=None):
+    """(fetched_at, job_count, tag_counts) rows, oldest first — for trend charts."""
+    from .models import JobFeedSnapshot
+    qs = JobFeedSnapshot.objects.filter(feed__source=SOURCE).order_by('fetched_at')
+    if since:
+        qs = qs.filter(fetched_at__gte=since)
+    return list(qs.values_list('fetched_at', 'job_count', 'tag_counts'))
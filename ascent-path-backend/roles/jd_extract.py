@@ -0,0 +1,138 @@
+"""
+Local job-description pre-pass for analyze_jd.
+
+Tokenizes the JD and scans it once with an Aho-Corasick automaton holding every taxonomy
+skill/alias and every known role title. When it finds a known role and enough skills it
+answers directly; only ambiguous JDs go to Gemini. The automaton is built once per process
+and rebuilt when the taxonomy, roadmaps or analyses change; like the taxonomy index, that
+version check runs at most once every TAXONOMY_REFRESH_SECONDS.
+"""
+import re
+import threading
+import time
+
+from taxonomy import index as skill_index
+from taxonomy.automaton import TokenAutomaton
+
+from . import search as role_search
+from .canonical import ABBREVIATIONS, STOPWORDS
+
+MIN_SKILLS = 3
+# Only the top of a JD names the role; later mentions are usually "work with the X team"
+TITLE_WINDOW = 60
+# Short/common words that are only skills when written as a proper noun ("Go", "REST")
+AMBIGUOUS = {'go', 'rest', 'api', 'swift', 'express', 'git', 'ts', 'py', 'ml', 'dl', 'torch'}
+
+NICE_MARKERS = ('nice to have', 'nice-to-have', 'preferred', 'bonus', 'plus', 'good to have')
+REQUIRED_MARKERS = ('requirement', 'required', 'must have', 'must-have', 'qualification', 'you have', 'skills')
+
+_WORD = re.compile(r'[A-Za-z0-9+#]+(?:\.[A-Za-z0-9+#]+)*')
+
+
+def tokenize(text: str):
+    """(normalized tokens, original-case tokens) — the same rules for patterns and input."""
+    norm, orig = [], []
+    for word in _WORD.findall(text):
+        lower = word.lower()
+        for tok in ABBREVIATIONS.get(lower, lower).split():
+            if tok in STOPWORDS:
+                continue
+            norm.append(tok)
+            orig.append(word)
+    return norm, orig
+
+
+class JDMatcher:
+    def __init__(self, version=None):
+        from .models import Roadmap, RoleAnalysis
+        self.version = version
+        self.automaton = TokenAutomaton()
+
+        index = skill_index.get_index()
+        for key, skill_id in index.ids.items():
+            self.automaton.add(tokenize(key)[0], ('skill', skill_id))
+        self.skill_names = index.display
+
+        for title in Roadmap.objects.values_list('title', flat=True):
+            self.automaton.add(tokenize(title)[0], ('role', title))
+        for title in RoleAnalysis.objects.values_list('role_title', flat=True):
+            self.automaton.add(tokenize(title)[0], ('role', title))
+        self.automaton.build()
+
+    def _matches(self, tokens, orig):
+        """Leftmost-longest, non-overlapping matches."""
+        found = sorted(self.automaton.find(tokens), key=lambda m: (m[0], m[0] - m[1]))
+        taken_until = 0
+        for start, end, value in found:
+            if start < taken_until:
+                continue
+            if end - start == 1 and tokens[start] in AMBIGUOUS and not orig[start][:1].isupper():
+                continue
+            taken_until = end
+            yield start, end, value
+
+    def extract(self, jd_text: str):
+        """Extraction dict shaped like the Gemini one, or None when confidence is low."""
+        role_title = None
+        must, nice = [], []
+        position = 0
+        nice_section = False
+
+        for line in jd_text.splitlines():
+            lowered = line.lower()
+            inline_nice = any(m in lowered for m in NICE_MARKERS)
+            if len(line.strip()) <= 50:  # a section header like "Nice to have:" switches lists
+                if inline_nice:
+                    nice_section = True
+                elif any(m in lowered for m in REQUIRED_MARKERS):
+                    nice_section = False
+
+            tokens, orig = tokenize(line)
+            for start, end, (kind, value) in self._matches(tokens, orig):
+                if kind == 'role':
+                    if role_title is None and position + start < TITLE_WINDOW:
+                        role_title = value
+                    continue
+                name = self.skill_names[value]
+                target = nice if nice_section or inline_nice else must
+                if name not in must and name not in nice:
+                    target.append(name)
+            position += len(tokens)
+
+        if role_title is None or len(must) + len(nice) < MIN_SKILLS:
+            return None
+        if not must:
+            must, nice = nice, []
+        return {
+            'role_title': role_title,
+            'must_have_skills': must,
+            'nice_to_have_skills': nice,
+        }
+
+
+_lock = threading.Lock()
+_matcher = None
+_checked_at = 0.0
+
+
+def _version():
+    from .models import RoleAnalysis
+    return (skill_index.get_index().version, role_search._version(), RoleAnalysis.objects.count())
+
+
+def get_matcher() -> JDMatcher:
+    global _matcher, _checked_at
+    matcher = _matcher
+    if matcher is not None and time.monotonic() - _checked_at < skill_index.REFRESH_SECONDS:
+        return matcher
+    with _lock:
+        if _matcher is None or time.monotonic() - _checked_at >= skill_index.REFRESH_SECONDS:
+            version = _version()
+            if _matcher is None or _matcher.version != version:
+                _matcher = JDMatcher(version)
+            _checked_at = time.monotonic()
+        return _matcher
+
+
+def extract(jd_text: str):
+    return get_matcher().extract(jd_text)
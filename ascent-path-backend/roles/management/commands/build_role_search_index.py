@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from roles import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the on-disk TF-IDF role search index from all roadmaps'
+
+    def handle(self, *args, **options):
+        index = search.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {len(index.slugs)} roadmaps -> {search.INDEX_PATH}'
+        ))
@@ -0,0 +1,79 @@
+import hashlib
+import json
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+TAG_POOL = [
+    'react', 'javascript', 'typescript', 'frontend', 'css', 'html', 'vue', 'angular', 'python',
+    'django', 'backend', 'nodejs', 'api', 'postgresql', 'golang', 'java', 'aws', 'docker',
+    'kubernetes', 'devops', 'machine learning', 'data science', 'sql', 'ios', 'android', 'swift',
+]
+
+
+def build_jobs(count, seed=0):
+    rng = random.Random(seed)
+    jobs = [{'legal': 'fixture feed — first element is metadata, like the real API'}]
+    for i in range(count):
+        jobs.append({
+            'id': str(i),
+            'position': f'Engineer #{i}',
+            'company': f'Company {i % 97}',
+            'tags': rng.sample(TAG_POOL, rng.randint(2, 5)),
+            'date': '2026-01-01T00:00:00+00:00',
+        })
+    return jobs
+
+
+class Command(BaseCommand):
+    help = (
+        'Serve a local stand-in for the RemoteOK API (ETag / 304 aware). '
+        'Point REMOTEOK_URL at it, e.g. REMOTEOK_URL=http://127.0.0.1:8765/api'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--jobs', type=int, default=500, help='Number of synthetic jobs')
+        parser.add_argument('--latency', type=float, default=0.0, help='Seconds to sleep per request')
+        parser.add_argument('--fail-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+
+    def handle(self, *args, **options):
+        body = json.dumps(build_jobs(options['jobs'])).encode()
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        latency, fail_rate = options['latency'], options['fail_rate']
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if latency:
+                    time.sleep(latency)
+                if fail_rate and random.random() < fail_rate:
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', options['port']), Handler)
+        self.stdout.write(self.style.SUCCESS(
+            f"Fake RemoteOK serving {options['jobs']} jobs on http://127.0.0.1:{options['port']}/api"
+        ))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
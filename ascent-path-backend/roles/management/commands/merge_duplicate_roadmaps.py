@@ -0,0 +1,122 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from core import cache as shared_cache
+from roles import counters
+from roles.canonical import token_key
+from roles.models import Roadmap, SkillNode, RoleAnalysis, Enrollment, UserNodeProgress, GeneratedResume
+
+
+class Command(BaseCommand):
+    help = (
+        'Merge roadmaps whose titles canonicalize to the same role (e.g. "Senior React Developer" '
+        'and "Sr React Dev"). Enrollments, node progress and analyses move to the surviving roadmap.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Only report what would be merged')
+
+    def handle(self, *args, **options):
+        groups = defaultdict(list)
+        roadmaps = Roadmap.objects.annotate(enrolled=Count('enrollment')).order_by('id')
+        for rm in roadmaps:
+            groups[token_key(rm.title)].append(rm)
+
+        merged = 0
+        for key, members in groups.items():
+            if len(members) < 2:
+                continue
+            # Curated beats custom, then most enrollments, then oldest
+            members.sort(key=lambda r: (r.is_custom, -r.enrolled, r.id))
+            primary, duplicates = members[0], members[1:]
+            self.stdout.write(f'  [{key}] keep {primary.slug} <- {", ".join(d.slug for d in duplicates)}')
+            if options['dry_run']:
+                continue
+            for dup in duplicates:
+                with transaction.atomic():
+                    self.merge(primary, dup)
+                merged += 1
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('\nDry run — nothing changed.'))
+        else:
+            # Analyses were moved with update(), which skips the cache-invalidating signals
+            shared_cache.analysis.invalidate()
+            self.stdout.write(self.style.SUCCESS(f'\nDone! Merged {merged} duplicate roadmap(s)'))
+
+    def merge(self, primary, dup):
+        # 1. Nodes — progress on a node with the same title moves to the primary's node;
+        #    nodes nobody has touched go away, touched ones without a twin are re-parented.
+        primary_nodes = {n.title.strip().lower(): n for n in primary.nodes.all()}
+        next_order = max([n.order for n in primary_nodes.values()], default=0) + 1
+        for node in dup.nodes.all():
+            twin = primary_nodes.get(node.title.strip().lower())
+            if twin is None:
+                if UserNodeProgress.objects.filter(node=node).exists():
+                    node.roadmap = primary
+                    node.order = next_order
+                    next_order += 1
+                    node.save(update_fields=['roadmap', 'order'])
+                continue
+            for progress in UserNodeProgress.objects.filter(node=node):
+                existing = UserNodeProgress.objects.filter(user_id=progress.user_id, node=twin).first()
+                if existing is None:
+                    progress.node = twin
+                    progress.save(update_fields=['node'])
+                    continue
+                if progress.is_completed and not existing.is_completed:
+                    existing.is_completed = True
+                    existing.completed_at = progress.completed_at
+                elif progress.completed_at and existing.completed_at:
+                    existing.completed_at = min(progress.completed_at, existing.completed_at)
+                existing.save(update_fields=['is_completed', 'completed_at'])
+                progress.delete()
+
+        # 2. Enrollments — a user enrolled in both keeps one, with the higher tier and earlier start
+        tiers = ['beginner', 'intermediate', 'advanced']
+        for enrollment in Enrollment.objects.filter(roadmap=dup):
+            existing = Enrollment.objects.filter(user_id=enrollment.user_id, roadmap=primary).first()
+            if existing is None:
+                enrollment.roadmap = primary
+                enrollment.save(update_fields=['roadmap'])
+                continue
+            tier = max(existing.current_tier, enrollment.current_tier, key=tiers.index)
+            Enrollment.objects.filter(pk=existing.pk).update(  # update() so auto_now_add can be overridden
+                current_tier=tier,
+                started_at=min(existing.started_at, enrollment.started_at),
+            )
+            self.keep_newer_resume(existing, enrollment)
+            enrollment.delete()
+
+        # 3. Analyses — the duplicate's analysis only survives if the primary has none
+        if RoleAnalysis.objects.filter(role_slug=primary.slug).exists():
+            RoleAnalysis.objects.filter(role_slug=dup.slug).delete()
+        else:
+            RoleAnalysis.objects.filter(role_slug=dup.slug).update(role_slug=primary.slug, roadmap=primary)
+        RoleAnalysis.objects.filter(roadmap=dup).update(roadmap=primary)
+
+        SkillNode.objects.filter(roadmap=dup).delete()
+        dup.delete()
+        # Nodes were re-parented and enrollments moved with update()/save(update_fields)
+        counters.refresh_roadmap(primary.id)
+
+    def keep_newer_resume(self, existing, enrollment):
+        """The generated resume cascades with its enrollment; move it over unless the kept one is newer."""
+        moving = GeneratedResume.objects.filter(enrollment=enrollment).first()
+        if moving is None:
+            return
+        kept = GeneratedResume.objects.filter(enrollment=existing).first()
+        if kept is not None:
+            if kept.last_generated_at >= moving.last_generated_at:
+                return
+            if kept.share_slug and not moving.share_slug:
+                # A link the user already shared keeps working
+                moving.share_slug, moving.is_public = kept.share_slug, kept.is_public
+            kept.delete()
+        # update() so auto_now doesn't restamp last_generated_at
+        GeneratedResume.objects.filter(pk=moving.pk).update(
+            enrollment=existing, share_slug=moving.share_slug, is_public=moving.is_public,
+        )
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core import cache as shared_cache
+from roles import counters
+
+
+class Command(BaseCommand):
+    help = 'Recount Roadmap.node_count and Enrollment.completed_count/progress_pct, repairing any drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Only report drifted rows')
+
+    def handle(self, *args, **options):
+        roadmaps, enrollments = counters.drift()
+        bad_roadmaps = list(roadmaps.values_list('slug', 'node_count', 'actual'))
+        bad_enrollments = enrollments.count()
+        for slug, stored, actual in bad_roadmaps:
+            self.stdout.write(f'  {slug}: node_count {stored} → {actual}')
+        self.stdout.write(f'{len(bad_roadmaps)} roadmap(s) and {bad_enrollments} enrollment(s) drifted')
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('Dry run — nothing changed.'))
+            return
+
+        # Everything is recounted: enrollments whose counts were right can still carry a stale percentage
+        with transaction.atomic():
+            counters.refresh_all()
+        shared_cache.roadmaps.invalidate()
+        self.stdout.write(self.style.SUCCESS('Counters reconciled'))
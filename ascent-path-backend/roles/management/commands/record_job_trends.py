@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from roles import trends
+
+
+class Command(BaseCommand):
+    help = "Record today's per-role job counts from the current feed snapshot and refresh demand levels"
+
+    def handle(self, *args, **options):
+        recorded = trends.record_daily_counts()
+        self.stdout.write(self.style.SUCCESS(f'Recorded job counts for {recorded} role(s)'))
+        for slug, stats in sorted(trends.summary().items(), key=lambda kv: -(kv[1]['growth'] or 0))[:10]:
+            growth = 'n/a' if stats['growth'] is None else f"{stats['growth']:+.1%}"
+            self.stdout.write(f"  {slug:<35} {stats['job_count']:>5} jobs  {growth:>8}  {stats['demand_level']}")
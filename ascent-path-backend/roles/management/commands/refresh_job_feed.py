@@ -0,0 +1,20 @@
+import time
+
+from django.core.management.base import BaseCommand
+from roles import feeds
+
+
+class Command(BaseCommand):
+    help = 'Refresh the RemoteOK job feed snapshot (run from cron, or with --interval as a worker)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Ignore REMOTEOK_TTL and fetch now')
+        parser.add_argument('--interval', type=int, default=0, help='Keep running, refreshing every N seconds')
+
+    def handle(self, *args, **options):
+        while True:
+            result = feeds.refresh(force=options['force'])
+            self.stdout.write(f'RemoteOK refresh: {result}')
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,135 @@
+"""
+Best-fit role scoring.
+
+Every RoleAnalysis is encoded as two sparse rows (must-have / nice-to-have) over a shared
+skill vocabulary built from the taxonomy. A user becomes one dense 0/1 vector, so scoring
+them against every role is two sparse mat-vec products. The matrix is cached per process
+and rebuilt only when analyses or the taxonomy change.
+"""
+import threading
+
+import numpy as np
+from scipy import sparse
+
+from taxonomy import index as skill_index
+
+NICE_TO_HAVE_WEIGHT = 0.5
+
+
+class RoleMatrix:
+    def __init__(self, analyses, version=None):
+        # analyses: (slug, role_title, must_have_skills, nice_to_have_skills) rows
+        self.version = version
+        self.slugs = []
+        self.titles = []
+        self.vocab = {}   # canonical key → column
+        self.labels = []  # column → display label
+
+        must_rc, nice_rc = ([], []), ([], [])
+        for row, (slug, title, must, nice) in enumerate(analyses):
+            self.slugs.append(slug)
+            self.titles.append(title)
+            self._encode(row, must or [], must_rc)
+            self._encode(row, nice or [], nice_rc)
+
+        shape = (len(self.slugs), len(self.labels))
+        self.must = self._binary(must_rc, shape)
+        self.nice = self._binary(nice_rc, shape)
+        self.must_totals = np.asarray(self.must.sum(axis=1), dtype=np.float32).ravel()
+        self.nice_totals = np.asarray(self.nice.sum(axis=1), dtype=np.float32).ravel()
+
+    def _encode(self, row, names, rc):
+        names = [n for n in names if isinstance(n, str) and n.strip()]
+        for key, label in zip(skill_index.canonical_keys(names), names):
+            col = self.vocab.get(key)
+            if col is None:
+                col = self.vocab[key] = len(self.labels)
+                skill_id = skill_index.resolve_one(key)
+                self.labels.append(skill_index.get_index().display[skill_id] if skill_id else label.strip())
+            rc[0].append(row)
+            rc[1].append(col)
+
+    @staticmethod
+    def _binary(rc, shape):
+        m = sparse.csr_matrix((np.ones(len(rc[0]), dtype=np.float32), rc), shape=shape)
+        m.sum_duplicates()
+        m.data[:] = 1.0  # a skill listed twice for one role still counts once
+        return m
+
+    def user_vector(self, skill_names) -> np.ndarray:
+        """0/1 vector over the vocabulary; verified child skills also light up their parents."""
+        index = skill_index.get_index()
+        ids = index.resolve(skill_names)
+        keys = {index.names[sid] for sid in index.with_ancestors(ids)}
+        keys.update(skill_index.normalize(n) for n, sid in zip(skill_names, ids) if sid is None)
+
+        u = np.zeros(len(self.labels), dtype=np.float32)
+        cols = [self.vocab[k] for k in keys if k in self.vocab]
+        u[cols] = 1.0
+        return u
+
+    def score(self, u: np.ndarray) -> dict:
+        must_hits = self.must @ u
+        nice_hits = self.nice @ u
+        weight = self.must_totals + NICE_TO_HAVE_WEIGHT * self.nice_totals
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = np.where(weight > 0, (must_hits + NICE_TO_HAVE_WEIGHT * nice_hits) / weight, 0.0)
+        return {'scores': scores, 'must_hits': must_hits, 'nice_hits': nice_hits}
+
+    def missing(self, m, row, u) -> list:
+        cols = m.indices[m.indptr[row]:m.indptr[row + 1]]
+        return [self.labels[c] for c in cols if not u[c]]
+
+    def best_fit(self, skill_names, limit=10) -> list:
+        if not self.slugs:
+            return []
+        u = self.user_vector(skill_names)
+        result = self.score(u)
+        scores = result['scores']
+
+        limit = min(limit, len(scores))
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top], kind='stable')]
+
+        return [{
+            'slug': self.slugs[r],
+            'title': self.titles[r],
+            'match_pct': round(float(scores[r]) * 100),
+            'must_have_matched': int(result['must_hits'][r]),
+            'must_have_total': int(self.must_totals[r]),
+            'missing_must_have': self.missing(self.must, r, u),
+            'missing_nice_to_have': self.missing(self.nice, r, u),
+        } for r in top]
+
+
+_lock = threading.Lock()
+_matrix = None
+
+
+def _version():
+    from django.db.models import Count, Max
+    from .models import RoleAnalysis
+    agg = RoleAnalysis.objects.aggregate(n=Count('id'), ts=Max('cached_at'))
+    return (agg['n'], agg['ts'], skill_index.get_index().version)
+
+
+def get_role_matrix() -> RoleMatrix:
+    """Cached role matrix; one cheap aggregate query decides whether it must be rebuilt."""
+    global _matrix
+    from .models import RoleAnalysis
+    version = _version()
+    if _matrix is not None and _matrix.version == version:
+        return _matrix
+    with _lock:
+        if _matrix is None or _matrix.version != version:
+            _matrix = RoleMatrix(
+                RoleAnalysis.objects.order_by('role_slug').values_list(
+                    'role_slug', 'role_title', 'must_have_skills', 'nice_to_have_skills'
+                ),
+                version,
+            )
+        return _matrix
+
+
+def best_fit_roles(skill_names, limit=10) -> list:
+    return get_role_matrix().best_fit(list(skill_names), limit)
@@ -0,0 +1,38 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('roles', '0005_resumeprofile'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobFeed',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=50, unique=True)),
+                ('etag', models.CharField(blank=True, max_length=200)),
+                ('last_modified', models.CharField(blank=True, max_length=100)),
+                ('checked_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('lease_until', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='JobFeedSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fetched_at', models.DateTimeField(auto_now_add=True)),
+                ('job_count', models.IntegerField(default=0)),
+                ('tag_counts', models.JSONField(default=dict)),
+                ('jobs', models.JSONField(default=list)),
+                ('feed', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='roles.jobfeed')),
+            ],
+            options={
+                'ordering': ['-fetched_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('roles', '0006_jobfeed_jobfeedsnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoleJobCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role_slug', models.SlugField()),
+                ('date', models.DateField()),
+                ('job_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['role_slug', 'date'],
+                'indexes': [models.Index(fields=['date'], name='roles_jobcount_date_idx')],
+                'unique_together': {('role_slug', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('roles', '0007_rolejobcount'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usernodeprogress',
+            index=models.Index(condition=models.Q(('is_completed', True)), fields=['user', '-completed_at'], name='roles_progress_activity_idx'),
+        ),
+    ]
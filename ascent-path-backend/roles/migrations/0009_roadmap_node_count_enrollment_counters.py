@@ -0,0 +1,49 @@
+from django.db import migrations, models
+
+
+def backfill_counters(apps, schema_editor):
+    Roadmap = apps.get_model('roles', 'Roadmap')
+    Enrollment = apps.get_model('roles', 'Enrollment')
+    UserNodeProgress = apps.get_model('roles', 'UserNodeProgress')
+    node_counts = dict(
+        Roadmap.objects.annotate(n=models.Count('nodes')).values_list('id', 'n')
+    )
+    for roadmap_id, n in node_counts.items():
+        Roadmap.objects.filter(pk=roadmap_id).update(node_count=n)
+    done = {
+        (row['user_id'], row['node__roadmap_id']): row['n']
+        for row in UserNodeProgress.objects.filter(is_completed=True)
+        .values('user_id', 'node__roadmap_id').annotate(n=models.Count('id'))
+    }
+    for enrollment in Enrollment.objects.all().iterator():
+        completed = done.get((enrollment.user_id, enrollment.roadmap_id), 0)
+        total = node_counts.get(enrollment.roadmap_id, 0)
+        enrollment.completed_count = completed
+        enrollment.progress_pct = round(completed * 100 / total) if total else 0
+        enrollment.save(update_fields=['completed_count', 'progress_pct'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('roles', '0008_usernodeprogress_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='roadmap',
+            name='node_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='enrollment',
+            name='completed_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='enrollment',
+            name='progress_pct',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -14,7 +14,9 @@ class Roadmap(models.Model):
     estimated_months = models.IntegerField(default=6)
     is_trending = models.BooleanField(default=False)
     is_custom = models.BooleanField(default=False)  # True if generated by Gemini for a specific user
+    node_count = models.PositiveIntegerField(default=0)  # maintained by roles.counters
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)  # part of the roles.search index version
 
     class Meta:
         ordering = ['-is_trending', 'title']
@@ -76,6 +78,9 @@ class Enrollment(models.Model):
     current_tier = models.CharField(max_length=20, default='beginner') # beginner/intermediate/advanced
     started_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
+    # Maintained by roles.counters so progress displays are a column read
+    completed_count = models.PositiveIntegerField(default=0)
+    progress_pct = models.PositiveSmallIntegerField(default=0)
 
     class Meta:
         unique_together = ('user', 'roadmap')
@@ -93,6 +98,10 @@ class UserNodeProgress(models.Model):
 
     class Meta:
         unique_together = ('user', 'node')
+        indexes = [
+            # dashboard activity feed: newest completions first
+            models.Index(fields=['user', '-completed_at'], condition=models.Q(is_completed=True), name='roles_progress_activity_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} | {self.node.title} | {self.is_completed}"
@@ -122,3 +131,46 @@ class ResumeProfile(models.Model):
 
     def __str__(self):
         return f"Profile: {self.user.username}"
+
+
+class JobFeed(models.Model):
+    """Fetch state for an external job feed (RemoteOK): validators for conditional requests + refresh lease"""
+    source = models.CharField(max_length=50, unique=True)    # 'remoteok'
+    etag = models.CharField(max_length=200, blank=True)
+    last_modified = models.CharField(max_length=100, blank=True)
+    checked_at = models.DateTimeField(null=True, blank=True)  # last successful 200/304
+    last_error = models.TextField(blank=True)
+    lease_until = models.DateTimeField(null=True, blank=True)  # cross-process refresh lock
+
+    def __str__(self):
+        return f"Feed: {self.source}"
+
+
+class JobFeedSnapshot(models.Model):
+    """One successful download of a feed. Old rows drop their payload but keep tag counts for trends."""
+    feed = models.ForeignKey(JobFeed, on_delete=models.CASCADE, related_name='snapshots')
+    fetched_at = models.DateTimeField(auto_now_add=True)
+    job_count = models.IntegerField(default=0)
+    tag_counts = models.JSONField(default=dict)  # {'react': 42, ...}
+    jobs = models.JSONField(default=list)        # full job list; emptied once superseded
+
+    class Meta:
+        ordering = ['-fetched_at']
+
+    def __str__(self):
+        return f"{self.feed.source} @ {self.fetched_at:%Y-%m-%d %H:%M} ({self.job_count} jobs)"
+
+
+class RoleJobCount(models.Model):
+    """Daily job count per role — one narrow row per (role, day), the source for growth and demand"""
+    role_slug = models.SlugField()
+    date = models.DateField()
+    job_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('role_slug', 'date')
+        indexes = [models.Index(fields=['date'], name='roles_jobcount_date_idx')]
+        ordering = ['role_slug', 'date']
+
+    def __str__(self):
+        return f"{self.role_slug} @ {self.date}: {self.job_count}"
@@ -0,0 +1,144 @@
+"""
+Local lexical search over roadmaps.
+
+A word-level TF-IDF index over title, category, job tags and description, tokenized like
+role titles (roles.canonical.words), so "sr react dev" or "frontend engineer" find the
+right roadmap without a table scan. Similarity is scaled by how much of the query the
+roadmap covers: "java developer" shares "developer" with half the catalogue, but no
+roadmap mentions Java, so it stays below the threshold and goes to generation.
+The fitted index is persisted with joblib and memory-mapped by every worker; it is
+rebuilt when a roadmap is added, removed or edited.
+"""
+import logging
+import os
+import threading
+from pathlib import Path
+
+from decouple import config
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = Path(config('ROLE_SEARCH_INDEX_PATH', default=str(settings.BASE_DIR / 'var' / 'role_search.joblib')))
+# Below this score a query is treated as a role we don't know yet (→ Gemini). Calibrated
+# on the seeded roadmaps: near-miss titles score ≤ 0.15, intended matches ≥ 0.3 (roles/tests.py)
+MATCH_THRESHOLD = config('ROLE_SEARCH_THRESHOLD', default=0.25, cast=float)
+# Interchangeable role nouns — "frontend engineer" is the Frontend Developer roadmap
+SYNONYMS = {'engineer': 'developer'}
+
+
+def analyze(text: str) -> list:
+    """TF-IDF analyzer shared by documents and queries (module-level so the index pickles)."""
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+    from .canonical import words
+    return [SYNONYMS.get(w, w) for w in words(text) if w not in ENGLISH_STOP_WORDS]
+
+
+def _document(title, category, job_tags, description):
+    tags = ' '.join(job_tags) if isinstance(job_tags, list) else str(job_tags or '')
+    # Title twice so it outweighs a long description
+    return f"{title} {title} {category} {tags} {description[:500]}"
+
+
+class RoleSearchIndex:
+    def __init__(self, vectorizer, matrix, slugs, version):
+        self.vectorizer = vectorizer
+        self.matrix = matrix      # L2-normalised TF-IDF rows, one per roadmap
+        self.slugs = slugs
+        self.version = version
+
+    @classmethod
+    def build(cls, rows, version):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        rows = list(rows)
+        slugs = [r[0] for r in rows]
+        docs = [_document(*r[1:]) for r in rows]
+        vectorizer = TfidfVectorizer(analyzer=analyze, sublinear_tf=True)
+        matrix = vectorizer.fit_transform(docs) if docs else None
+        return cls(vectorizer, matrix, slugs, version)
+
+    def search(self, query: str, k: int = 5) -> list:
+        """Top-k (slug, score) pairs, best first; score = cosine × coverage²."""
+        import numpy as np
+        terms = set(analyze(query))
+        if self.matrix is None or not terms:
+            return []
+        vector = self.vectorizer.transform([query])
+        # Share of the query's distinct terms present in each roadmap (unknown terms count as missing)
+        coverage = self.matrix[:, vector.indices].getnnz(axis=1) / len(terms)
+        scores = (self.matrix @ vector.T).toarray().ravel() * coverage ** 2
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(self.slugs[i], float(scores[i])) for i in top if scores[i] > 0]
+
+    def save(self, path=INDEX_PATH):
+        import joblib
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+        joblib.dump({'vectorizer': self.vectorizer, 'matrix': self.matrix,
+                     'slugs': self.slugs, 'version': self.version}, tmp)
+        os.replace(tmp, path)  # atomic swap so other workers never read a half-written file
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        import joblib
+        data = joblib.load(path, mmap_mode='r')
+        return cls(data['vectorizer'], data['matrix'], data['slugs'], data['version'])
+
+
+_lock = threading.Lock()
+_index = None
+
+
+def _version():
+    from django.db.models import Count, Max
+    from .models import Roadmap
+    agg = Roadmap.objects.aggregate(n=Count('id'), last=Max('id'), edited=Max('updated_at'))
+    return (agg['n'], agg['last'], agg['edited'])
+
+
+def rebuild(version=None) -> RoleSearchIndex:
+    from .models import Roadmap
+    version = version or _version()
+    index = RoleSearchIndex.build(
+        Roadmap.objects.order_by('id').values_list('slug', 'title', 'category', 'job_tags', 'description'),
+        version,
+    )
+    try:
+        index.save()
+    except OSError:
+        logger.warning('Could not persist role search index to %s', INDEX_PATH, exc_info=True)
+    return index
+
+
+def get_index() -> RoleSearchIndex:
+    """Current index: in memory, else memory-mapped from disk, else rebuilt from the DB."""
+    global _index
+    version = _version()
+    if _index is not None and _index.version == version:
+        return _index
+    with _lock:
+        if _index is None or _index.version != version:
+            index = None
+            if INDEX_PATH.exists():
+                try:
+                    index = RoleSearchIndex.load()
+                except Exception:
+                    logger.warning('Discarding unreadable role search index %s', INDEX_PATH, exc_info=True)
+            if index is None or index.version != version:
+                index = rebuild(version)
+            _index = index
+        return _index
+
+
+def search(query: str, k: int = 5) -> list:
+    return get_index().search(query, k)
+
+
+def best_match(query: str):
+    """Slug of the closest roadmap, or None when nothing clears MATCH_THRESHOLD."""
+    hits = search(query, 1)
+    if hits and hits[0][1] >= MATCH_THRESHOLD:
+        return hits[0][0]
+    return None
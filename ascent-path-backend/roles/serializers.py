@@ -15,15 +15,10 @@ class SkillNodeSerializer(serializers.ModelSerializer):
 
 
 class RoadmapListSerializer(serializers.ModelSerializer):
-    node_count = serializers.SerializerMethodField()
-
     class Meta:
         model = Roadmap
         fields = ['id', 'slug', 'title', 'description', 'icon', 'color', 'category', 'estimated_months', 'job_tags', 'node_count']
 
-    def get_node_count(self, obj):
-        return obj.nodes.count()
-
 
 class RoadmapDetailSerializer(serializers.ModelSerializer):
     nodes = SkillNodeSerializer(many=True, read_only=True)
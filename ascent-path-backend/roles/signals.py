@@ -0,0 +1,32 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core import cache as shared_cache
+from . import counters
+from .models import Roadmap, SkillNode, RoleAnalysis
+
+
+# Connected before the cache invalidation so a re-read after it sees the new counts
+@receiver(post_save, sender=SkillNode)
+def count_new_node(sender, instance, created, **kwargs):
+    if created:
+        counters.refresh_roadmap(instance.roadmap_id)
+
+
+@receiver(post_delete, sender=SkillNode)
+def count_deleted_node(sender, instance, **kwargs):
+    counters.refresh_roadmap(instance.roadmap_id)
+
+
+@receiver(post_save, sender=Roadmap)
+@receiver(post_delete, sender=Roadmap)
+@receiver(post_save, sender=SkillNode)
+@receiver(post_delete, sender=SkillNode)
+def invalidate_roadmaps(sender, **kwargs):
+    shared_cache.roadmaps.invalidate()
+
+
+@receiver(post_save, sender=RoleAnalysis)
+@receiver(post_delete, sender=RoleAnalysis)
+def invalidate_analysis(sender, instance, **kwargs):
+    shared_cache.analysis.delete(instance.role_slug)
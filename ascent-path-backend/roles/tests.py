@@ -1,3 +1,416 @@
-from django.test import TestCase
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from profile_app.models import UserSkill
+
+from . import counters, feeds, jd_extract
+from . import search as role_search
+from . import trends as role_trends
+from . import views
+from .management.commands.seed_roadmaps import ROADMAPS_DATA
+from .models import (
+    Enrollment, GeneratedResume, JobFeed, JobFeedSnapshot, Roadmap, RoleAnalysis, RoleJobCount, SkillNode, UserNodeProgress,
+)
+
+# Shared-cache namespaces per test instead of in var/cache
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def create_seed_roadmaps():
+    for data in ROADMAPS_DATA:
+        Roadmap.objects.create(**{k: v for k, v in data.items() if k != 'nodes'})
+
+
+class RoleSearchTests(TestCase):
+    # Titles that share generic words ("developer", "data") with a seeded roadmap but are other roles
+    NEAR_MISSES = [
+        'java developer', 'c++ developer', 'data scientist', 'data engineer', 'game developer',
+        'qa engineer', 'security engineer', 'blockchain developer', 'embedded engineer', 'product manager',
+    ]
+    MATCHES = {
+        'frontend engineer': 'frontend-developer',
+        'front end developer': 'frontend-developer',
+        'backend developer': 'backend-developer',
+        'python backend engineer': 'backend-developer',
+        'fullstack engineer': 'fullstack-developer',
+        'devops engineer': 'devops-engineer',
+        'ml engineer': 'ml-engineer',
+        'machine learning engineer': 'ml-engineer',
+        'senior data analyst': 'data-analyst',
+        'ios developer': 'mobile-developer',
+        'react native developer': 'mobile-developer',
+        'aws cloud architect': 'cloud-architect',
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        create_seed_roadmaps()
+
+    def setUp(self):
+        self.index = role_search.RoleSearchIndex.build(
+            Roadmap.objects.order_by('id').values_list('slug', 'title', 'category', 'job_tags', 'description'), None,
+        )
+
+    def best(self, query):
+        hits = self.index.search(query, 1)
+        return hits[0] if hits and hits[0][1] >= role_search.MATCH_THRESHOLD else None
+
+    def test_near_miss_titles_fall_through_to_generation(self):
+        for query in self.NEAR_MISSES:
+            with self.subTest(query=query):
+                self.assertIsNone(self.best(query))
+
+    def test_known_roles_match_their_roadmap(self):
+        for query, slug in self.MATCHES.items():
+            with self.subTest(query=query):
+                hit = self.best(query)
+                self.assertIsNotNone(hit)
+                self.assertEqual(hit[0], slug)
+
+    def test_abbreviated_title_matches_a_react_roadmap(self):
+        hit = self.best('sr react dev')
+        self.assertIsNotNone(hit)
+        self.assertIn(hit[0], {'frontend-developer', 'fullstack-developer', 'mobile-developer'})
+
+    def test_editing_a_roadmap_changes_the_index_version(self):
+        before = role_search._version()
+        roadmap = Roadmap.objects.get(slug='data-analyst')
+        roadmap.job_tags = roadmap.job_tags + ['tableau']
+        roadmap.save()
+        self.assertNotEqual(role_search._version(), before)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TrendsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        today = timezone.localdate()
+        rows = []
+        for i in range(14):
+            day = today - timedelta(days=13 - i)
+            rows.append(RoleJobCount(role_slug='growing', date=day, job_count=10 + i))
+            rows.append(RoleJobCount(role_slug='rare', date=day, job_count=1))
+            if i != 10:  # a missed recording carries the previous day forward
+                rows.append(RoleJobCount(role_slug='flat', date=day, job_count=10))
+        RoleJobCount.objects.bulk_create(rows)
+
+    def test_growth_compares_rolling_windows(self):
+        stats = role_trends._compute(7)
+        # days 7-13 average 20, days 0-6 average 13
+        self.assertAlmostEqual(stats['growing']['growth'], round(7 / 13, 4))
+        self.assertEqual(stats['growing']['rolling_avg'], 20.0)
+        self.assertEqual(stats['flat']['growth'], 0.0)
+        self.assertEqual(stats['flat']['job_count'], 10)
+
+    def test_demand_level_ranks_current_counts_across_roles(self):
+        stats = role_trends._compute(7)
+        self.assertEqual(stats['growing']['demand_level'], 'high')
+        self.assertEqual(stats['flat']['demand_level'], 'medium')
+        self.assertEqual(stats['rare']['demand_level'], 'low')
+
+    def test_analysis_refresh_keeps_measured_demand(self):
+        Roadmap.objects.create(slug='growing', title='Growing Role', description='', job_tags=['go'])
+        gemini = {'demand_level': 'low', 'must_have_skills': ['Go']}
+        with mock.patch.object(views, 'fetch_remoteok_jobs', return_value=[{'tags': ['go']}]), \
+                mock.patch.object(views, 'gemini_analyze_role', return_value=gemini):
+            data = views._build_role_data('growing')
+
+        analysis = RoleAnalysis.objects.get(role_slug='growing')
+        self.assertEqual(analysis.demand_level, 'high')
+        self.assertEqual(analysis.live_job_count, 23)
+        self.assertEqual(data['demand_level'], 'high')
+
+    def test_unrecorded_role_falls_back_to_gemini_estimate(self):
+        gemini = {'demand_level': 'low'}
+        with mock.patch.object(views, 'fetch_remoteok_jobs', return_value=[{'tags': ['x']}] * 3), \
+                mock.patch.object(views, 'gemini_analyze_role', return_value=gemini):
+            views._build_role_data('never-recorded')
+
+        analysis = RoleAnalysis.objects.get(role_slug='never-recorded')
+        self.assertEqual(analysis.demand_level, 'low')
+        self.assertEqual(analysis.live_job_count, 3)
+
+
+class JDExtractTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        create_seed_roadmaps()  # role titles; skills come from the taxonomy seed migration
+
+    def extract(self, text):
+        return jd_extract.JDMatcher().extract(text)
+
+    def test_known_role_with_enough_skills_is_answered_locally(self):
+        result = self.extract(
+            "Senior Backend Developer (Remote)\n"
+            "You will build and run our APIs.\n"
+            "Requirements:\n"
+            "- Strong Python and Django\n"
+            "- PostgreSQL, Docker\n"
+            "Nice to have:\n"
+            "- Kubernetes or AWS experience\n"
+        )
+        self.assertEqual(result['role_title'], 'Backend Developer')
+        self.assertEqual(result['must_have_skills'], ['Python', 'Django', 'PostgreSQL', 'Docker'])
+        self.assertEqual(result['nice_to_have_skills'], ['Kubernetes', 'AWS'])
+
+    def test_aliases_resolve_to_canonical_skills(self):
+        result = self.extract("Frontend Developer\nWe use ReactJS, TypeScript and Tailwind CSS daily.")
+        self.assertEqual(result['must_have_skills'], ['React', 'TypeScript', 'Tailwind'])
+
+    def test_ambiguous_words_only_count_as_proper_nouns(self):
+        lower = self.extract("Backend Developer\nWe go fast with Python, Docker and SQL.")
+        self.assertNotIn('Go', lower['must_have_skills'])
+        upper = self.extract("Backend Developer\nWe use Go, Python, Docker and SQL.")
+        self.assertIn('Go', upper['must_have_skills'])
+
+    def test_low_confidence_goes_to_gemini(self):
+        self.assertIsNone(self.extract("Backend Developer\nPython and Docker."))  # too few skills
+        self.assertIsNone(self.extract("Platform wizard\nPython, Django, Docker, AWS, SQL."))  # unknown role
+
+    def test_role_named_only_late_in_the_text_is_ignored(self):
+        filler = 'We care about quality and people. ' * 15
+        text = f"Platform wizard\n{filler}\nYou will partner with the Data Analyst team.\nPython, Docker, SQL, AWS."
+        self.assertIsNone(self.extract(text))
+
+    def test_matcher_version_is_checked_at_most_once_per_refresh_interval(self):
+        with mock.patch.object(jd_extract, '_matcher', None):
+            jd_extract.get_matcher()
+            with self.assertNumQueries(0):
+                jd_extract.extract("Backend Developer\nPython, Django, Docker and SQL.")
+            with mock.patch.object(jd_extract.time, 'monotonic', return_value=time.monotonic() + 3600):
+                with self.assertNumQueries(4):  # taxonomy and role versions; nothing changed, no rebuild
+                    jd_extract.get_matcher()
+
+
+def _response(status=200, jobs=None, etag=''):
+    res = mock.Mock(status_code=status, headers={'ETag': etag} if etag else {})
+    res.json.return_value = jobs or []
+    res.raise_for_status.side_effect = None if status < 400 else Exception(f'HTTP {status}')
+    return res
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class FeedRefreshTests(TestCase):
+    JOBS = [{'id': 1, 'tags': ['python', 'django']}, {'id': 2, 'tags': ['react']}]
+
+    def setUp(self):
+        cache.clear()
+        feeds._memo.update(snapshot_id=None, jobs=[], checked=0.0)
+        submit = mock.patch.object(feeds.background, 'submit')
+        self.submit = submit.start()
+        self.addCleanup(submit.stop)
+
+    def refresh(self, response, force=True):
+        with mock.patch.object(feeds.requests, 'get', return_value=response) as get:
+            return feeds.refresh(force=force), get
+
+    def test_lease_is_exclusive_until_it_expires(self):
+        feed = feeds._feed()
+        self.assertTrue(feeds._acquire_lease(feed))
+        self.assertFalse(feeds._acquire_lease(feed))
+        self.assertEqual(self.refresh(_response(jobs=self.JOBS))[0], 'locked')
+
+        JobFeed.objects.filter(pk=feed.pk).update(lease_until=timezone.now() - timedelta(seconds=1))
+        self.assertTrue(feeds._acquire_lease(feed))
+
+    def test_refresh_releases_the_lease(self):
+        self.refresh(_response(jobs=self.JOBS))
+        self.assertIsNone(JobFeed.objects.get(source=feeds.SOURCE).lease_until)
+
+    def test_etag_is_sent_back_and_304_keeps_the_snapshot(self):
+        status, _ = self.refresh(_response(jobs=self.JOBS, etag='"v1"'))
+        self.assertEqual(status, 'updated')
+        self.assertEqual(JobFeed.objects.get(source=feeds.SOURCE).etag, '"v1"')
+
+        status, get = self.refresh(_response(status=304))
+        self.assertEqual(status, 'not_modified')
+        self.assertEqual(get.call_args.kwargs['headers']['If-None-Match'], '"v1"')
+        self.assertEqual(JobFeedSnapshot.objects.count(), 1)
+
+    def test_fresh_feed_is_not_refetched(self):
+        self.refresh(_response(jobs=self.JOBS))
+        status, get = self.refresh(_response(jobs=self.JOBS), force=False)
+        self.assertEqual(status, 'fresh')
+        get.assert_not_called()
+
+    def test_outage_serves_the_last_snapshot(self):
+        self.refresh(_response(jobs=self.JOBS))
+        with self.assertLogs('roles.feeds', 'WARNING'):
+            status, _ = self.refresh(_response(status=503))
+        self.assertEqual(status, 'error')
+        self.assertIn('503', JobFeed.objects.get(source=feeds.SOURCE).last_error)
+        self.assertEqual(feeds.get_jobs(), self.JOBS)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ProgressCounterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='ada', email='ada@example.com', password='pw')
+        self.roadmap = Roadmap.objects.create(slug='backend', title='Backend', description='')
+        self.nodes = {
+            name: SkillNode.objects.create(roadmap=self.roadmap, title=name, description='', difficulty=difficulty, order=i)
+            for i, (name, difficulty) in enumerate([
+                ('b1', 'beginner'), ('b2', 'beginner'), ('i1', 'intermediate'), ('i2', 'intermediate'), ('a1', 'advanced'),
+            ])
+        }
+        self.enrollment = Enrollment.objects.create(user=self.user, roadmap=self.roadmap)
+
+    def complete(self, *names):
+        return counters.complete_nodes(self.user.id, {self.nodes[n].id: timezone.now() for n in names})
+
+    def test_node_signals_keep_roadmap_node_count(self):
+        self.roadmap.refresh_from_db()
+        self.assertEqual(self.roadmap.node_count, 5)
+
+    def test_completing_twice_is_idempotent(self):
+        first = counters.complete_node(self.user.id, self.nodes['b1'])
+        second = counters.complete_node(self.user.id, self.nodes['b1'])
+        self.assertTrue(first['newly_completed'])
+        self.assertFalse(second['newly_completed'])
+
+        self.enrollment.refresh_from_db()
+        self.assertEqual(self.enrollment.completed_count, 1)
+        self.assertEqual(self.enrollment.progress_pct, 20)
+
+    def test_batch_with_already_completed_nodes_only_counts_new_ones(self):
+        self.complete('b1')
+        result = self.complete('b1', 'i1')
+        self.assertEqual(result['completed'], [self.nodes['i1'].id])
+        self.assertEqual(result['enrollments'][0]['completed_count'], 2)
+
+    def test_promotion_happens_when_the_last_node_of_a_tier_completes(self):
+        self.assertIsNone(self.complete('b1')['enrollments'][0]['promoted_to'])
+        summary = self.complete('b2')['enrollments'][0]
+        self.assertEqual(summary['promoted_to'], 'intermediate')
+        self.assertEqual(summary['current_tier'], 'intermediate')
+
+    def test_promotion_skips_tiers_completed_out_of_order(self):
+        self.complete('i1', 'i2')
+        summary = self.complete('b1', 'b2')['enrollments'][0]
+        self.assertEqual(summary['current_tier'], 'advanced')
+
+    def test_finishing_every_node_completes_the_enrollment(self):
+        summary = self.complete(*self.nodes)['enrollments'][0]
+        self.assertTrue(summary['roadmap_completed'])
+        self.assertEqual(summary['progress_pct'], 100)
+
+    def test_unknown_nodes_are_reported_not_created(self):
+        result = counters.complete_nodes(self.user.id, {999999: timezone.now()})
+        self.assertEqual(result['unknown_nodes'], [999999])
+        self.assertEqual(result['enrollments'], [])
+
+    def test_drift_finds_and_refresh_repairs_corrupted_counters(self):
+        self.complete('b1', 'b2')
+        self.assertEqual([list(qs) for qs in counters.drift()], [[], []])
+
+        Roadmap.objects.filter(pk=self.roadmap.pk).update(node_count=9)
+        Enrollment.objects.filter(pk=self.enrollment.pk).update(completed_count=4, progress_pct=80)
+        roadmaps, enrollments = counters.drift()
+        self.assertEqual([(r.pk, r.actual) for r in roadmaps], [(self.roadmap.pk, 5)])
+        self.assertEqual([(e.pk, e.actual) for e in enrollments], [(self.enrollment.pk, 2)])
+
+        counters.refresh_all()
+        self.assertEqual([list(qs) for qs in counters.drift()], [[], []])
+        self.enrollment.refresh_from_db()
+        self.assertEqual((self.enrollment.completed_count, self.enrollment.progress_pct), (2, 40))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ResumeAnalyticsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='ada', email='ada@example.com', password='pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def domains(self, **scores):
+        for name, score in scores.items():
+            UserSkill.objects.create(user=self.user, skill_name=name, verified_score=score, is_verified=True)
+        res = self.client.get('/api/roles/resume-analytics/')
+        self.assertEqual(res.status_code, 200)
+        return {d['name']: d['pct'] for d in res.data['domains']}
+
+    def test_separator_spellings_group_like_the_taxonomy(self):
+        stats = self.domains(**{'Scikit-learn': 80, 'React-Native': 60, 'react_native': 40, ' Machine   Learning ': 90})
+        self.assertEqual(stats, {'Data & AI': 85, 'Mobile': 50})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class MergeDuplicateRoadmapsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='ada', email='ada@example.com', password='pw')
+        self.primary = Roadmap.objects.create(slug='react-developer', title='Senior React Developer', description='')
+        self.dup = Roadmap.objects.create(slug='sr-react-dev', title='Sr React Dev', description='', is_custom=True)
+        self.kept = Enrollment.objects.create(user=self.user, roadmap=self.primary)
+        self.merged = Enrollment.objects.create(user=self.user, roadmap=self.dup, current_tier='intermediate')
+
+    def merge(self):
+        call_command('merge_duplicate_roadmaps', stdout=StringIO())
+
+    def test_user_enrolled_in_both_keeps_one_enrollment_with_the_higher_tier(self):
+        self.merge()
+        self.assertFalse(Roadmap.objects.filter(pk=self.dup.pk).exists())
+        enrollment = Enrollment.objects.get(user=self.user)
+        self.assertEqual((enrollment.pk, enrollment.current_tier), (self.kept.pk, 'intermediate'))
+
+    def test_generated_resume_moves_to_the_kept_enrollment(self):
+        resume = GeneratedResume.objects.create(enrollment=self.merged, tier_at_generation='intermediate')
+        self.merge()
+        resume.refresh_from_db()
+        self.assertEqual(resume.enrollment_id, self.kept.pk)
+
+    def test_newer_resume_wins_and_keeps_the_shared_link(self):
+        old = GeneratedResume.objects.create(
+            enrollment=self.kept, tier_at_generation='beginner', is_public=True, share_slug='ada-react',
+        )
+        GeneratedResume.objects.filter(pk=old.pk).update(last_generated_at=timezone.now() - timedelta(days=1))
+        new = GeneratedResume.objects.create(enrollment=self.merged, tier_at_generation='intermediate')
+        self.merge()
+
+        resume = GeneratedResume.objects.get(enrollment=self.kept)
+        self.assertEqual(resume.pk, new.pk)
+        self.assertEqual((resume.share_slug, resume.is_public), ('ada-react', True))
+
+    def test_kept_resume_survives_when_it_is_newer(self):
+        kept = GeneratedResume.objects.create(enrollment=self.kept, tier_at_generation='beginner')
+        GeneratedResume.objects.filter(enrollment=self.kept).update(last_generated_at=timezone.now() + timedelta(days=1))
+        GeneratedResume.objects.create(enrollment=self.merged, tier_at_generation='intermediate')
+        self.merge()
+        self.assertEqual(list(GeneratedResume.objects.values_list('pk', flat=True)), [kept.pk])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SyncProgressTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username='ada', email='ada@example.com', password='pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        roadmap = Roadmap.objects.create(slug='backend', title='Backend', description='')
+        self.node = SkillNode.objects.create(roadmap=roadmap, title='b1', description='', difficulty='beginner', order=0)
+        Enrollment.objects.create(user=self.user, roadmap=roadmap)
+
+    def sync(self, *events):
+        return self.client.post('/api/roles/progress/sync/', {'events': list(events)}, format='json')
+
+    def test_completions_are_applied(self):
+        res = self.sync({'node_id': self.node.id}, {'node_id': self.node.id, 'type': 'complete'})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual((res.data['completed'], res.data['duplicates']), ([self.node.id], 1))
+
+    def test_other_event_types_are_rejected_not_dropped(self):
+        res = self.sync({'node_id': self.node.id}, {'node_id': self.node.id, 'type': 'progress', 'pct': 40})
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(res.data['unsupported_types'], ['progress'])
+        self.assertFalse(UserNodeProgress.objects.exists())
@@ -0,0 +1,121 @@
+"""
+Job-count time series per role.
+
+record_daily_counts() turns the current feed snapshot into one RoleJobCount row per roadmap
+per day (an upsert, so later refreshes on the same day overwrite it). summary() loads the
+recent history into a date × role frame in one query and derives everything vectorized:
+rolling average, growth against the previous window, and a demand level from where each
+role's current count sits among all roles.
+"""
+import logging
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+from django.utils import timezone
+
+from core import cache as shared_cache
+from taxonomy import index as skill_index
+
+from . import feeds
+
+logger = logging.getLogger(__name__)
+
+WINDOW_DAYS = 7
+HISTORY_DAYS = 90
+# Cut-offs across roles: bottom third of current counts is 'low', top third 'high'
+DEMAND_PERCENTILES = (33, 66)
+
+
+def role_counts(jobs: list) -> dict:
+    """{roadmap slug: matching job count} — each job's tags are canonicalized once."""
+    from .models import Roadmap
+    job_keys = [set(skill_index.canonical_keys(j.get('tags', []))) for j in jobs]
+    counts = {}
+    for slug, tags in Roadmap.objects.values_list('slug', 'job_tags'):
+        wanted = set(skill_index.canonical_keys(tags or []))
+        counts[slug] = sum(1 for keys in job_keys if wanted & keys) if wanted else 0
+    return counts
+
+
+def record_daily_counts(jobs=None, day=None) -> int:
+    """Upsert today's per-role counts and push the new demand levels onto RoleAnalysis."""
+    from .models import RoleJobCount
+    jobs = feeds.get_jobs() if jobs is None else jobs
+    if not jobs:
+        return 0
+    day = day or timezone.localdate()
+    counts = role_counts(jobs)
+    RoleJobCount.objects.bulk_create(
+        [RoleJobCount(role_slug=slug, date=day, job_count=count) for slug, count in counts.items()],
+        update_conflicts=True,
+        unique_fields=['role_slug', 'date'],
+        update_fields=['job_count'],
+    )
+    shared_cache.trends.invalidate()
+    apply_to_analyses(summary())
+    return len(counts)
+
+
+def _frame(days=HISTORY_DAYS):
+    """date × role_slug counts; days without a recording carry the previous count forward."""
+    from .models import RoleJobCount
+    since = timezone.localdate() - timedelta(days=days)
+    rows = list(RoleJobCount.objects.filter(date__gte=since).values_list('date', 'role_slug', 'job_count'))
+    if not rows:
+        return None
+    frame = pd.DataFrame.from_records(rows, columns=['date', 'role', 'count'])
+    frame = frame.pivot(index='date', columns='role', values='count').astype(float)
+    frame.index = pd.DatetimeIndex(frame.index)
+    return frame.asfreq('D').ffill()
+
+
+def _compute(window: int) -> dict:
+    frame = _frame()
+    if frame is None:
+        return {}
+
+    rolling = frame.rolling(window, min_periods=1).mean()
+    current = rolling.iloc[-1]
+    previous = rolling.shift(window).iloc[-1]
+    growth = (current - previous) / previous.where(previous > 0)
+
+    latest = frame.iloc[-1].fillna(0)
+    low, high = np.percentile(latest.to_numpy(), DEMAND_PERCENTILES)
+    spread = high > low
+    demand = np.select([spread & (latest >= high), spread & (latest <= low)], ['high', 'low'], default='medium')
+
+    return {
+        role: {
+            'job_count': int(count),
+            'rolling_avg': round(float(avg), 2),
+            'growth': None if np.isnan(g) else round(float(g), 4),
+            'demand_level': str(level),
+        }
+        for role, count, avg, g, level in zip(frame.columns, latest, current, growth, demand)
+    }
+
+
+def summary(window=WINDOW_DAYS) -> dict:
+    """{slug: {job_count, rolling_avg, growth, demand_level}}, shared-cached until the next recording."""
+    return shared_cache.trends.get_or_set(f'summary:{window}', lambda: _compute(window))
+
+
+def series(slug: str, days=HISTORY_DAYS) -> list:
+    from .models import RoleJobCount
+    since = timezone.localdate() - timedelta(days=days)
+    return [
+        {'date': d.isoformat(), 'job_count': c}
+        for d, c in RoleJobCount.objects.filter(role_slug=slug, date__gte=since).values_list('date', 'job_count')
+    ]
+
+
+def apply_to_analyses(stats: dict):
+    """Replace the Gemini-guessed demand_level and point-in-time count with the measured ones."""
+    from .models import RoleAnalysis
+    analyses = list(RoleAnalysis.objects.filter(role_slug__in=list(stats)))
+    for analysis in analyses:
+        analysis.demand_level = stats[analysis.role_slug]['demand_level']
+        analysis.live_job_count = stats[analysis.role_slug]['job_count']
+    RoleAnalysis.objects.bulk_update(analyses, ['demand_level', 'live_job_count'])
+    shared_cache.analysis.invalidate()  # bulk_update skips the invalidating signals
@@ -3,12 +3,16 @@ from . import views
 
 urlpatterns = [
     path('trending/', views.trending_roles, name='trending-roles'),
+    path('trends/', views.role_trends_view, name='role-trends'),
+    path('trends/<slug:slug>/', views.role_trends_view, name='role-trend-detail'),
     path('search/', views.search_roles, name='search-roles'),
+    path('best-fit/', views.best_fit_roles, name='best-fit-roles'),
     path('analyze-jd/', views.analyze_jd, name='analyze-jd'),
     path('enroll/', views.enroll_role, name='enroll-role'),
     path('roadmaps/', views.all_roadmaps, name='all-roadmaps'),
     path('roadmaps/<slug:slug>/', views.roadmap_detail, name='roadmap-detail'),
     path('complete-node/', views.complete_node, name='complete-node'),
+    path('progress/sync/', views.sync_progress, name='sync-progress'),
     path('mentor/', views.mentor_chat, name='mentor-chat'),
     path('generate-resume/', views.generate_resume_view, name='generate-resume'),
     path('resume-profile/', views.resume_profile_view, name='resume-profile'),
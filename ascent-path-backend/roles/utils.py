@@ -1,12 +1,5 @@
 import os
 from django.conf import settings
-from reportlab.lib.pagesizes import LETTER
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.lib.units import inch
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
 class ResumeEngine:
     """
@@ -15,6 +8,14 @@ class ResumeEngine:
     
     @staticmethod
     def generate_resume(enrollment):
+        # ReportLab is imported on the first resume, not when roles.views loads
+        from reportlab.lib.pagesizes import LETTER
+        from reportlab.lib import colors
+        from reportlab.lib.units import inch
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT
+
         user = enrollment.user
         roadmap = enrollment.roadmap
         tier = enrollment.current_tier
@@ -1,14 +1,12 @@
 import json
-import requests
+from django.db import transaction
 from django.utils import timezone
 from django.utils.text import slugify
-from django.core.cache import cache
 from datetime import timedelta
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
-from decouple import config
 
 from django.http import FileResponse
 from django.conf import settings
@@ -16,38 +14,34 @@ import os
 from .models import Roadmap, SkillNode, RoleAnalysis, Enrollment, GeneratedResume, UserNodeProgress, ResumeProfile
 from .serializers import RoadmapListSerializer, RoadmapDetailSerializer, RoleAnalysisSerializer, ResumeProfileSerializer
 from .utils import ResumeEngine
+from . import search as role_search
+from . import canonical
+from . import jd_extract
+from . import feeds
+from . import counters
 from core.ai_utils import get_gemini_model
+from core import admission
+from core import cache as shared_cache
+from core.instrumentation import budget
+from taxonomy import index as skill_index
 
 
-REMOTEOK_URL = 'https://remoteok.com/api'
-REMOTEOK_HEADERS = {'User-Agent': 'AscentPath/1.0 (career learning platform)'}
-
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 def fetch_remoteok_jobs():
-    """Fetch all remote jobs from RemoteOK. Cached for 1 hour."""
-    cached = cache.get('remoteok_jobs')
-    if cached:
-        return cached
-    try:
-        res = requests.get(REMOTEOK_URL, headers=REMOTEOK_HEADERS, timeout=10)
-        jobs = res.json()
-        jobs = [j for j in jobs if isinstance(j, dict) and 'tags' in j]
-        cache.set('remoteok_jobs', jobs, 3600)  # 1hr cache
-        return jobs
-    except Exception:
-        return []
+    """All remote jobs from the last good RemoteOK snapshot (refreshed in the background)."""
+    return feeds.get_jobs()
+
+
+def jobs_matching_tags(tags: list, jobs: list) -> list:
+    """Jobs whose tags match any of the given tags (aliases resolved via the skill taxonomy)."""
+    wanted = set(skill_index.canonical_keys(tags))
+    return [j for j in jobs if wanted.intersection(skill_index.canonical_keys(j.get('tags', [])))]
 
 
 def get_job_count_for_tags(tags: list, jobs: list) -> int:
     """Count jobs that match any of the given tags."""
-    tags_lower = {t.lower() for t in tags}
-    count = 0
-    for job in jobs:
-        job_tags = {t.lower() for t in job.get('tags', [])}
-        if tags_lower & job_tags:  # intersection
-            count += 1
-    return count
+    return len(jobs_matching_tags(tags, jobs))
 
 
 def gemini_analyze_role(role_title: str, sample_jobs: list) -> dict:
@@ -81,6 +75,8 @@ Return ONLY valid JSON (no markdown):
             if text.startswith('json'):
                 text = text[4:]
         return json.loads(text.strip())
+    except admission.Saturated:
+        raise  # don't persist the placeholder analysis just because the queue was full
     except Exception as e:
         return {
             'must_have_skills': [],
@@ -92,21 +88,56 @@ Return ONLY valid JSON (no markdown):
         }
 
 
+def gemini_extract_jd(jd_text: str) -> dict:
+    """Use Gemini to extract role title + skills from a job description."""
+    model = get_gemini_model('gemini-flash-latest')
+    extract_prompt = f"""Extract the job role and key skills from this job description.
+Return ONLY valid JSON:
+{{
+  "role_title": "Senior React Developer",
+  "must_have_skills": ["React", "TypeScript", "Node.js"],
+  "nice_to_have_skills": ["GraphQL", "AWS"],
+  "industry_description": "2 sentence summary of this role"
+}}
+
+Job Description:
+{jd_text[:3000]}"""
+
+    resp = model.generate_content(extract_prompt)
+    text = resp.text.strip()
+    if '```' in text:
+        text = text.split('```')[1]
+        if text.startswith('json'):
+            text = text[4:]
+    return json.loads(text.strip())
+
+
 # ── Views ──────────────────────────────────────────────────────────────────────
 
+@budget(queries=5)
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def trending_roles(request):
     """
-    Returns trending roles sorted by live job count from RemoteOK.
-    Cached per role for 24 hours.
+    Returns trending roles sorted by job-count growth (then live job count), read from the
+    daily RoleJobCount series rather than the raw feed. Shared-cached until the next
+    recording; roadmap changes invalidate it (roles.signals).
     """
-    jobs = fetch_remoteok_jobs()
+    from . import trends as role_trends  # pandas/numpy load on first use, not at worker boot
+    key = f'trending:{shared_cache.trends.generation()}'
+    cached = shared_cache.roadmaps.get(key)
+    if cached is not None:
+        return Response(cached)
+
+    stats = role_trends.summary()
+    if not stats:
+        role_trends.record_daily_counts()  # first run — no history recorded yet
+        stats = role_trends.summary()
     roadmaps = Roadmap.objects.all()
     result = []
 
     for rm in roadmaps:
-        count = get_job_count_for_tags(rm.job_tags, jobs)
+        trend = stats.get(rm.slug, {})
         result.append({
             'slug': rm.slug,
             'title': rm.title,
@@ -115,54 +146,118 @@ def trending_roles(request):
             'color': rm.color,
             'category': rm.category,
             'estimated_months': rm.estimated_months,
-            'live_job_count': count,
-            'node_count': rm.nodes.count(),
+            'live_job_count': trend.get('job_count', 0),
+            'growth': trend.get('growth'),
+            'demand_level': trend.get('demand_level', 'medium'),
+            'node_count': rm.node_count,
         })
 
-    # Sort by live job count (most openings first)
-    result.sort(key=lambda x: x['live_job_count'], reverse=True)
+    # Fastest-growing first; roles without enough history fall back to raw openings
+    result.sort(
+        key=lambda x: (x['growth'] if x['growth'] is not None else float('-inf'), x['live_job_count']),
+        reverse=True,
+    )
+    shared_cache.roadmaps.set(key, result)
     return Response(result)
 
 
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def role_trends_view(request, slug=None):
+    """
+    Growth + demand for every role, or for one role with its daily series.
+    ?window= rolling window in days (default 7), ?days= series length (default 90).
+    """
+    from . import trends as role_trends
+    try:
+        window = max(1, min(int(request.query_params.get('window', role_trends.WINDOW_DAYS)), 30))
+        days = max(1, min(int(request.query_params.get('days', role_trends.HISTORY_DAYS)), 365))
+    except ValueError:
+        return Response({'error': 'window and days must be integers.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    stats = role_trends.summary(window)
+    if slug is None:
+        return Response({'window': window, 'roles': stats})
+    if slug not in stats:
+        return Response({'error': 'No job-count history for this role.'}, status=status.HTTP_404_NOT_FOUND)
+    return Response({'slug': slug, 'window': window, **stats[slug], 'series': role_trends.series(slug, days)})
+
+
+ANALYSIS_FIELDS = (
+    'role_title', 'live_job_count', 'salary_range', 'demand_level', 'industry_description',
+    'must_have_skills', 'nice_to_have_skills', 'interview_topics', 'cached_at',
+)
+
+
+def _roadmap_nodes(roadmap):
+    """User-independent node list of a roadmap, shared-cached until the roadmap changes."""
+    def build():
+        return [
+            {
+                'id': node.id,
+                'title': node.title,
+                'description': node.description,
+                'resource_url': node.resource_url,
+                'video_url': node.video_url,
+                'project_description': node.project_description,
+                'difficulty': node.difficulty,
+                'order': node.order,
+                'estimated_days': node.estimated_days,
+                'is_required': node.is_required,
+                'assessment_type': node.assessment_type,
+                'assessment_data': node.assessment_data,
+            }
+            for node in roadmap.nodes.all().order_by('order')
+        ]
+    return shared_cache.roadmaps.get_or_set(f'nodes:{roadmap.slug}', build)
+
+
 def _build_role_data(slug, request_user=None):
     """Shared helper — fetch/generate role analysis and return a plain dict."""
     roadmap = Roadmap.objects.filter(slug=slug).first()
-    jobs = fetch_remoteok_jobs()
 
-    analysis = RoleAnalysis.objects.filter(role_slug=slug).first()
+    analysis = shared_cache.analysis.get(slug)
+    if analysis is None:
+        row = RoleAnalysis.objects.filter(role_slug=slug).values(*ANALYSIS_FIELDS).first()
+        if row is not None:
+            analysis = row
+            shared_cache.analysis.set(slug, analysis)
     needs_refresh = (
         analysis is None or
-        (timezone.now() - analysis.cached_at) > timedelta(hours=24)
+        (timezone.now() - analysis['cached_at']) > timedelta(hours=24)
     )
 
     if needs_refresh:
+        jobs = fetch_remoteok_jobs()
         if roadmap:
-            matching_jobs = [
-                j for j in jobs
-                if set(t.lower() for t in j.get('tags', [])) & set(t.lower() for t in roadmap.job_tags)
-            ]
+            matching_jobs = jobs_matching_tags(roadmap.job_tags, jobs)
             role_title = roadmap.title
         else:
             role_title = slug.replace('-', ' ').title()
             matching_jobs = jobs[:20]
 
-        job_count = len(matching_jobs)
         ai_data = gemini_analyze_role(role_title, matching_jobs[:15])
 
-        analysis, _ = RoleAnalysis.objects.update_or_create(
+        # Demand and job count come from the recorded series (roles.trends) when the role has
+        # one; Gemini's guess and the point-in-time count are only for roles never recorded
+        from . import trends as role_trends
+        measured = role_trends.summary().get(slug)
+        row, _ = RoleAnalysis.objects.update_or_create(
             role_slug=slug,
             defaults={
                 'role_title': role_title,
-                'live_job_count': job_count,
+                'live_job_count': measured['job_count'] if measured else len(matching_jobs),
                 'must_have_skills': ai_data.get('must_have_skills', []),
                 'nice_to_have_skills': ai_data.get('nice_to_have_skills', []),
                 'interview_topics': ai_data.get('interview_topics', []),
                 'salary_range': ai_data.get('salary_range', ''),
-                'demand_level': ai_data.get('demand_level', 'medium'),
+                'demand_level': measured['demand_level'] if measured else ai_data.get('demand_level', 'medium'),
                 'industry_description': ai_data.get('industry_description', ''),
                 'roadmap': roadmap,
             }
         )
+        analysis = {field: getattr(row, field) for field in ANALYSIS_FIELDS}
+        shared_cache.analysis.set(slug, analysis)
 
     # Get user progress if logged in
     completed_nodes = set()
@@ -175,32 +270,23 @@ def _build_role_data(slug, request_user=None):
 
     nodes = []
     if roadmap:
-        for node in roadmap.nodes.all().order_by('order'):
-            nodes.append({
-                'id': node.id,
-                'title': node.title,
-                'description': node.description,
-                'resource_url': node.resource_url,
-                'video_url': node.video_url,
-                'project_description': node.project_description,
-                'difficulty': node.difficulty,
-                'order': node.order,
-                'estimated_days': node.estimated_days,
-                'is_required': node.is_required,
-                'assessment_type': node.assessment_type,
-                'assessment_data': node.assessment_data,
-                'is_completed': node.id in completed_nodes
-            })
+        nodes = [dict(node, is_completed=node['id'] in completed_nodes) for node in _roadmap_nodes(roadmap)]
 
     skill_gap = []
     if request_user and request_user.is_authenticated:
         from profile_app.models import UserSkill
-        user_skills = set(
-            s.skill_name.lower()
-            for s in UserSkill.objects.filter(user=request_user, is_verified=True)
+        # Resolve both sides through the taxonomy so "React.js" matches "React",
+        # and a verified child skill (Django) also covers its parent (Python).
+        user_skill_names = list(
+            UserSkill.objects.filter(user=request_user, is_verified=True).values_list('skill_name', flat=True)
         )
-        for skill in analysis.must_have_skills:
-            skill_gap.append({'skill': skill, 'have_it': skill.lower() in user_skills})
+        user_ids = skill_index.resolve(user_skill_names)
+        have_ids = skill_index.with_ancestors(user_ids)
+        have_text = {skill_index.normalize(n) for n, sid in zip(user_skill_names, user_ids) if sid is None}
+        required = analysis['must_have_skills']
+        for skill, skill_id in zip(required, skill_index.resolve(required)):
+            have_it = skill_id in have_ids if skill_id else skill_index.normalize(skill) in have_text
+            skill_gap.append({'skill': skill, 'have_it': have_it})
 
     is_enrolled = False
     if request_user and request_user.is_authenticated:
@@ -209,16 +295,16 @@ def _build_role_data(slug, request_user=None):
 
     return {
         'slug': slug,
-        'title': analysis.role_title,
+        'title': analysis['role_title'],
         'icon': roadmap.icon if roadmap else '💼',
         'description': roadmap.description if roadmap else '',
-        'industry_description': analysis.industry_description,
-        'live_job_count': analysis.live_job_count,
-        'salary_range': analysis.salary_range,
-        'demand_level': analysis.demand_level,
-        'must_have_skills': analysis.must_have_skills,
-        'nice_to_have_skills': analysis.nice_to_have_skills,
-        'interview_topics': analysis.interview_topics,
+        'industry_description': analysis['industry_description'],
+        'live_job_count': analysis['live_job_count'],
+        'salary_range': analysis['salary_range'],
+        'demand_level': analysis['demand_level'],
+        'must_have_skills': analysis['must_have_skills'],
+        'nice_to_have_skills': analysis['nice_to_have_skills'],
+        'interview_topics': analysis['interview_topics'],
         'nodes': nodes,
         'estimated_months': roadmap.estimated_months if roadmap else None,
         'skill_gap': skill_gap,
@@ -233,12 +319,30 @@ def role_detail(request, slug):
     try:
         data = _build_role_data(slug, request.user)
         return Response(data)
+    except admission.Saturated:
+        raise
     except Exception as e:
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def best_fit_roles(request):
+    """Ranks every analysed role against the user's verified skills, with the gaps for each."""
+    from profile_app.models import UserSkill
+    try:
+        limit = max(1, min(int(request.GET.get('limit', 10)), 50))
+    except ValueError:
+        limit = 10
+
+    skills = UserSkill.objects.filter(user=request.user, is_verified=True).values_list('skill_name', flat=True)
+    from . import matching  # numpy/scipy load on first use, not at worker boot
+    return Response(matching.best_fit_roles(skills, limit))
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
+@admission.admit('role_search')
 def search_roles(request):
     """Search for any role. Returns from DB or generates via Gemini.
     Now correctly returns data using _build_role_data() shared helper."""
@@ -248,24 +352,31 @@ def search_roles(request):
 
     slug = slugify(q)
 
-    # Check if we have it in DB (exact slug or title match)
-    roadmap = (
-        Roadmap.objects.filter(slug__icontains=slug).first() or
-        Roadmap.objects.filter(title__icontains=q).first()
-    )
-    if roadmap:
-        slug = roadmap.slug
+    # Exact slug hit first, then the local TF-IDF index, then role-title canonicalization.
+    # Only a genuinely new role falls through to Gemini generation in _build_role_data,
+    # and it does so under its normalized slug so later spellings reuse it.
+    matches = []
+    if not Roadmap.objects.filter(slug=slug).exists():
+        matches = role_search.search(q, 5)
+        if matches and matches[0][1] >= role_search.MATCH_THRESHOLD:
+            slug = matches[0][0]
+        else:
+            slug = canonical.canonical_slug(q)
 
     # _build_role_data handles both DB and dynamic Gemini generation
     try:
         data = _build_role_data(slug, request.user)
+        data['matches'] = [{'slug': s, 'score': round(score, 3)} for s, score in matches]
         return Response(data)
+    except admission.Saturated:
+        raise
     except Exception as e:
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@admission.admit('enroll')
 def enroll_role(request):
     """Enroll a user in a roadmap. Generates nodes via Gemini if they don't exist."""
     slug = request.data.get('slug', '').strip()
@@ -274,11 +385,12 @@ def enroll_role(request):
 
     user = request.user
     
-    # 1. Look for existing roadmap
+    # 1. Look for existing roadmap (near-duplicate titles resolve to the same one)
+    slug = canonical.canonical_slug(slug)
     roadmap = Roadmap.objects.filter(slug=slug).first()
     
     # Handle custom generation if it doesn't exist or has no nodes
-    if not roadmap or roadmap.nodes.count() == 0:
+    if not roadmap or roadmap.node_count == 0:
         # Get analysis to know what skills to focus on
         analysis = RoleAnalysis.objects.filter(role_slug=slug).first()
         role_title = analysis.role_title if analysis else slug.replace('-', ' ').title()
@@ -341,76 +453,69 @@ If it is a Data Science role, focus on data analysis, statistical modeling, and
             
             nodes_data = json.loads(text.strip()).get('nodes', [])
             
-            # Save nodes to DB
-            for idx, n in enumerate(nodes_data):
-                SkillNode.objects.create(
-                    roadmap=roadmap,
-                    title=n.get('title'),
-                    description=n.get('description'),
-                    difficulty=n.get('difficulty', 'beginner'),
-                    estimated_days=n.get('estimated_days', 3),
-                    resource_url=n.get('resource_url', ''),
-                    video_url=n.get('video_url', ''),
-                    paid_course_url=n.get('paid_course_url', ''),
-                    project_description=n.get('project_description', ''),
-                    assessment_type=n.get('assessment_type', 'coding'),
-                    assessment_data=n.get('assessment_data', {}),
-                    order=idx
-                )
+            # Save nodes to DB — one insert, and node_count moves in the same transaction
+            with transaction.atomic():
+                SkillNode.objects.bulk_create([
+                    SkillNode(
+                        roadmap=roadmap,
+                        title=n.get('title'),
+                        description=n.get('description'),
+                        difficulty=n.get('difficulty', 'beginner'),
+                        estimated_days=n.get('estimated_days', 3),
+                        resource_url=n.get('resource_url', ''),
+                        video_url=n.get('video_url', ''),
+                        paid_course_url=n.get('paid_course_url', ''),
+                        project_description=n.get('project_description', ''),
+                        assessment_type=n.get('assessment_type', 'coding'),
+                        assessment_data=n.get('assessment_data', {}),
+                        order=idx
+                    )
+                    for idx, n in enumerate(nodes_data)
+                ])
+                counters.refresh_roadmap(roadmap.id)
+            shared_cache.roadmaps.invalidate()  # bulk_create skips the invalidating signals
+        except admission.Saturated:
+            raise
         except Exception as e:
             return Response({'error': f'Failed to generate roadmap: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     # 2. Create Enrollment
     from .models import Enrollment
     enrollment, created = Enrollment.objects.get_or_create(user=user, roadmap=roadmap)
-    
+    if created:
+        # Progress may predate the enrollment (re-enrolling, merged roadmaps)
+        counters.refresh_enrollments(Enrollment.objects.filter(pk=enrollment.pk))
+    roadmap.refresh_from_db(fields=['node_count'])
+
     return Response({
         'message': 'Successfully enrolled',
         'slug': roadmap.slug,
         'title': roadmap.title,
-        'node_count': roadmap.nodes.count()
+        'node_count': roadmap.node_count
     })
 
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@admission.admit('analyze_jd')
 def analyze_jd(request):
     """
-    Takes a job description text, uses Gemini to extract role + skills,
-    then returns full role analysis. Powers the JD Upload tab.
+    Takes a job description text, extracts role + skills (local pre-pass, Gemini
+    only for ambiguous JDs), then returns full role analysis. Powers the JD Upload tab.
     """
     jd_text = request.data.get('jd_text', '').strip()
     if not jd_text:
         return Response({'error': 'jd_text is required'}, status=status.HTTP_400_BAD_REQUEST)
 
     try:
-        import google.generativeai as genai
-        genai.configure(api_key=config('GEMINI_API_KEY'))
-        model = genai.GenerativeModel('gemini-flash-latest')
-
-        # Step 1: Extract role title + skills from JD
-        extract_prompt = f"""Extract the job role and key skills from this job description.
-Return ONLY valid JSON:
-{{
-  "role_title": "Senior React Developer",
-  "must_have_skills": ["React", "TypeScript", "Node.js"],
-  "nice_to_have_skills": ["GraphQL", "AWS"],
-  "industry_description": "2 sentence summary of this role"
-}}
-
-Job Description:
-{jd_text[:3000]}"""
-
-        resp = model.generate_content(extract_prompt)
-        text = resp.text.strip()
-        if '```' in text:
-            text = text.split('```')[1]
-            if text.startswith('json'):
-                text = text[4:]
-        extracted = json.loads(text.strip())
+        # Step 1: Extract role title + skills from JD — locally when the JD names a known
+        # role and enough taxonomy skills, otherwise via Gemini
+        extracted = jd_extract.extract(jd_text)
+        if extracted is None:
+            extracted = gemini_extract_jd(jd_text)
 
         role_title = extracted.get('role_title', 'Software Engineer')
-        slug = slugify(role_title)
+        slug = canonical.canonical_slug(role_title)
 
         # Step 2: Build full role data (Gemini analysis + roadmap)
         data = _build_role_data(slug, getattr(request, 'user', None))
@@ -422,6 +527,8 @@ Job Description:
         data['from_jd'] = True
 
         return Response(data)
+    except admission.Saturated:
+        raise
     except Exception as e:
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -430,8 +537,10 @@ Job Description:
 @permission_classes([AllowAny])
 def all_roadmaps(request):
     """Returns all roadmaps with node count (for Explore page)."""
-    roadmaps = Roadmap.objects.prefetch_related('nodes').all()
-    return Response(RoadmapListSerializer(roadmaps, many=True).data)
+    data = shared_cache.roadmaps.get_or_set(
+        'all', lambda: RoadmapListSerializer(Roadmap.objects.all(), many=True).data
+    )
+    return Response(data)
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -444,6 +553,7 @@ def roadmap_detail(request, slug):
     
     serializer = RoadmapDetailSerializer(roadmap, context={'request': request})
     return Response(serializer.data)
+@budget(queries=16)
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def complete_node(request):
@@ -454,19 +564,13 @@ def complete_node(request):
 
     try:
         node = SkillNode.objects.get(id=node_id)
-        progress, created = UserNodeProgress.objects.get_or_create(
-            user=request.user,
-            node=node,
-            defaults={'is_completed': True}
-        )
-        if not created:
-            progress.is_completed = True
-            progress.save()
+        result = counters.complete_node(request.user.id, node)
 
         return Response({
-            'message': 'Node marked as completed',
+            'message': 'Node marked as completed' if result['newly_completed'] else 'Node already completed',
             'node_id': node_id,
-            'is_completed': True
+            'is_completed': True,
+            **result,
         })
     except SkillNode.DoesNotExist:
         return Response({'error': 'Node not found'}, status=status.HTTP_404_NOT_FOUND)
@@ -474,8 +578,72 @@ def complete_node(request):
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+MAX_SYNC_EVENTS = 500
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+def sync_progress(request):
+    """
+    Apply queued node completions in one request/transaction (offline replay).
+    Body: { "events": [{"node_id": 12, "completed_at": "2026-03-01T10:00:00Z"}, ...] }
+    Duplicate node ids keep the earliest timestamp; missing/future timestamps become now.
+    Only "complete" events exist: UserNodeProgress has no partial-progress field, so any other
+    event type rejects the whole batch with a 400 naming it rather than being dropped.
+    """
+    from django.utils.dateparse import parse_datetime
+
+    events = request.data.get('events')
+    if not isinstance(events, list) or not events:
+        return Response({'error': 'events must be a non-empty list'}, status=status.HTTP_400_BAD_REQUEST)
+    if len(events) > MAX_SYNC_EVENTS:
+        return Response({'error': f'At most {MAX_SYNC_EVENTS} events per sync'}, status=status.HTTP_400_BAD_REQUEST)
+
+    unsupported = sorted({
+        str(event.get('type')) for event in events
+        if isinstance(event, dict) and event.get('type', 'complete') != 'complete'
+    })
+    if unsupported:
+        return Response({
+            'error': 'Only "complete" events can be synced',
+            'unsupported_types': unsupported,
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    now = timezone.now()
+    completions, ignored = {}, 0
+    for event in events:
+        if not isinstance(event, dict):
+            ignored += 1
+            continue
+        try:
+            node_id = int(event.get('node_id'))
+        except (TypeError, ValueError):
+            ignored += 1
+            continue
+        try:
+            ts = parse_datetime(str(event.get('completed_at') or '')) or now
+        except ValueError:
+            ts = now
+        if timezone.is_naive(ts):
+            ts = timezone.make_aware(ts)
+        ts = min(ts, now)
+        completions[node_id] = min(ts, completions.get(node_id, ts))
+
+    if not completions:
+        return Response({'error': 'No valid completion events'}, status=status.HTTP_400_BAD_REQUEST)
+
+    result = counters.complete_nodes(request.user.id, completions)
+    return Response({
+        'received': len(events),
+        'ignored': ignored,
+        'duplicates': len(events) - ignored - len(completions),
+        **result,
+    })
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+@admission.admit('mentor')
 def mentor_chat(request):
     """AI Mentor (ConvoAI) that provides hints but NOT complete code."""
     node_id = request.data.get('node_id')
@@ -512,7 +680,7 @@ def mentor_chat(request):
         "{user_message}"
         """
         
-        model = genai.GenerativeModel('gemini-1.5-flash-latest')
+        model = get_gemini_model('gemini-1.5-flash-latest')
         resp = model.generate_content(system_prompt)
         
         return Response({
@@ -522,6 +690,8 @@ def mentor_chat(request):
         
     except SkillNode.DoesNotExist:
         return Response({'error': 'Node not found'}, status=404)
+    except admission.Saturated:
+        raise
     except Exception as e:
         return Response({'error': str(e)}, status=500)
 
@@ -582,6 +752,7 @@ def generate_resume_view(request):
         return Response({'error': str(e)}, status=500)
 
 
+@budget(queries=10)
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def dashboard_stats(request):
@@ -595,13 +766,10 @@ def dashboard_stats(request):
     enrollments = Enrollment.objects.filter(user=user).select_related('roadmap')
     total_progress = 0
     roadmap_sub = "No active roadmap"
-    if enrollments.exists():
-        first = enrollments.first()
+    first = enrollments.first()
+    if first:
         roadmap_sub = first.roadmap.title
-        total_nodes = first.roadmap.nodes.count()
-        completed_nodes = UserNodeProgress.objects.filter(user=user, node__roadmap=first.roadmap, is_completed=True).count()
-        if total_nodes > 0:
-            total_progress = round((completed_nodes / total_nodes) * 100)
+        total_progress = first.progress_pct
 
     # 2. Skills Verified
     verified_count = UserSkill.objects.filter(user=user, is_verified=True).count()
@@ -637,14 +805,12 @@ def dashboard_stats(request):
     # 7. My Roadmaps (Active enrollments)
     my_roadmaps = []
     for en in enrollments:
-        total = en.roadmap.nodes.count()
-        done = UserNodeProgress.objects.filter(user=user, node__roadmap=en.roadmap, is_completed=True).count()
         my_roadmaps.append({
             'title': en.roadmap.title,
             'slug': en.roadmap.slug,
             'icon': en.roadmap.icon,
             'color': en.roadmap.color,
-            'progress': round((done / total) * 100) if total > 0 else 0,
+            'progress': en.progress_pct,
             'tier': en.current_tier
         })
 
@@ -666,21 +832,25 @@ def dashboard_stats(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def resume_analytics(request):
-    """Aggregates all real-time evidence for the 3D Resume page."""
+    """
+    Aggregates all real-time evidence for the 3D Resume page.
+    Counts, domain averages and top-N lists are computed in SQL, so cost stays flat
+    no matter how many skills or projects a user has.
+    """
     user = request.user
     from profile_app.models import UserSkill, UserProject
-    from .models import ResumeProfile, Enrollment, UserNodeProgress
-    
+    from .models import ResumeProfile, Enrollment
+    from django.db.models import Avg, Case, CharField, Value, When
+    from django.db.models.functions import Coalesce
+
     # 1. Profile Data
     profile = ResumeProfile.objects.filter(user=user).first()
-    
-    # 2. Verified Skills
-    skills = UserSkill.objects.filter(user=user).order_by('-verified_score')
+
+    # 2. Verified Skills — top 6 only
+    skills = UserSkill.objects.filter(user=user)
     verified_count = skills.filter(is_verified=True).count()
     skills_list = []
-    domains = {}
-    
-    for s in skills:
+    for s in skills.order_by('-verified_score')[:6]:
         level = s.self_reported_level.title() if s.is_verified else "Learning"
         skills_list.append({
             'name': s.skill_name,
@@ -691,25 +861,26 @@ def resume_analytics(request):
                 "Proctored assessment passed" if s.is_verified else "Learning basics"
             ]
         })
-        
-        # Simple domain grouping
-        domain = "General"
-        if s.skill_name.lower() in ['html', 'css', 'react', 'tailwind', 'vue']: domain = "Frontend"
-        elif s.skill_name.lower() in ['python', 'django', 'node', 'express', 'sql']: domain = "Backend"
-        elif s.skill_name.lower() in ['javascript', 'typescript']: domain = "Languages"
-        
-        if domain not in domains: domains[domain] = []
-        domains[domain].append(s.verified_score or 0)
 
-    domain_stats = []
-    for d, scores in domains.items():
-        avg = sum(scores) / len(scores) if scores else 0
-        domain_stats.append({'name': d, 'pct': round(avg)})
+    # Domain grouping driven by the skill taxonomy table (cached in-process)
+    domain_case = Case(
+        *[When(name_key__in=names, then=Value(domain)) for domain, names in skill_index.domain_groups().items()],
+        default=Value(skill_index.DEFAULT_DOMAIN),
+        output_field=CharField(),
+    )
+    domain_rows = (
+        skills.annotate(name_key=skill_index.normalized_sql('skill_name'))
+        .annotate(domain=domain_case)
+        .order_by()
+        .values('domain')
+        .annotate(avg=Avg(Coalesce('verified_score', 0.0)))
+        .order_by('-avg', 'domain')
+    )
+    domain_stats = [{'name': d['domain'], 'pct': round(d['avg'] or 0)} for d in domain_rows]
 
-    # 3. Verified Projects
-    projects = UserProject.objects.filter(user=user).order_by('-added_at')
+    # 3. Verified Projects — top 4 only
     projects_list = []
-    for p in projects:
+    for p in UserProject.objects.filter(user=user).order_by('-added_at')[:4]:
         projects_list.append({
             'title': p.title,
             'tags': [t.strip() for t in p.tech_stack.split(',')],
@@ -718,13 +889,16 @@ def resume_analytics(request):
             'github_url': p.github_url
         })
 
-    # 4. Job Readiness Calculation
-    enrollment = Enrollment.objects.filter(user=user).first()
+    # 4. Job Readiness Calculation — denormalized counters, no recount
+    enrollment = (
+        Enrollment.objects.filter(user=user).order_by('pk')
+        .values('completed_count', 'roadmap__node_count').first()
+    )
     readiness = 0
-    if enrollment:
-        nodes = enrollment.roadmap.nodes.count()
-        done = UserNodeProgress.objects.filter(user=user, node__roadmap=enrollment.roadmap, is_completed=True).count()
-        readiness = round(((done / nodes) * 0.4 + (verified_count / 10) * 0.6) * 100) if nodes > 0 else 0
+    if enrollment and enrollment['roadmap__node_count'] > 0:
+        nodes = enrollment['roadmap__node_count']
+        done = enrollment['completed_count']
+        readiness = round(((done / nodes) * 0.4 + (verified_count / 10) * 0.6) * 100)
 
     first_name = user.first_name.strip() if user.first_name else ""
     last_name = user.last_name.strip() if user.last_name else ""
@@ -741,6 +915,6 @@ def resume_analytics(request):
             'summary': profile.professional_summary if profile else "Building a verified, evidence-backed career path."
         },
         'domains': domain_stats,
-        'skills': skills_list[:6], # Top 6
-        'projects': projects_list[:4] # Top 4
+        'skills': skills_list, # Top 6
+        'projects': projects_list # Top 4
     })
@@ -0,0 +1,20 @@
+from django.contrib import admin
+from .models import Skill, SkillAlias
+
+
+class SkillAliasInline(admin.TabularInline):
+    model = SkillAlias
+    extra = 1
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ['display_name', 'name', 'domain', 'parent']
+    list_filter = ['domain']
+    search_fields = ['name', 'display_name', 'aliases__alias']
+    inlines = [SkillAliasInline]
+
+@admin.register(SkillAlias)
+class SkillAliasAdmin(admin.ModelAdmin):
+    list_display = ['alias', 'skill']
+    search_fields = ['alias', 'skill__name']
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class TaxonomyConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'taxonomy'
+    verbose_name = 'Skill Taxonomy'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,195 @@
+"""
+Process-wide skill taxonomy index.
+
+Canonical skills, aliases and parent links are loaded from the DB once per process into
+plain dicts, so every lookup is a hash hit. Writes in this process drop the index via
+signals; other workers pick changes up through a cheap version check that runs at most
+once every TAXONOMY_REFRESH_SECONDS.
+"""
+import re
+import threading
+import time
+
+from decouple import config
+
+DEFAULT_DOMAIN = 'General'
+REFRESH_SECONDS = config('TAXONOMY_REFRESH_SECONDS', default=60, cast=int)
+
+_SEPARATORS = re.compile(r'[\s_\-]+')
+
+
+def normalize(name: str) -> str:
+    """'  React-JS ' → 'react js'. Used for every key stored in or looked up from the index."""
+    return _SEPARATORS.sub(' ', (name or '').strip().lower()).strip()
+
+
+class SkillIndex:
+    """Immutable snapshot of the taxonomy; swapped wholesale on refresh."""
+
+    def __init__(self, skills, aliases, version=None):
+        # skills: (id, name, display_name, domain, parent_id) rows, aliases: (alias, skill_id) rows
+        self.version = version
+        self.ids = {}        # normalized name/alias → skill id
+        self.names = {}      # skill id → canonical key
+        self.display = {}    # skill id → display name
+        self.domains = {}    # skill id → domain
+        self.parents = {}    # skill id → parent id
+        self.children = {}   # skill id → [child ids]
+
+        for skill_id, name, display_name, domain, parent_id in skills:
+            key = normalize(name)
+            self.ids[key] = skill_id
+            self.ids.setdefault(normalize(display_name), skill_id)
+            self.names[skill_id] = key
+            self.display[skill_id] = display_name
+            self.domains[skill_id] = domain
+            if parent_id:
+                self.parents[skill_id] = parent_id
+                self.children.setdefault(parent_id, []).append(skill_id)
+        for alias, skill_id in aliases:
+            self.ids.setdefault(normalize(alias), skill_id)
+
+    def resolve(self, names) -> list:
+        ids = self.ids
+        return [ids.get(normalize(n)) for n in names]
+
+    def ancestors(self, skill_id) -> list:
+        chain, seen = [], {skill_id}
+        parent = self.parents.get(skill_id)
+        while parent and parent not in seen:
+            chain.append(parent)
+            seen.add(parent)
+            parent = self.parents.get(parent)
+        return chain
+
+    def descendants(self, skill_id) -> list:
+        out, stack, seen = [], list(self.children.get(skill_id, [])), {skill_id}
+        while stack:
+            child = stack.pop()
+            if child in seen:
+                continue
+            seen.add(child)
+            out.append(child)
+            stack.extend(self.children.get(child, []))
+        return out
+
+    def with_ancestors(self, ids) -> set:
+        """A skill implies its parents: knowing Django counts as knowing Python."""
+        out = set()
+        for skill_id in ids:
+            if skill_id and skill_id not in out:
+                out.add(skill_id)
+                out.update(self.ancestors(skill_id))
+        return out
+
+    def keys_for(self, skill_id) -> list:
+        return [key for key, sid in self.ids.items() if sid == skill_id]
+
+
+_lock = threading.Lock()
+_index = None
+_checked_at = 0.0
+
+
+def _version():
+    from django.db.models import Count, Max
+    from .models import Skill, SkillAlias
+    skills = Skill.objects.aggregate(n=Count('id'), ts=Max('updated_at'))
+    aliases = SkillAlias.objects.aggregate(n=Count('id'), ts=Max('updated_at'))
+    return (skills['n'], skills['ts'], aliases['n'], aliases['ts'])
+
+
+def _load(version):
+    from .models import Skill, SkillAlias
+    return SkillIndex(
+        Skill.objects.values_list('id', 'name', 'display_name', 'domain', 'parent_id'),
+        SkillAlias.objects.values_list('alias', 'skill_id'),
+        version,
+    )
+
+
+def get_index() -> SkillIndex:
+    global _index, _checked_at
+    index = _index
+    if index is not None and time.monotonic() - _checked_at < REFRESH_SECONDS:
+        return index
+    with _lock:
+        if _index is None or time.monotonic() - _checked_at >= REFRESH_SECONDS:
+            version = _version()
+            if _index is None or _index.version != version:
+                _index = _load(version)
+            _checked_at = time.monotonic()
+        return _index
+
+
+def invalidate():
+    global _index
+    with _lock:
+        _index = None
+
+
+# ── Lookups ───────────────────────────────────────────────────────────────────
+
+def resolve(names) -> list:
+    """Bulk lookup: free-text skill names → canonical skill ids (None when unknown), in input order."""
+    return get_index().resolve(names)
+
+
+def resolve_one(name: str):
+    return get_index().ids.get(normalize(name))
+
+
+def canonical_keys(names) -> list:
+    """Comparable keys for free-text skills: the canonical key when known, the normalized text otherwise."""
+    index = get_index()
+    return [index.names[sid] if sid else normalize(n) for n, sid in zip(names, index.resolve(names))]
+
+
+def canonical_name(name: str) -> str:
+    """Display name of the canonical skill, or the input (stripped) when it isn't in the taxonomy."""
+    index = get_index()
+    skill_id = index.ids.get(normalize(name))
+    return index.display[skill_id] if skill_id else name.strip()
+
+
+def variants(name: str) -> list:
+    """Every normalized spelling that resolves to the same skill as name."""
+    index = get_index()
+    skill_id = index.ids.get(normalize(name))
+    return index.keys_for(skill_id) if skill_id else [normalize(name)]
+
+
+def with_ancestors(ids) -> set:
+    return get_index().with_ancestors(ids)
+
+
+def domain_of(skill_name: str) -> str:
+    index = get_index()
+    skill_id = index.ids.get(normalize(skill_name))
+    return index.domains.get(skill_id, DEFAULT_DOMAIN)
+
+
+def domain_map() -> dict:
+    """Every known normalized name/alias → domain."""
+    index = get_index()
+    return {key: index.domains[sid] for key, sid in index.ids.items()}
+
+
+def normalized_sql(field: str):
+    """normalize() as a query expression, so names stored in the DB compare against index keys."""
+    from django.db.models import Value
+    from django.db.models.functions import Lower, Replace, Trim
+    expr = Lower(field)
+    for sep in ('-', '_', '\t', '\n'):
+        expr = Replace(expr, Value(sep), Value(' '))
+    for _ in range(3):  # halves every run of spaces; a run of up to 8 collapses to one
+        expr = Replace(expr, Value('  '), Value(' '))
+    return Trim(expr)
+
+
+def domain_groups() -> dict:
+    """Domain → list of normalized names (for building SQL CASE expressions)."""
+    groups = {}
+    for key, domain in domain_map().items():
+        groups.setdefault(domain, []).append(key)
+    return groups
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('display_name', models.CharField(max_length=100)),
+                ('domain', models.CharField(default='General', max_length=50)),
+            ],
+            options={
+                'ordering': ['domain', 'name'],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+# Mirrors the domain lists that used to be hard-coded in roles.views.resume_analytics
+SEED = {
+    'Frontend': ['HTML', 'CSS', 'React', 'Tailwind', 'Vue'],
+    'Backend': ['Python', 'Django', 'Node', 'Express', 'SQL'],
+    'Languages': ['JavaScript', 'TypeScript'],
+}
+
+
+def seed(apps, schema_editor):
+    Skill = apps.get_model('taxonomy', 'Skill')
+    for domain, names in SEED.items():
+        for display_name in names:
+            Skill.objects.update_or_create(
+                name=display_name.lower(),
+                defaults={'display_name': display_name, 'domain': domain},
+            )
+
+
+def unseed(apps, schema_editor):
+    Skill = apps.get_model('taxonomy', 'Skill')
+    Skill.objects.filter(name__in=[n.lower() for names in SEED.values() for n in names]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed, unseed),
+    ]
@@ -0,0 +1,36 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0002_seed_skill_domains'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skill',
+            name='parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='children', to='taxonomy.skill'),
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.CreateModel(
+            name='SkillAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=100, unique=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='taxonomy.skill')),
+            ],
+            options={
+                'ordering': ['alias'],
+            },
+        ),
+    ]
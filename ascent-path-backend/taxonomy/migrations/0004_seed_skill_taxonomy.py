@@ -0,0 +1,98 @@
+from django.db import migrations
+
+# (display_name, domain, parent display_name or None, [aliases])
+# Aliases are matched against free text (JD extraction, resume skills), so nothing that is
+# also an ordinary word or a common abbreviation of something else ('api', 'rest', 'py', 'ts').
+TAXONOMY = [
+    ('HTML', 'Frontend', None, ['html5']),
+    ('CSS', 'Frontend', None, ['css3']),
+    ('React', 'Frontend', None, ['react.js', 'reactjs']),
+    ('Next.js', 'Frontend', 'React', ['nextjs']),
+    ('Vue', 'Frontend', None, ['vue.js', 'vuejs']),
+    ('Angular', 'Frontend', None, ['angular.js', 'angularjs']),
+    ('Tailwind', 'Frontend', 'CSS', ['tailwind css', 'tailwindcss']),
+    ('JavaScript', 'Languages', None, ['js', 'ecmascript', 'es6']),
+    ('TypeScript', 'Languages', 'JavaScript', []),
+    ('Java', 'Languages', None, []),
+    ('Go', 'Languages', None, ['golang']),
+    ('Rust', 'Languages', None, []),
+    ('C++', 'Languages', None, ['cpp']),
+    ('C#', 'Languages', None, ['csharp', 'c sharp']),
+    ('Python', 'Backend', None, ['python3']),
+    ('Django', 'Backend', 'Python', ['django rest framework', 'drf']),
+    ('Flask', 'Backend', 'Python', []),
+    ('FastAPI', 'Backend', 'Python', []),
+    ('Node', 'Backend', 'JavaScript', ['node.js', 'nodejs']),
+    ('Express', 'Backend', 'Node', ['express.js', 'expressjs']),
+    ('SQL', 'Backend', None, []),
+    ('PostgreSQL', 'Backend', 'SQL', ['postgres', 'psql']),
+    ('MySQL', 'Backend', 'SQL', []),
+    ('MongoDB', 'Backend', None, ['mongo']),
+    ('GraphQL', 'Backend', None, []),
+    ('REST API', 'Backend', None, ['restful api', 'rest apis']),
+    ('Docker', 'DevOps', None, []),
+    ('Kubernetes', 'DevOps', None, ['k8s']),
+    ('AWS', 'DevOps', None, ['amazon web services']),
+    ('Azure', 'DevOps', None, ['microsoft azure']),
+    ('CI/CD', 'DevOps', None, ['cicd', 'ci cd']),
+    ('Git', 'DevOps', None, ['version control']),
+    ('Linux', 'DevOps', None, []),
+    ('Machine Learning', 'Data & AI', None, ['ml']),
+    ('Deep Learning', 'Data & AI', 'Machine Learning', []),
+    ('Data Science', 'Data & AI', None, []),
+    ('Pandas', 'Data & AI', 'Python', []),
+    ('NumPy', 'Data & AI', 'Python', []),
+    ('Scikit-learn', 'Data & AI', 'Machine Learning', ['sklearn']),
+    ('TensorFlow', 'Data & AI', 'Deep Learning', []),
+    ('PyTorch', 'Data & AI', 'Deep Learning', []),
+    ('React Native', 'Mobile', 'React', []),
+    ('Swift', 'Mobile', None, []),
+    ('Kotlin', 'Mobile', None, []),
+    ('Flutter', 'Mobile', None, []),
+    ('iOS', 'Mobile', None, []),
+    ('Android', 'Mobile', None, []),
+]
+
+
+def _key(name):
+    # Keep in sync with taxonomy.index.normalize (migrations can't import app code safely)
+    return ' '.join(name.strip().lower().replace('_', ' ').replace('-', ' ').split())
+
+
+def seed(apps, schema_editor):
+    Skill = apps.get_model('taxonomy', 'Skill')
+    SkillAlias = apps.get_model('taxonomy', 'SkillAlias')
+
+    by_name = {}
+    for display_name, domain, _, _ in TAXONOMY:
+        skill, _ = Skill.objects.update_or_create(
+            name=_key(display_name),
+            defaults={'display_name': display_name, 'domain': domain},
+        )
+        by_name[display_name] = skill
+
+    for display_name, _, parent, aliases in TAXONOMY:
+        skill = by_name[display_name]
+        if parent:
+            skill.parent = by_name[parent]
+            skill.save(update_fields=['parent'])
+        for alias in aliases:
+            SkillAlias.objects.update_or_create(alias=_key(alias), defaults={'skill': skill})
+
+
+def unseed(apps, schema_editor):
+    # Only the aliases seeded here — ones admins added since stay
+    SkillAlias = apps.get_model('taxonomy', 'SkillAlias')
+    seeded = {_key(alias) for *_, aliases in TAXONOMY for alias in aliases}
+    SkillAlias.objects.filter(alias__in=seeded).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0003_skill_parent_skill_updated_at_skillalias'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed, unseed),
+    ]
@@ -0,0 +1,29 @@
+from django.db import models
+
+
+class Skill(models.Model):
+    """A canonical skill, the resume domain it rolls up into and its place in the skill tree"""
+    name = models.CharField(max_length=100, unique=True)  # normalized lookup key: 'react'
+    display_name = models.CharField(max_length=100)       # 'React'
+    domain = models.CharField(max_length=50, default='General')  # Frontend/Backend/Languages/...
+    parent = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, blank=True, related_name='children')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['domain', 'name']
+
+    def __str__(self):
+        return f"{self.display_name} ({self.domain})"
+
+
+class SkillAlias(models.Model):
+    """Another spelling of a canonical skill ('react.js', 'reactjs' → React)"""
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='aliases')
+    alias = models.CharField(max_length=100, unique=True)  # normalized
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['alias']
+
+    def __str__(self):
+        return f"{self.alias} → {self.skill.display_name}"
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import index
+from .models import Skill, SkillAlias
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=SkillAlias)
+@receiver(post_delete, sender=SkillAlias)
+def invalidate_skill_index(sender, **kwargs):
+    index.invalidate()